@@ -1,4 +1,3 @@
-import random
 from pathlib import Path
 
 import pygame
@@ -15,14 +14,17 @@ from battle_engine import (
     Round,
     SoundCategory,
     SoundManager,
+    asset_surface,
 )
 
 _ASSETS_DIR = Path(__file__).parent / "assets"
 
 
 class PapyrusBattle(Battle):
-    def __init__(self):
-        super().__init__()
+    preload = {"surfaces": [str(_ASSETS_DIR / "papyrus.png")]}
+
+    def __init__(self, seed=None):
+        super().__init__(seed=seed)
         self.tick = 0
 
     def select_next_round(self):
@@ -82,7 +84,7 @@ class PapyrusBattle(Battle):
 
 class PapyrusEnemy(Enemy):
     def __init__(self):
-        image = pygame.image.load(str(_ASSETS_DIR / "papyrus.png"))
+        image = asset_surface(str(_ASSETS_DIR / "papyrus.png"))
         super().__init__(
             image,
             position=(250, 40),
@@ -92,7 +94,7 @@ class PapyrusEnemy(Enemy):
             gold_reward=50,
         )
         self.acts = [MenuItem("Wave", self.wave)]
-        self.battle = Battle()
+        self.battle = Game().battle
 
     def on_death(self):
         return "[asterisk] Papyrus has been defeated..."
@@ -109,22 +111,32 @@ class PapyrusEnemy(Enemy):
 
 
 class TestBone(BattleObject):
+    sprite_template = None
+
     def __init__(self, position=(0, 0), rotation=0):
-        sprite = pygame.Surface((10, 60))
-        sprite.fill((255, 255, 255))
+        # All bones share one sprite, and with it one collision mask
+        if TestBone.sprite_template is None:
+            TestBone.sprite_template = pygame.Surface((10, 60))
+            TestBone.sprite_template.fill((255, 255, 255))
         damage = 10
-        super().__init__(sprite, position, rotation, damage)
+        super().__init__(TestBone.sprite_template, position, rotation, damage)
 
     def update(self):
-        self.position = [
+        self.position = (
             int(self.position[0] - (150 * (Game().delta_time / 1000))),
             int(self.position[1]),
-        ]
+        )
+        battle_rect = Game().battle.battle_box.get_internal_rect()
+        if self.position[0] + self.sprite.get_width() < battle_rect.left:
+            self.destroy()
         super().update()
 
     def render(self, surface):
         surface.blit(self.sprite, self.position)
 
+    def submit(self, batch):
+        batch.add(self.sprite, self.position)
+
 
 class TestRound(Round):
     def __init__(self, battle):
@@ -134,16 +146,14 @@ class TestRound(Round):
     def round_update(self):
         if self.time - self.last_spawn_time >= 500:
             battle_rect = self.battle.battle_box.get_internal_rect()
-            if random.randint(0, 1) == 0:
-                bone = TestBone((battle_rect.x + battle_rect.width, battle_rect.y))
+            if self.battle.rng.randint(0, 1) == 0:
+                position = (battle_rect.x + battle_rect.width, battle_rect.y)
             else:
-                bone = TestBone(
-                    (
-                        battle_rect.x + battle_rect.width,
-                        battle_rect.y + battle_rect.height / 2,
-                    )
+                position = (
+                    battle_rect.x + battle_rect.width,
+                    battle_rect.y + battle_rect.height / 2,
                 )
-            self.add_object(bone)
+            self.spawn(TestBone, position)
             self.last_spawn_time = self.time
         if self.time >= 7000:
             self.battle.battle_box.set_encounter_text(
@@ -1,51 +1,146 @@
-from battle_engine._assets import asset_font_path, asset_frames, asset_surface
-from battle_engine.battle import (
-    Battle,
-    BattleBox,
-    BattleObject,
-    BattleState,
-    Button,
-    Enemy,
-    EnemyDeathState,
-    GameOverState,
-    GUIElement,
-    HitVisual,
-    Menu,
-    MenuContainer,
-    MenuItem,
-    PlayerObject,
-    PlayerStats,
-    Round,
-    TargetUI,
-    VictoryState,
-)
-from battle_engine.constants import (
-    CONFIRM_BUTTON,
-    DISMISS_BUTTON,
-    HEIGHT,
-    MENU_BUTTON,
-    WIDTH,
-)
-from battle_engine.drawing import draw_gradient
-from battle_engine.fonts import draw_text, draw_text_size, register_font
-from battle_engine.game import Game, GameMode
-from battle_engine.interpolation import Interpolation, InterpolationManager
-from battle_engine.player import Armor, HealingItem, Item, Player, Weapon
-from battle_engine.singleton import Singleton
-from battle_engine.sound import SoundCategory, SoundManager
-from battle_engine.text import ProgressiveText
+"""Undertale-style battle engine built on pygame.
+
+Public names are imported on first access (PEP 562), so importing the package
+for data classes such as ``Player`` does not pull in pygame or the assets.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from battle_engine._assets import (
+        asset_font_path,
+        asset_frames,
+        asset_surface,
+        preload_assets,
+        register_atlas,
+    )
+    from battle_engine.battle import (
+        Battle,
+        BattleBox,
+        BattleObject,
+        BattleState,
+        BulletPool,
+        Button,
+        Enemy,
+        EnemyDeathState,
+        GameOverState,
+        GUIElement,
+        HitVisual,
+        Menu,
+        MenuContainer,
+        MenuItem,
+        PlayerObject,
+        PlayerStats,
+        Round,
+        TargetUI,
+        VictoryState,
+    )
+    from battle_engine.constants import (
+        CONFIRM_BUTTON,
+        DISMISS_BUTTON,
+        HEIGHT,
+        MENU_BUTTON,
+        WIDTH,
+    )
+    from battle_engine.context import EngineContext, current_context
+    from battle_engine.drawing import draw_gradient
+    from battle_engine.fonts import draw_text, draw_text_size, register_font
+    from battle_engine.game import Game, GameMode, InputProvider, PressedKeys
+    from battle_engine.interpolation import (
+        Delay,
+        Interpolation,
+        InterpolationManager,
+        Parallel,
+        Sequence,
+        TweenGroup,
+    )
+    from battle_engine.loading import AssetLoader, LoadingMode
+    from battle_engine.player import Armor, HealingItem, Item, Player, Weapon
+    from battle_engine.profiler import FrameProfiler
+    from battle_engine.singleton import Singleton
+    from battle_engine.sound import SoundCategory, SoundManager
+    from battle_engine.text import ProgressiveText
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "asset_font_path": "_assets",
+    "asset_frames": "_assets",
+    "asset_surface": "_assets",
+    "preload_assets": "_assets",
+    "register_atlas": "_assets",
+    "Battle": "battle",
+    "BattleBox": "battle",
+    "BattleObject": "battle",
+    "BattleState": "battle",
+    "BulletPool": "battle",
+    "Button": "battle",
+    "Enemy": "battle",
+    "EnemyDeathState": "battle",
+    "GameOverState": "battle",
+    "GUIElement": "battle",
+    "HitVisual": "battle",
+    "Menu": "battle",
+    "MenuContainer": "battle",
+    "MenuItem": "battle",
+    "PlayerObject": "battle",
+    "PlayerStats": "battle",
+    "Round": "battle",
+    "TargetUI": "battle",
+    "VictoryState": "battle",
+    "CONFIRM_BUTTON": "constants",
+    "DISMISS_BUTTON": "constants",
+    "HEIGHT": "constants",
+    "MENU_BUTTON": "constants",
+    "WIDTH": "constants",
+    "EngineContext": "context",
+    "current_context": "context",
+    "draw_gradient": "drawing",
+    "draw_text": "fonts",
+    "draw_text_size": "fonts",
+    "register_font": "fonts",
+    "Game": "game",
+    "GameMode": "game",
+    "InputProvider": "game",
+    "PressedKeys": "game",
+    "Delay": "interpolation",
+    "Interpolation": "interpolation",
+    "InterpolationManager": "interpolation",
+    "Parallel": "interpolation",
+    "Sequence": "interpolation",
+    "TweenGroup": "interpolation",
+    "AssetLoader": "loading",
+    "LoadingMode": "loading",
+    "Armor": "player",
+    "HealingItem": "player",
+    "Item": "player",
+    "Player": "player",
+    "Weapon": "player",
+    "FrameProfiler": "profiler",
+    "Singleton": "singleton",
+    "SoundCategory": "sound",
+    "SoundManager": "sound",
+    "ProgressiveText": "text",
+}
 
 __all__ = [
     "Armor",
+    "AssetLoader",
     "Battle",
     "BattleBox",
     "BattleObject",
     "BattleState",
+    "BulletPool",
     "Button",
     "CONFIRM_BUTTON",
     "DISMISS_BUTTON",
+    "Delay",
     "Enemy",
+    "EngineContext",
     "EnemyDeathState",
+    "FrameProfiler",
     "GameOverState",
     "GUIElement",
     "Game",
@@ -53,30 +148,52 @@ __all__ = [
     "HEIGHT",
     "HealingItem",
     "HitVisual",
+    "InputProvider",
     "Interpolation",
     "InterpolationManager",
     "Item",
+    "LoadingMode",
     "MENU_BUTTON",
     "Menu",
     "MenuContainer",
     "MenuItem",
+    "Parallel",
     "Player",
     "PlayerObject",
     "PlayerStats",
+    "PressedKeys",
     "ProgressiveText",
     "Round",
+    "Sequence",
     "Singleton",
     "SoundCategory",
     "SoundManager",
     "TargetUI",
+    "TweenGroup",
     "WIDTH",
     "VictoryState",
     "Weapon",
     "asset_font_path",
     "asset_frames",
     "asset_surface",
+    "current_context",
     "draw_gradient",
     "draw_text",
     "draw_text_size",
+    "preload_assets",
+    "register_atlas",
     "register_font",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
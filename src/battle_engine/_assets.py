@@ -1,32 +1,229 @@
+import threading
+from collections import OrderedDict
 from importlib.resources import files
 from pathlib import Path
 
 import pygame
 
+from .atlas import TextureAtlas
+
+# Declarative list of assets to warm: {"surfaces": [...], "frames": [...]}.
+# Surfaces are asset-relative (or absolute) image paths, frames are prefixes
+# of numbered sequences as accepted by asset_frames().
+AssetManifest = dict[str, list[str]]
+
+ENGINE_MANIFEST: AssetManifest = {
+    "surfaces": [
+        "battle/button/fight0.png",
+        "battle/button/fight1.png",
+        "battle/button/act0.png",
+        "battle/button/act1.png",
+        "battle/button/item0.png",
+        "battle/button/item1.png",
+        "battle/button/mercy0.png",
+        "battle/button/mercy1.png",
+        "battle/hp.png",
+        "battle/karma.png",
+        "battle/soul/soul.png",
+        "battle/soul/break/break.png",
+        "battle/gameover/text.png",
+        "battle/target_ui/target.png",
+        "battle/target_ui/target_aim1.png",
+        "battle/target_ui/target_aim2.png",
+    ],
+    "frames": [
+        "battle/hit/knife",
+        "battle/soul/break/shard_",
+    ],
+}
+
 
 def _asset_path(relative: str) -> Path:
     """Resolve an asset-relative path to a real filesystem path."""
+    if Path(relative).is_absolute():
+        return Path(relative)
     return Path(str(files("battle_engine.assets").joinpath(relative)))
 
 
-def asset_surface(relative: str) -> pygame.Surface:
-    """Load and return a pygame Surface from an asset-relative path."""
+def _pixel_format() -> str:
+    # Surfaces can only be converted once a display mode has been set
+    return "display" if pygame.display.get_surface() is not None else "raw"
+
+
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def decode_surface(relative: str) -> pygame.Surface:
+    """Decode an image file without touching the display; safe off-thread."""
     return pygame.image.load(str(_asset_path(relative)))
 
 
+def _frame_names(prefix: str, extension: str) -> list[str]:
+    names: list[str] = []
+    i = 1
+    while _asset_path(f"{prefix}{i}.{extension}").exists():
+        names.append(f"{prefix}{i}.{extension}")
+        i += 1
+    return names
+
+
+class AssetCache:
+    """Decoded images keyed by path and pixel format, evicted LRU.
+
+    Images are converted to the display format once a display exists, so
+    blitting them needs no per-frame conversion. Names found in a registered
+    atlas are served as subsurfaces of its sheet instead of separate files.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict[tuple[str, str], pygame.Surface] = OrderedDict()
+        self._frames: dict[tuple[str, str, str], list[pygame.Surface]] = {}
+        self._atlases: list[TextureAtlas] = []
+        self._pending_atlases: list[str] = []
+        self._converted_atlases: dict[tuple[int, str], TextureAtlas] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def add_atlas(self, atlas: TextureAtlas) -> None:
+        with self._lock:
+            self._atlases.append(atlas)
+
+    def add_atlas_index(self, relative: str) -> None:
+        """Register an atlas index to be loaded, if it exists, on first use."""
+        with self._lock:
+            self._pending_atlases.append(relative)
+
+    def load_pending_atlases(self) -> None:
+        """Decode atlases registered with add_atlas_index; safe off-thread."""
+        with self._lock:
+            while self._pending_atlases:
+                index_path = _asset_path(self._pending_atlases.pop(0))
+                if index_path.exists():
+                    self._atlases.append(TextureAtlas.load(index_path))
+
+    def in_atlas(self, name: str) -> bool:
+        """Whether a frame or ``prefix.extension`` sequence comes from an atlas."""
+        self.load_pending_atlases()
+        return any(name in atlas or name in atlas.sequences for atlas in self._atlases)
+
+    def _atlas_for(self, name: str, pixel_format: str) -> TextureAtlas | None:
+        self.load_pending_atlases()
+        for atlas in self._atlases:
+            if name in atlas or name in atlas.sequences:
+                if pixel_format == "raw":
+                    return atlas
+                key = (id(atlas), pixel_format)
+                converted = self._converted_atlases.get(key)
+                if converted is None:
+                    converted = atlas.converted()
+                    self._converted_atlases[key] = converted
+                return converted
+        return None
+
+    def surface(self, relative: str) -> pygame.Surface:
+        """Return the shared cached surface; callers must not modify it."""
+        pixel_format = _pixel_format()
+        atlas = self._atlas_for(relative, pixel_format)
+        if atlas is not None:
+            return atlas.get(relative)
+
+        key = (relative, pixel_format)
+        with self._lock:
+            surface = self._surfaces.get(key)
+            if surface is not None:
+                self._surfaces.move_to_end(key)
+                return surface
+        return self.put(relative, decode_surface(relative))
+
+    def put(self, relative: str, decoded: pygame.Surface) -> pygame.Surface:
+        """Cache a surface from decode_surface(), converting it if possible."""
+        pixel_format = _pixel_format()
+        surface = decoded
+        if pixel_format == "display":
+            surface = _to_display_format(decoded)
+        with self._lock:
+            self._surfaces[(relative, pixel_format)] = surface
+            if len(self._surfaces) > self.max_entries:
+                self._surfaces.popitem(last=False)
+        return surface
+
+    def frames(self, prefix: str, extension: str = "png") -> list[pygame.Surface]:
+        """Return the shared frames of a numbered sequence."""
+        pixel_format = _pixel_format()
+        atlas = self._atlas_for(f"{prefix}.{extension}", pixel_format)
+        if atlas is not None:
+            return atlas.sequence(prefix, extension)
+
+        frames = self._frames.get((prefix, extension, pixel_format))
+        if frames is None:
+            names = _frame_names(prefix, extension)
+            frames = self.put_frames(
+                prefix, extension, {name: decode_surface(name) for name in names}
+            )
+        return frames
+
+    def put_frames(
+        self, prefix: str, extension: str, decoded: dict[str, pygame.Surface]
+    ) -> list[pygame.Surface]:
+        """Cache a decoded sequence, given as {name: surface} in frame order."""
+        frames = [self.put(name, surface) for name, surface in decoded.items()]
+        with self._lock:
+            self._frames[(prefix, extension, _pixel_format())] = frames
+        return frames
+
+    def preload(self, manifest: AssetManifest) -> None:
+        for relative in manifest.get("surfaces", ()):
+            self.surface(relative)
+        for prefix in manifest.get("frames", ()):
+            self.frames(prefix)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._surfaces.clear()
+            self._frames.clear()
+            self._converted_atlases.clear()
+
+
+asset_cache = AssetCache()
+asset_cache.add_atlas_index("atlas.json")
+
+
+def asset_surface(relative: str) -> pygame.Surface:
+    """Return a pygame Surface for an asset-relative path.
+
+    The image is decoded once and cached; every call gets its own copy, so
+    the result can be modified freely.
+    """
+    return asset_cache.surface(relative).copy()
+
+
 def asset_font_path(relative: str) -> str:
     """Return the filesystem path (as a string) for a font asset."""
     return str(_asset_path(relative))
 
 
 def asset_frames(prefix: str, extension: str = "png") -> list[pygame.Surface]:
-    """Load numbered frame sequences (e.g. knife1.png, knife2.png)."""
-    frames = []
-    i = 1
-    while True:
-        path = _asset_path(f"{prefix}{i}.{extension}")
-        if not path.exists():
-            break
-        frames.append(pygame.image.load(str(path)))
-        i += 1
-    return frames
+    """Load numbered frame sequences (e.g. knife1.png, knife2.png).
+
+    Frames are cached and shared between callers; copy a frame before
+    modifying it.
+    """
+    return list(asset_cache.frames(prefix, extension))
+
+
+def register_atlas(index_path: str) -> TextureAtlas:
+    """Serve the frames of a built atlas through asset_surface/asset_frames."""
+    atlas = TextureAtlas.load(index_path)
+    asset_cache.add_atlas(atlas)
+    return atlas
+
+
+def preload_assets(manifest: AssetManifest) -> None:
+    """Decode and cache every asset listed in ``manifest`` ahead of use."""
+    asset_cache.preload(manifest)
@@ -0,0 +1,185 @@
+"""Packed texture atlases: one sheet image plus a JSON index of frames.
+
+Build an atlas from a directory of PNGs with::
+
+    python -m battle_engine.atlas SOURCE_DIR OUTPUT_STEM
+
+which writes ``OUTPUT_STEM.png`` and ``OUTPUT_STEM.json``. Frames are named by
+their path relative to ``SOURCE_DIR`` (e.g. ``battle/hit/knife1.png``), and
+numbered files starting at 1 are also listed as sequences keyed by prefix and
+extension (``battle/hit/knife.png`` lists knife1.png, knife2.png, ...).
+Without arguments the engine's own atlas is rebuilt.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+import pygame
+
+ATLAS_VERSION = 1
+
+Frame = tuple[int, int, int, int]
+
+_NUMBERED = re.compile(r"^(?P<prefix>.*?)(?P<index>\d+)\.(?P<extension>\w+)$")
+
+
+def _sequences(names: list[str]) -> dict[str, list[str]]:
+    """Group numbered frames the way asset_frames() walks them: 1, 2, ..."""
+    numbered: dict[tuple[str, str], set[int]] = {}
+    for name in names:
+        match = _NUMBERED.match(name)
+        if match:
+            key = (match["prefix"], match["extension"])
+            numbered.setdefault(key, set()).add(int(match["index"]))
+
+    sequences: dict[str, list[str]] = {}
+    for (prefix, extension), indices in sorted(numbered.items()):
+        frames: list[str] = []
+        i = 1
+        while i in indices:
+            frames.append(f"{prefix}{i}.{extension}")
+            i += 1
+        if frames:
+            sequences[f"{prefix}.{extension}"] = frames
+    return sequences
+
+
+def _dump_index(index: dict) -> str:
+    # One frame rectangle per line keeps rebuilt indexes readable in diffs
+    text = json.dumps(index, indent=1)
+    text = re.sub(
+        r"\[\s+(\d+),\s+(\d+),\s+(\d+),\s+(\d+)\s+\]",
+        lambda match: "[" + ", ".join(match.groups()) + "]",
+        text,
+    )
+    return text + "\n"
+
+
+def _pack(
+    sizes: dict[str, tuple[int, int]], max_width: int, padding: int
+) -> tuple[dict[str, Frame], int, int]:
+    """Shelf-pack frames, tallest first, into rows no wider than max_width."""
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    frames: dict[str, Frame] = {}
+    x = y = shelf_height = used_width = 0
+    for name in order:
+        width, height = sizes[name]
+        if x and x + width > max_width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        frames[name] = (x, y, width, height)
+        used_width = max(used_width, x + width)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return frames, max(used_width, 1), max(y + shelf_height, 1)
+
+
+def build_atlas(
+    source_dir: str | Path,
+    output_stem: str | Path,
+    max_width: int = 1024,
+    padding: int = 1,
+) -> TextureAtlas:
+    """Pack every PNG under ``source_dir`` into an atlas at ``output_stem``."""
+    source_dir = Path(source_dir)
+    output_stem = Path(output_stem)
+    sheet_path = output_stem.with_suffix(".png")
+
+    images: dict[str, pygame.Surface] = {}
+    for path in sorted(source_dir.rglob("*.png")):
+        if path.resolve() == sheet_path.resolve():
+            continue
+        images[path.relative_to(source_dir).as_posix()] = pygame.image.load(str(path))
+
+    sizes = {name: image.get_size() for name, image in images.items()}
+    frames, width, height = _pack(sizes, max_width, padding)
+
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+    sheet.fill((0, 0, 0, 0))
+    for name, image in images.items():
+        region = sheet.subsurface(frames[name])
+        region.blit(image, (0, 0))
+        if image.get_colorkey() is not None:
+            # Keyed pixels become transparent so the sheet needs no colorkey
+            mask = pygame.mask.from_surface(image)
+            mask.to_surface(region, setcolor=None, unsetcolor=(0, 0, 0, 0))
+
+    index = {
+        "version": ATLAS_VERSION,
+        "image": sheet_path.name,
+        "frames": {name: list(frames[name]) for name in sorted(frames)},
+        "sequences": _sequences(sorted(frames)),
+    }
+    sheet_path.parent.mkdir(parents=True, exist_ok=True)
+    pygame.image.save(sheet, str(sheet_path))
+    with open(output_stem.with_suffix(".json"), "w") as f:
+        f.write(_dump_index(index))
+    return TextureAtlas(sheet, index)
+
+
+class TextureAtlas:
+    """A loaded atlas; frames are subsurfaces sharing the sheet's pixels."""
+
+    def __init__(self, sheet: pygame.Surface, index: dict) -> None:
+        if index.get("version") != ATLAS_VERSION:
+            raise ValueError(f"Unsupported atlas version: {index.get('version')}")
+        self.sheet = sheet
+        self.index = index
+        self.frames: dict[str, Frame] = {
+            name: tuple(rect) for name, rect in index["frames"].items()
+        }
+        self.sequences: dict[str, list[str]] = index.get("sequences", {})
+        self._subsurfaces: dict[str, pygame.Surface] = {}
+
+    @classmethod
+    def load(cls, index_path: str | Path) -> TextureAtlas:
+        index_path = Path(index_path)
+        with open(index_path) as f:
+            index = json.load(f)
+        sheet = pygame.image.load(str(index_path.with_name(index["image"])))
+        return cls(sheet, index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.frames
+
+    def get(self, name: str) -> pygame.Surface:
+        """Return the named frame; it shares pixels with the sheet."""
+        surface = self._subsurfaces.get(name)
+        if surface is None:
+            surface = self.sheet.subsurface(self.frames[name])
+            self._subsurfaces[name] = surface
+        return surface
+
+    def sequence(self, prefix: str, extension: str = "png") -> list[pygame.Surface]:
+        names = self.sequences.get(f"{prefix}.{extension}", [])
+        return [self.get(name) for name in names]
+
+    def converted(self) -> TextureAtlas:
+        """Return a copy whose sheet is in the display's pixel format."""
+        return TextureAtlas(self.sheet.convert_alpha(), self.index)
+
+
+def main(argv: list[str] | None = None) -> None:
+    engine_assets = Path(__file__).parent / "assets"
+    parser = argparse.ArgumentParser(
+        prog="python -m battle_engine.atlas",
+        description="Pack a directory of PNGs into a texture atlas.",
+    )
+    parser.add_argument("source", nargs="?", default=engine_assets)
+    parser.add_argument("output", nargs="?", default=engine_assets / "atlas")
+    parser.add_argument("--max-width", type=int, default=1024)
+    parser.add_argument("--padding", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    atlas = build_atlas(args.source, args.output, args.max_width, args.padding)
+    width, height = atlas.sheet.get_size()
+    print(f"Packed {len(atlas.frames)} frames into {width}x{height}")
+
+
+if __name__ == "__main__":
+    main()
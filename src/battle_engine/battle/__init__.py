@@ -1,3 +1,4 @@
+from .bullets import BulletPool
 from .core import Battle, Round
 from .enemy import Enemy
 from .objects import BattleObject, PlayerObject
@@ -28,6 +29,7 @@ __all__ = [
     "BattleBox",
     "BattleObject",
     "BattleState",
+    "BulletPool",
     "Button",
     "ButtonSelectState",
     "DefendingState",
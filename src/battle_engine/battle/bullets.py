@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any
+
+import pygame
+
+from ..drawing import BlitRecord, RenderBatch, RotatedSprite, rotation_cache
+from ..game import Game
+from .collision import Collidable, mask_rect
+from .objects import BattleObject
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the array module is the fallback
+    np = None
+
+_FIELDS = ("x", "y", "vx", "vy", "ax", "ay", "rotation", "spin", "lifetime", "damage")
+
+
+class BulletPool(BattleObject):
+    """Many bullets sharing one sprite, stored as parallel arrays.
+
+    Positions are top-left corners like ``BattleObject.position``; velocities
+    and accelerations are in pixels per second, spin in degrees per second and
+    lifetimes in milliseconds. All bullets move in one vectorized step per
+    update when NumPy is installed, and bullets outside ``bounds`` (the battle
+    box by default) or past their lifetime are culled in bulk.
+    """
+
+    def __init__(
+        self,
+        sprite: pygame.Surface,
+        capacity: int = 256,
+        damage: int = 1,
+        bounds: pygame.Rect | None = None,
+        cull_margin: int | None = None,
+        use_numpy: bool | None = None,
+    ) -> None:
+        super().__init__(sprite, (0, 0), 0, damage)
+        self.bounds = bounds
+        self.cull_margin = (
+            cull_margin if cull_margin is not None else max(sprite.get_size())
+        )
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise RuntimeError("BulletPool(use_numpy=True) requires numpy")
+        self.count: int = 0
+        self.capacity: int = 0
+        self.columns: dict[str, Any] = {}
+        self._hit_index: int = -1
+        self._allocate(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _allocate(self, capacity: int) -> None:
+        for name in _FIELDS:
+            old = self.columns.get(name)
+            if self.use_numpy:
+                assert np is not None
+                column = np.zeros(capacity, dtype=np.float64)
+                if old is not None:
+                    column[: self.count] = old[: self.count]
+            else:
+                column = array("d", bytes(8 * capacity))
+                if old is not None:
+                    column[: self.count] = old[: self.count]
+            self.columns[name] = column
+        self.capacity = capacity
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        vx: float = 0,
+        vy: float = 0,
+        ax: float = 0,
+        ay: float = 0,
+        rotation: float = 0,
+        spin: float = 0,
+        lifetime: float = math.inf,
+        damage: int | None = None,
+    ) -> int:
+        """Add a bullet and return its current index."""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        index = self.count
+        values = (x, y, vx, vy, ax, ay, rotation, spin, lifetime)
+        for name, value in zip(_FIELDS[:-1], values, strict=True):
+            self.columns[name][index] = value
+        self.columns["damage"][index] = self.damage if damage is None else damage
+        self.count += 1
+        return index
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def get_bounds(self) -> pygame.Rect:
+        bounds = self.bounds
+        if bounds is None:
+            bounds = Game().battle.battle_box.get_internal_rect()
+        margin = self.cull_margin
+        return bounds.inflate(margin * 2, margin * 2)
+
+    def update(self) -> None:
+        if self.count == 0:
+            return
+        dt = Game().delta_time
+        if self.use_numpy:
+            self._step_numpy(dt)
+        else:
+            self._step_python(dt)
+
+    def _step_numpy(self, dt: float) -> None:
+        n = self.count
+        c = {name: column[:n] for name, column in self.columns.items()}
+        seconds = dt / 1000
+        c["vx"] += c["ax"] * seconds
+        c["vy"] += c["ay"] * seconds
+        c["x"] += c["vx"] * seconds
+        c["y"] += c["vy"] * seconds
+        c["rotation"] += c["spin"] * seconds
+        c["lifetime"] -= dt
+
+        width, height = self.sprite.get_size()
+        bounds = self.get_bounds()
+        alive = (
+            (c["lifetime"] > 0)
+            & (c["x"] + width > bounds.left)
+            & (c["x"] < bounds.right)
+            & (c["y"] + height > bounds.top)
+            & (c["y"] < bounds.bottom)
+        )
+        if alive.all():
+            return
+        survivors = int(alive.sum())
+        for column in c.values():
+            column[:survivors] = column[alive]
+        self.count = survivors
+
+    def _step_python(self, dt: float) -> None:
+        c = self.columns
+        xs, ys, vxs, vys = c["x"], c["y"], c["vx"], c["vy"]
+        axs, ays, rotations, spins = c["ax"], c["ay"], c["rotation"], c["spin"]
+        lifetimes = c["lifetime"]
+        seconds = dt / 1000
+        width, height = self.sprite.get_size()
+        bounds = self.get_bounds()
+        left, right = bounds.left - width, bounds.right
+        top, bottom = bounds.top - height, bounds.bottom
+
+        # Integrate and compact in one pass: survivors are moved down in place
+        write = 0
+        for read in range(self.count):
+            vx = vxs[read] + axs[read] * seconds
+            vy = vys[read] + ays[read] * seconds
+            x = xs[read] + vx * seconds
+            y = ys[read] + vy * seconds
+            lifetime = lifetimes[read] - dt
+            if lifetime <= 0 or not (left < x < right and top < y < bottom):
+                continue
+            if write != read:
+                for column in c.values():
+                    column[write] = column[read]
+            xs[write], ys[write], vxs[write], vys[write] = x, y, vx, vy
+            rotations[write] += spins[write] * seconds
+            lifetimes[write] = lifetime
+            write += 1
+        self.count = write
+
+    def _placed(self, index: int) -> tuple[RotatedSprite, int, int]:
+        c = self.columns
+        rotated = rotation_cache.get(self.sprite, float(c["rotation"][index]))
+        offset_x, offset_y = rotated.offset
+        return rotated, int(c["x"][index]) + offset_x, int(c["y"][index]) + offset_y
+
+    def _blit_records(self) -> list[BlitRecord]:
+        records: list[BlitRecord] = []
+        for index in range(self.count):
+            rotated, x, y = self._placed(index)
+            records.append((rotated.surface, (x, y), None, 0))
+        return records
+
+    def render(self, surface: pygame.Surface) -> None:
+        if self.count:
+            surface.blits(self._blit_records(), doreturn=False)
+
+    def submit(self, batch: RenderBatch) -> None:
+        if self.count:
+            batch.extend(self._blit_records())
+
+    def _padding(self) -> tuple[int, int]:
+        # A rotated sprite never leaves its diagonal around the same center
+        width, height = self.sprite.get_size()
+        diagonal = math.ceil(math.hypot(width, height))
+        return (diagonal - width) // 2 + 1, (diagonal - height) // 2 + 1
+
+    def get_rect(self) -> pygame.Rect:
+        if self.count == 0:
+            return pygame.Rect(0, 0, 0, 0)
+        n = self.count
+        xs = self.columns["x"][:n]
+        ys = self.columns["y"][:n]
+        if self.use_numpy:
+            min_x, max_x = float(xs.min()), float(xs.max())
+            min_y, max_y = float(ys.min()), float(ys.max())
+        else:
+            min_x, max_x = min(xs), max(xs)
+            min_y, max_y = min(ys), max(ys)
+        width, height = self.sprite.get_size()
+        pad_x, pad_y = self._padding()
+        left = int(min_x) - pad_x
+        top = int(min_y) - pad_y
+        return pygame.Rect(
+            left,
+            top,
+            int(max_x) + width + pad_x - left + 1,
+            int(max_y) + height + pad_y - top + 1,
+        )
+
+    def _candidates(self, rect: pygame.Rect) -> list[int]:
+        n = self.count
+        width, height = self.sprite.get_size()
+        pad_x, pad_y = self._padding()
+        left, right = rect.left - width - pad_x, rect.right + pad_x
+        top, bottom = rect.top - height - pad_y, rect.bottom + pad_y
+        xs = self.columns["x"][:n]
+        ys = self.columns["y"][:n]
+        if self.use_numpy:
+            assert np is not None
+            near = (xs > left) & (xs < right) & (ys > top) & (ys < bottom)
+            return np.flatnonzero(near).tolist()
+        return [i for i in range(n) if left < xs[i] < right and top < ys[i] < bottom]
+
+    def collides_with(self, other: Collidable) -> bool:
+        self._hit_index = -1
+        if self.count == 0:
+            return False
+        other_rect = mask_rect(other)
+        for index in self._candidates(other_rect):
+            rotated, x, y = self._placed(index)
+            offset = (other.rect.x - x, other.rect.y - y)
+            if rotated.mask.overlap(other.mask, offset) is not None:
+                self._hit_index = index
+                return True
+        return False
+
+    def on_hit(self, target: Collidable) -> None:
+        if self._hit_index < 0:
+            return
+        default_damage = self.damage
+        self.damage = int(self.columns["damage"][self._hit_index])
+        try:
+            super().on_hit(target)
+        finally:
+            self.damage = default_damage
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Protocol
+
+import pygame
+
+if TYPE_CHECKING:
+    from .objects import BattleObject
+
+
+class Collidable(Protocol):
+    """Anything objects can hit: a soul or another target with a mask."""
+
+    rect: pygame.Rect
+
+    @property
+    def mask(self) -> pygame.mask.Mask: ...
+
+
+def mask_rect(target: Collidable) -> pygame.Rect:
+    """Bounding box of a target's mask, which is anchored at its rect."""
+    return pygame.Rect(target.rect.topleft, target.mask.get_size())
+
+
+class SpatialHash:
+    """Uniform grid of object bounding boxes used as a collision broad phase.
+
+    Objects are bucketed by every cell their bounding box touches, so a query
+    only returns objects near the queried area and the exact mask test runs
+    for those alone.
+    """
+
+    def __init__(self, cell_size: int = 32) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[BattleObject]] = {}
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def _cell_range(self, rect: pygame.Rect) -> tuple[range, range]:
+        size = self.cell_size
+        return (
+            range(rect.left // size, (rect.right - 1) // size + 1),
+            range(rect.top // size, (rect.bottom - 1) // size + 1),
+        )
+
+    def insert(self, obj: BattleObject, rect: pygame.Rect) -> None:
+        columns, rows = self._cell_range(rect)
+        for cx in columns:
+            for cy in rows:
+                cell = self._cells.get((cx, cy))
+                if cell is None:
+                    self._cells[(cx, cy)] = [obj]
+                else:
+                    cell.append(obj)
+
+    def rebuild(self, objects: Iterable[BattleObject]) -> None:
+        self.clear()
+        for obj in objects:
+            if not obj.destroyed:
+                self.insert(obj, obj.get_rect())
+
+    def query(self, rect: pygame.Rect) -> list[BattleObject]:
+        """Return objects whose cells overlap ``rect``, without duplicates."""
+        found: list[BattleObject] = []
+        seen: set[int] = set()
+        columns, rows = self._cell_range(rect)
+        for cx in columns:
+            for cy in rows:
+                for obj in self._cells.get((cx, cy), ()):
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
+
+    def hits(self, target: Collidable) -> list[BattleObject]:
+        """Return the objects whose masks overlap ``target``."""
+        rect = mask_rect(target)
+        return [obj for obj in self.query(rect) if obj.collides_with(target)]
+
+    def resolve(
+        self, objects: Iterable[BattleObject], targets: Iterable[Collidable]
+    ) -> None:
+        """Rebuild the grid from ``objects`` and apply hits on every target."""
+        self.rebuild(objects)
+        for target in targets:
+            if getattr(target, "invulnerable", False):
+                continue
+            for obj in self.hits(target):
+                obj.on_hit(target)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import random
+from typing import Any, TypeVar
+
 import pygame
 
-from .._assets import asset_frames
-from ..drawing import draw_gradient
+from .._assets import ENGINE_MANIFEST, AssetManifest, asset_frames, preload_assets
+from ..drawing import RenderBatch, draw_gradient
 from ..game import Game, GameMode
 from ..player import Player
+from ..profiler import now
+from .collision import Collidable, SpatialHash
 from .enemy import Enemy
 from .objects import BattleObject, PlayerObject
+from .pool import ObjectPool
 from .states import (
     BattleState,
     ButtonSelectState,
@@ -17,10 +23,26 @@ from .states import (
 )
 from .ui import BattleBox, Button, PlayerStats
 
+T = TypeVar("T", bound=BattleObject)
+
 
 class Battle(GameMode):
-    def __init__(self, game: Game = Game()) -> None:
-        super().__init__(game)
+    # Extra assets to decode up front, merged with the engine's own manifest
+    preload: AssetManifest = {}
+
+    def __init__(self, game: Game | None = None, seed: int | None = None) -> None:
+        """Set up the battle UI; ``seed`` fixes every gameplay random draw.
+
+        Rounds, states and UI should draw from ``self.rng`` rather than the
+        global ``random`` module, so a seed and the player's input fully
+        determine how a battle plays out.
+        """
+        super().__init__(game if game is not None else Game())
+        self.seed: int = 0
+        self.rng = random.Random()
+        self.reseed(seed)
+        preload_assets(ENGINE_MANIFEST)
+        preload_assets(self.preload)
         self.button_data: list[dict[str, str]] = []
         self.buttons: list[Button] = []
         self.current_round: Round | None = None
@@ -29,21 +51,34 @@ class Battle(GameMode):
         self.selected_button: int = 0
         self.player_stats = PlayerStats(
             Player(name="Chara", level=19, health=90, max_health=92),
-            (40, game.surface.get_height() - 80),
+            (40, self.game.surface.get_height() - 80),
         )
         self.player_object = PlayerObject(50, 50, (255, 0, 0))
         self.battle_box = BattleBox(
-            position=(33, game.surface.get_height() / 2 + 9), width=575, height=140
+            position=(33, self.game.surface.get_height() / 2 + 9),
+            width=575,
+            height=140,
+            rng=self.rng,
         )
         self.add_default_buttons()
         self.hit_visual: list[pygame.Surface] = asset_frames("battle/hit/knife")
         self.objects: list[BattleObject] = []
+        self.collision_grid = SpatialHash()
+        self.object_pool = ObjectPool()
+        self.render_batch = RenderBatch()
+        self._drawn_state: BattleState | None = None
         self._total_exp: int = 0
         self._total_gold: int = 0
 
     def post_init(self) -> None:
         pass
 
+    def reseed(self, seed: int | None = None) -> int:
+        """Restart ``rng`` from ``seed`` (a fresh random one if None)."""
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng.seed(self.seed)
+        return self.seed
+
     def add_default_buttons(self) -> None:
         self.add_button("battle/button/fight0.png", "battle/button/fight1.png")
         self.add_button("battle/button/act0.png", "battle/button/act1.png")
@@ -73,11 +108,11 @@ class Battle(GameMode):
 
     def on_game_over(self) -> None:
         """Called when the game over sequence ends. Override for retry/reload."""
-        Game().running = False
+        self.game.running = False
 
     def on_exit(self) -> None:
         """Called to leave the battle. Override to transition elsewhere."""
-        Game().running = False
+        self.game.running = False
 
     def use_item(self, item: str) -> None:
         pass
@@ -105,31 +140,84 @@ class Battle(GameMode):
         self.game = game
 
     def render(self, surface: pygame.Surface) -> None:
+        profiler = self.game.profiler
+        start = 0
+        if profiler is not None:
+            start = now()
         draw_gradient(surface, 25, 6, (255, 255, 255), surface.get_height() / 2)
+        if profiler is not None:
+            start = profiler.lap("render.background", start)
         for button in self.buttons:
             button.render(surface)
+        if profiler is not None:
+            start = profiler.lap("render.ui", start)
         for enemy in self.enemies:
             if not enemy.dead:
                 enemy.render(surface)
+        if profiler is not None:
+            start = profiler.lap("render.enemies", start)
         self.player_stats.render(surface)
         self.battle_box.render(surface)
+        if profiler is not None:
+            start = profiler.lap("render.ui", start)
         if self.gameStateStack:
             current_state = self.gameStateStack[-1]
             current_state.render(self, surface)
+            if profiler is not None:
+                start = profiler.lap("render.state", start)
             if current_state.show_objects():
+                batch = self.render_batch
                 for obj in self.objects:
-                    obj.render(surface)
+                    if isinstance(obj, BattleObject):
+                        obj.submit(batch)
+                    else:
+                        batch.defer(obj.render)
+                batch.flush(surface)
+                if profiler is not None:
+                    start = profiler.lap("render.objects", start)
             if current_state.show_soul():
                 self.player_object.render(surface)
+                if profiler is not None:
+                    profiler.lap("render.soul", start)
 
     def update(self, surface: pygame.Surface) -> None:
+        profiler = self.game.profiler
+        start = 0
+        if profiler is not None:
+            start = now()
         if self.gameStateStack:
-            self.gameStateStack[-1].update(self)
+            state = self.gameStateStack[-1]
+            if state is not self._drawn_state or state.redraw_every_frame:
+                self._drawn_state = state
+                self.game.mark_dirty()
+            state.update(self)
+            if profiler is not None:
+                start = profiler.lap("update.state", start)
         for enemy in self.enemies:
             enemy.update(surface)
-        for obj in self.objects:
-            obj.update()
+        if profiler is not None:
+            start = profiler.lap("update.enemies", start)
+        track_objects = self.game.dirty_rect_mode
+        # A copy, as objects such as TargetUI remove themselves when done
+        for obj in self.objects[:]:
+            if track_objects and isinstance(obj, BattleObject):
+                self.game.mark_dirty(obj.get_rect())
+                obj.update()
+                self.game.mark_dirty(obj.get_rect())
+            else:
+                obj.update()
+        self.collision_grid.resolve(
+            (obj for obj in self.objects if isinstance(obj, BattleObject)),
+            [self.player_object],
+        )
+        if profiler is not None:
+            start = profiler.lap("update.objects", start)
         self.battle_box.update()
+        self.player_stats.update()
+        if self.game.dirty_rect_mode:
+            self.player_object.mark_changes()
+        if profiler is not None:
+            profiler.lap("update.ui", start)
 
         # Central player death check (takes priority over everything)
         if self.player_stats.player.health <= 0 and not isinstance(
@@ -168,20 +256,62 @@ class Round:
         self.time: float = 0
         self.active: bool = True
         self.battle = battle
+        self.collision_grid = SpatialHash()
+        self.render_batch = RenderBatch()
 
     def start(self) -> None:
         pass
 
     def render(self, surface: pygame.Surface) -> None:
         for obj in self.objects:
-            obj.render(surface)
+            obj.submit(self.render_batch)
+        self.render_batch.flush(surface)
 
     def update(self) -> None:
-        self.time += Game().delta_time
+        game = self.battle.game
+        profiler = game.profiler
+        start = 0
+        if profiler is not None:
+            start = now()
+        self.time += game.delta_time
         self.round_update()
-        self.objects = [obj for obj in self.objects if not obj.destroyed]
+        self.compact_objects()
+        if game.dirty_rect_mode:
+            for obj in self.objects:
+                game.mark_dirty(obj.get_rect())
+                obj.update()
+                game.mark_dirty(obj.get_rect())
+        else:
+            for obj in self.objects:
+                obj.update()
+        self.collision_grid.resolve(self.objects, self.get_targets())
+        if profiler is not None:
+            profiler.lap("update.round", start)
+
+    def compact_objects(self) -> None:
+        """Swap-remove destroyed objects in place and recycle them."""
+        objects = self.objects
+        index = 0
+        while index < len(objects):
+            obj = objects[index]
+            if obj.destroyed:
+                self.battle.game.mark_dirty(obj.get_rect())
+                last = objects.pop()
+                if last is not obj:
+                    objects[index] = last
+                self.battle.object_pool.release(obj)
+            else:
+                index += 1
+
+    def release_objects(self) -> None:
+        """Recycle every object of the round, e.g. once the round is over."""
         for obj in self.objects:
-            obj.update()
+            self.battle.object_pool.release(obj)
+        self.objects.clear()
+
+    def get_targets(self) -> list[Collidable]:
+        """Souls or other targets the round's objects can hit."""
+        return [self.battle.player_object]
 
     def round_update(self) -> None:
         pass
@@ -192,6 +322,12 @@ class Round:
     def add_object(self, obj: BattleObject) -> None:
         self.objects.append(obj)
 
+    def spawn(self, cls: type[T], *args: Any, **kwargs: Any) -> T:
+        """Add an object of ``cls``, recycled from the battle's pool if possible."""
+        obj = self.battle.object_pool.acquire(cls, *args, **kwargs)
+        self.add_object(obj)
+        return obj
+
     def end_turn(self) -> None:
         self.active = False
-        Game().battle.player_stats.player.invulnerability_time = 0
+        self.battle.player_stats.player.invulnerability_time = 0
@@ -4,8 +4,9 @@ from typing import Any
 
 import pygame
 
-from ..game import Game
-from ..interpolation import Interpolation, InterpolationManager
+from ..drawing import rotation_cache
+from ..game import Game, mark_dirty
+from ..interpolation import InterpolationManager
 from .ui import HitVisual
 
 
@@ -51,10 +52,31 @@ class Enemy:
         width, height = self.sprite.get_size()
         return pygame.Rect(self.position[0], self.position[1], width, height)
 
+    def get_dirty_rect(self) -> pygame.Rect:
+        """Area the enemy can draw into while shaking, hit or showing health."""
+        width, height = self.sprite.get_size()
+        rect = pygame.Rect(self.base_position, (width, height)).inflate(width, 0)
+        rect.union_ip(
+            pygame.Rect(
+                self.health_bar_position,
+                (self.health_bar_width, self.health_bar_height),
+            )
+        )
+        if self.hit_visual.active:
+            frame = self.hit_visual.frames[0]
+            rect.union_ip(
+                pygame.Rect((self.hit_visual.x, self.hit_visual.y), frame.get_size())
+            )
+        return rect
+
     def add_act(self, name: str, func: Any) -> None:
         self.acts.append({name: func})
 
     def update(self, surface: pygame.Surface) -> None:
+        if self.being_attacked or self.shake_ticks > 0 or self.healthbar_ticks > 0:
+            mark_dirty(self.get_dirty_rect())
+        if self.healthbar_ticks > 0:
+            self.healthbar_ticks -= 1
         if self.being_attacked:
             if not self.hit_visual.active and not self.shake_ticks:
                 from ..sound import SoundManager
@@ -65,11 +87,8 @@ class Enemy:
                 self.shake_speed = max(1, int(20 * power_ratio))
                 self.shake_ticks = 6 * self.shake_speed
                 self.health = max(0, self.health - self.hit_power)
-                InterpolationManager().add_interpolation(
-                    Interpolation(
-                        self, "current_health", self.current_health, self.health, 1000
-                    )
-                )
+                # Replaces the drain still running from an earlier hit
+                InterpolationManager().tween(self, "current_health", self.health, 1000)
                 self.healthbar_ticks = 100
             elif self.hit_visual.active:
                 self.hit_visual.update()
@@ -111,11 +130,11 @@ class Enemy:
         self.hit_power = damage
 
     def render(self, surface: pygame.Surface) -> None:
-        surface.blit(pygame.transform.rotate(self.sprite, self.rotation), self.position)
+        rotated = rotation_cache.get(self.sprite, self.rotation)
+        surface.blit(rotated.surface, self.position)
         if self.hit_visual.active:
             self.hit_visual.render(surface)
         if self.healthbar_ticks > 0:
-            self.healthbar_ticks -= 1
             self.draw_health_bar(surface)
 
     def draw_health_bar(self, surface: pygame.Surface) -> None:
@@ -1,14 +1,53 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 import pygame
 
 from .._assets import asset_surface
-from ..game import Game
+from ..drawing import RenderBatch, rotation_cache
+from ..game import Game, mark_dirty
 from ..player import Player
 from ..singleton import Singleton
+from .collision import Collidable, mask_rect
+
+if TYPE_CHECKING:
+    from .pool import ObjectPool
+
+
+class _MaskedSprite:
+    """Derives ``mask`` from ``sprite`` and ``rotation`` only when they change.
 
+    Masks come from the shared rotation cache, so objects drawing the same
+    sprite at the same angle share one mask. Assigning ``mask`` overrides it
+    until the sprite or rotation changes again.
+    """
+
+    sprite: pygame.Surface
+    rotation: float
+    _mask: pygame.mask.Mask | None = None
+    _mask_sprite: pygame.Surface | None = None
+    _mask_rotation: float = 0
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        if (
+            self._mask is None
+            or self._mask_sprite is not self.sprite
+            or self._mask_rotation != self.rotation
+        ):
+            self.mask = rotation_cache.get(self.sprite, self.rotation).mask
+        assert self._mask is not None
+        return self._mask
 
-class PlayerObject(pygame.sprite.Sprite, metaclass=Singleton):
+    @mask.setter
+    def mask(self, mask: pygame.mask.Mask) -> None:
+        self._mask = mask
+        self._mask_sprite = self.sprite
+        self._mask_rotation = self.rotation
+
+
+class PlayerObject(pygame.sprite.Sprite, _MaskedSprite, metaclass=Singleton):
     def __init__(
         self,
         x: int = 0,
@@ -25,7 +64,9 @@ class PlayerObject(pygame.sprite.Sprite, metaclass=Singleton):
         self.game = Game()
         self.player = Player()
         self.set_color(color)
-        self.mask = pygame.mask.from_surface(self.sprite)
+        self._drawn_rect: pygame.Rect | None = None
+        self._drawn_invulnerable: bool = False
+        self.previous_position: tuple[int, int] = (x, y)
 
     def set_color(self, color: tuple[int, int, int]) -> None:
         new_surface = pygame.Surface(self.sprite.get_size())
@@ -35,9 +76,50 @@ class PlayerObject(pygame.sprite.Sprite, metaclass=Singleton):
         new_surface.blit(self.sprite, (0, 0), None, pygame.BLEND_RGBA_MULT)
         self.sprite = new_surface.convert_alpha()
 
+    @property
+    def invulnerable(self) -> bool:
+        return self.player.invulnerability_time > 0
+
+    def get_render_position(self) -> tuple[int, int]:
+        """Where to draw the soul.
+
+        In fixed-timestep mode this blends the positions of the last two
+        updates by ``Game.render_alpha``.
+        """
+        alpha = self.game.render_alpha if self.game.fixed_timestep else 1.0
+        previous_x, previous_y = self.previous_position
+        return (
+            round(previous_x + (self.rect.x - previous_x) * alpha),
+            round(previous_y + (self.rect.y - previous_y) * alpha),
+        )
+
+    def get_drawn_rect(self) -> pygame.Rect:
+        rotated = rotation_cache.get(self.sprite, self.rotation)
+        offset_x, offset_y = rotated.offset
+        size = rotated.surface.get_size()
+        rect = pygame.Rect((self.rect.x + offset_x, self.rect.y + offset_y), size)
+        if self.game.fixed_timestep:
+            previous_x, previous_y = self.previous_position
+            rect.union_ip(
+                pygame.Rect((previous_x + offset_x, previous_y + offset_y), size)
+            )
+        return rect
+
+    def mark_changes(self) -> None:
+        """Report the soul's old and new area if it moved or changed alpha."""
+        rect = self.get_drawn_rect()
+        if rect != self._drawn_rect or self.invulnerable != self._drawn_invulnerable:
+            if self._drawn_rect is not None:
+                mark_dirty(self._drawn_rect)
+            mark_dirty(rect)
+            self._drawn_rect = rect
+            self._drawn_invulnerable = self.invulnerable
+
     def set_position(self, x: float, y: float) -> None:
         self.rect.x = int(x)
         self.rect.y = int(y)
+        # Placing the soul is a jump, not movement to interpolate
+        self.previous_position = (self.rect.x, self.rect.y)
 
     def set_rotation(self, angle: float) -> None:
         self.rotation = angle
@@ -57,6 +139,7 @@ class PlayerObject(pygame.sprite.Sprite, metaclass=Singleton):
         self.rect.bottom = min(self.rect.bottom, battle_rect.bottom)
 
     def update(self) -> None:
+        self.previous_position = (self.rect.x, self.rect.y)
         if self.player.invulnerability_time > 0:
             self.player.invulnerability_time -= self.game.delta_time
         if self.game.keys_pressed[pygame.K_UP]:
@@ -71,21 +154,23 @@ class PlayerObject(pygame.sprite.Sprite, metaclass=Singleton):
             self.rotate(-5)
         if self.game.keys_pressed[pygame.K_e]:
             self.rotate(5)
-        rotated = pygame.transform.rotate(self.sprite, self.rotation)
-        self.mask = pygame.mask.from_surface(rotated)
         self.check_collision()
 
     def render(self, surface: pygame.Surface) -> None:
+        rotated = rotation_cache.get(self.sprite, self.rotation)
         if self.player.invulnerability_time > 0:
-            self.sprite.set_alpha(128)
+            rotated.surface.set_alpha(128)
         else:
-            self.sprite.set_alpha(255)
-        rotated = pygame.transform.rotate(self.sprite, self.rotation)
-        rotated_rect = rotated.get_rect(center=self.rect.center)
-        surface.blit(rotated, rotated_rect)
+            rotated.surface.set_alpha(255)
+        offset_x, offset_y = rotated.offset
+        x, y = self.get_render_position()
+        surface.blit(rotated.surface, (x + offset_x, y + offset_y))
 
 
-class BattleObject:
+class BattleObject(_MaskedSprite):
+    # The ObjectPool that created this object; no other pool recycles it
+    _pool: ObjectPool | None = None
+
     def __init__(
         self,
         sprite: pygame.Surface,
@@ -96,30 +181,57 @@ class BattleObject:
         self.sprite = sprite
         self.position = position
         self.rotation = rotation
-        self.mask = pygame.mask.from_surface(self.sprite)
         self.damage = damage
         self.destroyed = False
         self.player_stats = Game().battle.player_stats
 
+    def reset(self, *args: Any, **kwargs: Any) -> None:
+        """Prepare a recycled object for reuse with new constructor arguments.
+
+        Re-runs ``__init__`` by default; override to skip expensive setup.
+        """
+        self.__init__(*args, **kwargs)
+
+    def destroy(self) -> None:
+        self.destroyed = True
+
     def update(self) -> None:
-        self.mask = pygame.mask.from_surface(
-            pygame.transform.rotate(self.sprite, self.rotation)
+        pass
+
+    def on_hit(self, target: Collidable) -> None:
+        """Called by the collision pass when this object touches ``target``."""
+        if self.player_stats.player.invulnerability_time > 0:
+            return
+        self.player_stats.player.health = max(
+            0, self.player_stats.player.health - self.damage
         )
-        if self.player_stats.player.invulnerability_time <= 0 and self.collides_with(
-            Game().battle.player_object
-        ):
-            self.player_stats.player.health = max(
-                0, self.player_stats.player.health - self.damage
-            )
-            self.player_stats.player.invulnerability_time = 1000
-            Game().shake(20)
-            from ..sound import SoundManager
+        self.player_stats.player.invulnerability_time = 1000
+        Game().shake(20)
+        from ..sound import SoundManager
 
-            SoundManager().play("damage")
+        SoundManager().play("damage")
 
     def render(self, surface: pygame.Surface) -> None:
         pass
 
-    def collides_with(self, other: PlayerObject) -> bool:
-        offset = (other.rect.x - self.position[0], other.rect.y - self.position[1])
+    def submit(self, batch: RenderBatch) -> None:
+        """Queue this object's drawing; defaults to calling ``render`` later.
+
+        Override to add plain blits to the batch so they are drawn together.
+        """
+        batch.defer(self.render)
+
+    def get_rect(self) -> pygame.Rect:
+        """Bounding box of the (rotated) mask at the object's position."""
+        return pygame.Rect(
+            (int(self.position[0]), int(self.position[1])), self.mask.get_size()
+        )
+
+    def collides_with(self, other: Collidable) -> bool:
+        if not self.get_rect().colliderect(mask_rect(other)):
+            return False
+        offset = (
+            other.rect.x - int(self.position[0]),
+            other.rect.y - int(self.position[1]),
+        )
         return self.mask.overlap(other.mask, offset) is not None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+from .objects import BattleObject
+
+T = TypeVar("T", bound=BattleObject)
+
+
+class ObjectPool:
+    """Free lists of destroyed battle objects, one per object class.
+
+    Released objects keep their sprite (and with it the cached mask), so a
+    recycled object only needs ``reset`` to be reused. Only objects the pool
+    created itself are recycled; anything else the caller may still hold.
+    """
+
+    def __init__(self, max_free: int = 256) -> None:
+        self.max_free = max_free
+        self._free: dict[type[BattleObject], list[BattleObject]] = {}
+
+    def acquire(self, cls: type[T], *args: Any, **kwargs: Any) -> T:
+        free = self._free.get(cls)
+        if free:
+            obj = free.pop()
+            obj.reset(*args, **kwargs)
+            assert isinstance(obj, cls)
+            return obj
+        obj = cls(*args, **kwargs)
+        obj._pool = self
+        return obj
+
+    def release(self, obj: BattleObject) -> None:
+        if obj._pool is not self:
+            return
+        free = self._free.setdefault(type(obj), [])
+        if len(free) < self.max_free:
+            free.append(obj)
+
+    def free_count(self, cls: type[BattleObject]) -> int:
+        return len(self._free.get(cls, ()))
+
+    def clear(self) -> None:
+        self._free.clear()
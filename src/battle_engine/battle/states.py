@@ -7,7 +7,9 @@ import pygame
 
 from .._assets import asset_frames, asset_surface
 from ..constants import CONFIRM_BUTTON, DISMISS_BUTTON, HEIGHT, WIDTH
+from ..drawing import RenderBatch, rotation_cache
 from ..game import Game
+from ..interpolation import Delay, Interpolation, Parallel, Sequence
 from ..sound import SoundManager
 from .ui import Menu, MenuContainer, MenuItem, TargetUI
 
@@ -17,6 +19,10 @@ if TYPE_CHECKING:
 
 
 class BattleState:
+    # States that report their own changes can skip full redraws in
+    # dirty-rect mode; everything else is redrawn every frame.
+    redraw_every_frame: bool = True
+
     def process_input(self, battle: Battle, event: pygame.event.Event) -> None:
         pass
 
@@ -34,6 +40,8 @@ class BattleState:
 
 
 class ButtonSelectState(BattleState):
+    redraw_every_frame = False
+
     def render(self, battle: Battle, surface: pygame.Surface) -> None:
         battle.battle_box.render_text(surface)
 
@@ -80,6 +88,8 @@ class ButtonSelectState(BattleState):
 
 
 class MenuSelectState(BattleState):
+    redraw_every_frame = False
+
     def __init__(self, menu: Menu) -> None:
         battle_rect = Game().battle.battle_box.get_internal_rect()
         self.menu = MenuContainer(
@@ -115,9 +125,12 @@ class MenuSelectState(BattleState):
 
 
 class TargetState(BattleState):
+    redraw_every_frame = False
+
     def __init__(self, enemy: Enemy) -> None:
         super().__init__()
-        self.target = TargetUI(Game().battle.battle_box, enemy.max_health)
+        battle = Game().battle
+        self.target = TargetUI(battle.battle_box, enemy.max_health, battle.rng)
         self.enemy = enemy
         self.target.show()
 
@@ -141,6 +154,8 @@ class TargetState(BattleState):
 
 
 class DefendingState(BattleState):
+    redraw_every_frame = False
+
     def __init__(self) -> None:
         super().__init__()
         self.current_round = Game().battle.current_round
@@ -153,6 +168,7 @@ class DefendingState(BattleState):
 
     def update(self, battle: Battle) -> None:
         if not self.current_round.active:
+            self.current_round.release_objects()
             battle.objects.clear()
             battle.gameStateStack.pop()
             battle.gameStateStack.append(ButtonSelectState())
@@ -173,12 +189,14 @@ class _Particle:
         fade: bool = True,
         vx: float | None = None,
         vy: float | None = None,
+        rng: random.Random | None = None,
     ) -> None:
+        rng = rng if rng is not None else random.Random()
         self.surface = surface
         self.x = x
         self.y = y
-        self.vx = vx if vx is not None else random.uniform(-0.5, 0.5)
-        self.vy = vy if vy is not None else random.uniform(-1.5, -0.3)
+        self.vx = vx if vx is not None else rng.uniform(-0.5, 0.5)
+        self.vy = vy if vy is not None else rng.uniform(-1.5, -0.3)
         self.alpha: float = 255
         self.gravity = gravity
         self.fade = fade
@@ -196,6 +214,12 @@ class _Particle:
         self.surface.set_alpha(int(self.alpha))
         surface.blit(self.surface, (int(self.x), int(self.y)))
 
+    def submit(self, batch: RenderBatch) -> None:
+        if self.alpha <= 0:
+            return
+        self.surface.set_alpha(int(self.alpha))
+        batch.add(self.surface, (int(self.x), int(self.y)))
+
 
 class _AnimatedParticle(_Particle):
     """A particle that cycles through animation frames."""
@@ -229,7 +253,14 @@ class _AnimatedParticle(_Particle):
 
 
 class _ShatterEffect:
-    """Top-to-bottom dissolve: pixel rows break off sequentially and drift up."""
+    """Top-to-bottom dissolve: pixel rows break off sequentially and drift up.
+
+    The effect keeps its own clock rather than running on Delay tweens. Its
+    end is frame-counted: particles fade a fixed step per update, so it
+    finishes when the last one has faded, not after a set duration. Stepping
+    rows and particles from the same update keeps them in lockstep, and lets
+    the effect run without an InterpolationManager.
+    """
 
     def __init__(
         self,
@@ -237,7 +268,9 @@ class _ShatterEffect:
         position: tuple[int, int],
         rows_per_group: int = 2,
         delay_per_group: float = 30,
+        rng: random.Random | None = None,
     ) -> None:
+        self.rng = rng if rng is not None else random.Random()
         self.position = position
         self.rows_per_group = rows_per_group
         self.delay_per_group = delay_per_group
@@ -251,6 +284,7 @@ class _ShatterEffect:
         self.timer: float = 0
         self.next_row: int = 0  # next row to dissolve (from top)
         self.finished = False
+        self.batch = RenderBatch()
 
     def update(self, delta_time: float) -> None:
         self.timer += delta_time
@@ -277,7 +311,7 @@ class _ShatterEffect:
 
             px = self.position[0]
             py = self.position[1] + self.next_row
-            self.particles.append(_Particle(strip, px, py))
+            self.particles.append(_Particle(strip, px, py, rng=self.rng))
 
             self.next_row = row_end
 
@@ -293,10 +327,11 @@ class _ShatterEffect:
     def render(self, surface: pygame.Surface) -> None:
         # Draw whatever rows haven't dissolved yet
         if self.next_row < self.height:
-            surface.blit(self.remaining, self.position)
+            self.batch.add(self.remaining, self.position)
         # Draw floating dust particles
         for p in self.particles:
-            p.render(surface)
+            p.submit(self.batch)
+        self.batch.flush(surface)
 
 
 class EnemyDeathState(BattleState):
@@ -311,14 +346,16 @@ class EnemyDeathState(BattleState):
         self.enemy = enemy
         self.phase = self.PHASE_SHATTER
         self.shatter = _ShatterEffect(
-            pygame.transform.rotate(enemy.sprite, enemy.rotation),
+            rotation_cache.get(enemy.sprite, enemy.rotation).surface,
             enemy.position,
+            rng=Game().battle.rng,
         )
 
     def update(self, battle: Battle) -> None:
         delta = Game().delta_time
 
         if self.phase == self.PHASE_SHATTER:
+            # Ends once the particles have faded, see _ShatterEffect
             self.shatter.update(delta)
             if self.shatter.finished:
                 death_text = self.enemy.on_death()
@@ -379,9 +416,9 @@ class GameOverState(BattleState):
     def __init__(self) -> None:
         super().__init__()
         self.phase = self.PHASE_BLACKOUT
-        self.timer: float = 0
 
-        player_object = Game().battle.player_object
+        battle = Game().battle
+        player_object = battle.player_object
         self.soul_center = player_object.rect.center
 
         # Pre-render the static soul sprite for blackout phase
@@ -400,6 +437,7 @@ class GameOverState(BattleState):
 
         # Shard particles for shatter phase
         self.shards: list[_Particle] = []
+        self.batch = RenderBatch()
 
         # Preload shard assets
         self._shard_surfaces = asset_frames("battle/soul/break/shard_")
@@ -414,10 +452,44 @@ class GameOverState(BattleState):
         self.black_surface = pygame.Surface((WIDTH, HEIGHT))
         self.black_surface.fill((0, 0, 0))
 
+        self.timeline = Sequence(
+            Delay(self.BLACKOUT_DURATION),
+            self._break,
+            Delay(self.BREAK_DURATION),
+            self._shatter,
+            Delay(self.SHATTER_FADE_DURATION),
+            self._game_over,
+            Parallel(
+                Interpolation(
+                    self,
+                    "gameover_alpha",
+                    0,
+                    255,
+                    self.GAMEOVER_FADE_DURATION,
+                    floating_point=True,
+                ),
+                Delay(self.GAMEOVER_HOLD_DURATION),
+            ),
+            on_complete=battle.on_game_over,
+        ).start()
+
+    def _break(self) -> None:
+        self.phase = self.PHASE_BREAK
+        SoundManager().play("heartbreak")
+
+    def _shatter(self) -> None:
+        self._spawn_shards()
+        self.phase = self.PHASE_SHATTER
+        SoundManager().play("heartshatter")
+
+    def _game_over(self) -> None:
+        self.phase = self.PHASE_GAMEOVER
+
     def _spawn_shards(self) -> None:
         """Create animated shard particles from the break sprite center."""
         cx, cy = float(self.soul_center[0]), float(self.soul_center[1])
         n_frames = len(self._shard_surfaces)
+        rng = Game().battle.rng
         for _ in range(5):
             frames = [s.copy() for s in self._shard_surfaces]
             self.shards.append(
@@ -427,41 +499,17 @@ class GameOverState(BattleState):
                     cy,
                     gravity=0.3,
                     fade=False,
-                    vx=random.uniform(-3.0, 3.0),
-                    vy=random.uniform(-4.0, -1.0),
-                    frame_index=random.randint(0, n_frames - 1),
+                    vx=rng.uniform(-3.0, 3.0),
+                    vy=rng.uniform(-4.0, -1.0),
+                    frame_index=rng.randint(0, n_frames - 1),
                 )
             )
 
     def update(self, battle: Battle) -> None:
-        dt = Game().delta_time
-        self.timer += dt
-
-        if self.phase == self.PHASE_BLACKOUT:
-            if self.timer >= self.BLACKOUT_DURATION:
-                self.phase = self.PHASE_BREAK
-                self.timer = 0
-                SoundManager().play("heartbreak")
-
-        elif self.phase == self.PHASE_BREAK:
-            if self.timer >= self.BREAK_DURATION:
-                self._spawn_shards()
-                self.phase = self.PHASE_SHATTER
-                self.timer = 0
-                SoundManager().play("heartshatter")
-
-        elif self.phase == self.PHASE_SHATTER:
+        # Phase changes are driven by self.timeline
+        if self.phase == self.PHASE_SHATTER:
             for shard in self.shards:
                 shard.update()
-            if self.timer >= self.SHATTER_FADE_DURATION:
-                self.phase = self.PHASE_GAMEOVER
-                self.timer = 0
-
-        elif self.phase == self.PHASE_GAMEOVER:
-            t = min(1.0, self.timer / self.GAMEOVER_FADE_DURATION)
-            self.gameover_alpha = t * 255
-            if self.timer >= self.GAMEOVER_HOLD_DURATION:
-                battle.on_game_over()
 
     def render(self, battle: Battle, surface: pygame.Surface) -> None:
         # Black background for all phases
@@ -475,7 +523,8 @@ class GameOverState(BattleState):
 
         elif self.phase == self.PHASE_SHATTER:
             for shard in self.shards:
-                shard.render(surface)
+                shard.submit(self.batch)
+            self.batch.flush(surface)
 
         if self.phase == self.PHASE_GAMEOVER:
             self.gameover_sprite.set_alpha(int(self.gameover_alpha))
@@ -491,6 +540,8 @@ class GameOverState(BattleState):
 class VictoryState(BattleState):
     """Shows reward text and waits for confirm to exit battle."""
 
+    redraw_every_frame = False
+
     def __init__(self, exp: int = 0, gold: int = 0) -> None:
         super().__init__()
         self.exp = exp
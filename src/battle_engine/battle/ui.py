@@ -6,8 +6,9 @@ from collections.abc import Callable
 import pygame
 
 from .._assets import asset_surface
-from ..fonts import draw_text, draw_text_size
-from ..game import Game
+from ..drawing import rotation_cache
+from ..fonts import font_metrics, text_surface_cache
+from ..game import Game, mark_dirty
 from ..interpolation import Interpolation, InterpolationManager
 from ..player import Player
 from ..text import ProgressiveText
@@ -79,14 +80,20 @@ class HitVisual(GUIElement):
 
 
 class TargetUI(GUIElement):
-    def __init__(self, battle_box: BattleBox, enemy_max_health: int) -> None:
+    def __init__(
+        self,
+        battle_box: BattleBox,
+        enemy_max_health: int,
+        rng: random.Random | None = None,
+    ) -> None:
         super().__init__()
+        self.rng = rng if rng is not None else random.Random()
         bg_sprite = asset_surface("battle/target_ui/target.png")
         aim_sprite1 = asset_surface("battle/target_ui/target_aim1.png")
         aim_sprite2 = asset_surface("battle/target_ui/target_aim2.png")
         self.background = bg_sprite
         self.aim_cursor = [aim_sprite1, aim_sprite2]
-        self.direction = random.choice([-1, 1])
+        self.direction = self.rng.choice([-1, 1])
         self.battle_box = battle_box
         self.rect = battle_box.get_internal_rect()
         self.cursor_pos = self.rect.left if self.direction == 1 else self.rect.right
@@ -108,6 +115,20 @@ class TargetUI(GUIElement):
         ) * (self.enemy_max_health / 8)
 
     def update(self) -> None:
+        if self.shown and self.alpha == 0:
+            # Removed during update, not render, so headless runs match
+            self.shown = False
+            Game().battle.objects.remove(self)
+        if self.shown:
+            # The cursor is drawn from cursor_pos, so it can pass the right edge
+            mark_dirty(self.rect.inflate(self.aim_cursor[0].get_width() * 2, 0))
+            # Fading and animation advance per update, not per rendered frame
+            self.frame_counter = (self.frame_counter + 1) % (len(self.aim_cursor) * 5)
+            self.background.fill(
+                (255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT
+            )
+            aim = self.aim_cursor[self.frame_counter // 5]
+            aim.fill((255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT)
         if self.active:
             self.cursor_pos += self.direction * self.speed
             if self.cursor_pos in (self.rect.left, self.rect.right):
@@ -115,26 +136,16 @@ class TargetUI(GUIElement):
 
     def render(self, surface: pygame.Surface) -> None:
         if self.shown:
-            self.background.fill(
-                (255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT
-            )
             surface.blit(
                 pygame.transform.scale(self.background, self.rect.size), self.rect
             )
             aim = self.aim_cursor[self.frame_counter // 5]
-            aim.fill((255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT)
             if self.show_cursor:
                 surface.blit(aim, (self.cursor_pos, self.rect.y))
-            self.frame_counter += 1
-            if self.frame_counter // 5 >= len(self.aim_cursor):
-                self.frame_counter = 0
-            if self.alpha == 0:
-                self.shown = False
-                Game().battle.objects.remove(self)
 
     def show(self) -> None:
         self.hit_power = 0
-        self.direction = random.choice([-1, 1])
+        self.direction = self.rng.choice([-1, 1])
         self.rect = self.battle_box.get_internal_rect()
         self.cursor_pos = self.rect.left if self.direction == 1 else self.rect.right
         self.alpha = 255
@@ -167,10 +178,11 @@ class PlayerStats(GUIElement):
         self.height = 21
         self.hp_sprite = asset_surface("battle/hp.png")
         self.karma_sprite = asset_surface("battle/karma.png")
+        self._drawn_state: tuple[object, ...] = ()
 
     def render(self, surface: pygame.Surface) -> None:
         y_offset = 6
-        draw_text(
+        text_surface_cache.draw(
             surface,
             self.player.name,
             15,
@@ -179,7 +191,7 @@ class PlayerStats(GUIElement):
             self.y - y_offset,
             font_name="hud",
         )
-        draw_text(
+        text_surface_cache.draw(
             surface,
             f"LV {str(self.player.level)}",
             15,
@@ -210,7 +222,7 @@ class PlayerStats(GUIElement):
             (base_hpbar_pos, self.y, self.player.health, self.height),
         )
 
-        draw_text(
+        text_surface_cache.draw(
             surface,
             f"{str(self.player.health)} / {str(self.player.max_health)}",
             15,
@@ -220,8 +232,21 @@ class PlayerStats(GUIElement):
             font_name="hud",
         )
 
+    def get_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y - 6, self.width, self.height + 12)
+
     def update(self) -> None:
-        pass
+        state = (
+            self.x,
+            self.y,
+            self.player.name,
+            self.player.level,
+            self.player.health,
+            self.player.max_health,
+        )
+        if state != self._drawn_state:
+            self._drawn_state = state
+            mark_dirty(self.get_rect())
 
 
 class Button(GUIElement):
@@ -245,6 +270,11 @@ class Button(GUIElement):
             self.current_texture = self.active_texture
         else:
             self.current_texture = self.inactive_texture
+        mark_dirty(self.get_rect())
+
+    def get_rect(self) -> pygame.Rect:
+        image = rotation_cache.get(self.current_texture, self.rotation).surface
+        return pygame.Rect((self.x, self.y), image.get_size())
 
     def update(self) -> None:
         pass
@@ -257,7 +287,7 @@ class Button(GUIElement):
             player_object.set_position(self.x + 10, self.y + self.height / 2 - 8)
 
     def render(self, surface: pygame.Surface) -> None:
-        image = pygame.transform.rotate(self.current_texture, self.rotation)
+        image = rotation_cache.get(self.current_texture, self.rotation).surface
         surface.blit(image, (self.x, self.y))
 
 
@@ -268,6 +298,7 @@ class BattleBox(GUIElement):
         width: int = 200,
         height: int = 100,
         rotation: float = 0,
+        rng: random.Random | None = None,
     ) -> None:
         super().__init__(position, rotation)
         self.width = width
@@ -277,7 +308,7 @@ class BattleBox(GUIElement):
         self.border_color = (255, 255, 255)
         rect = self.get_internal_rect()
         self.text = ProgressiveText(
-            x=rect.x + 14, y=rect.y + 5, max_width=rect.width - 28
+            x=rect.x + 14, y=rect.y + 5, max_width=rect.width - 28, rng=rng
         )
         self.menu: MenuContainer | None = None
         self.current_menu_page = 0
@@ -367,15 +398,17 @@ class MenuContainer:
         self.active_menu = menu
         self.select_item(0)
 
+    def get_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
     def items_per_page(self) -> int:
         assert self.active_menu is not None
-        remaining_height = self.height - draw_text_size("Sample", self.font_size)[1]
+        line_height = font_metrics(self.font_size).height
+        remaining_height = self.height - line_height
         row_items = 0
 
         while remaining_height > 0:
-            remaining_height -= (
-                draw_text_size("Sample", self.font_size)[1] + self.spacing
-            )
+            remaining_height -= line_height + self.spacing
             if remaining_height > 0:
                 row_items += 1
 
@@ -412,8 +445,7 @@ class MenuContainer:
         for item in items_on_current_page:
             if item == selected_item:
                 return x, y
-            _, height = draw_text_size(item.text, self.font_size)
-            y += height + 5
+            y += font_metrics(self.font_size).height + 5
             if y - self.y > self.height - self.font_size * 2:
                 x += 200
                 y = self.y + 5 + 8
@@ -456,6 +488,7 @@ class MenuContainer:
             total_items = len(self.active_menu.items)
             clamped_index = max(0, min(index, total_items - 1))
             self.active_menu.selected_index = clamped_index
+            mark_dirty(self.get_rect())
             from .objects import PlayerObject
 
             player_object = PlayerObject()
@@ -478,15 +511,16 @@ class MenuContainer:
                 x += 200
                 y = self.y + 5
             name = f"* {item.text}"
-            width, height = draw_text_size(name, self.font_size)
-            draw_text(surface, name, self.font_size, (255, 255, 255), x, y)
-            y += height + 5
+            rect = text_surface_cache.draw(
+                surface, name, self.font_size, (255, 255, 255), x, y
+            )
+            y += rect.height + 5
 
         y = self.y + self.height - self.font_size - 10
         page_count = self.get_total_page_count()
         page_number = self.get_page_number_by_index(self.active_menu.selected_index)
         if page_count > 1:
-            draw_text(
+            text_surface_cache.draw(
                 surface, f"PAGE {page_number}", self.font_size, (255, 255, 255), x, y
             )
 
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, MutableMapping
+from contextvars import ContextVar, Token
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class EngineContext:
+    """Owns one set of engine services: Game, Player, soul, sounds, tweens.
+
+    Classes using the Singleton metaclass resolve to the instance registered
+    in the *current* context, so ``Game()`` keeps working unchanged while
+    separate contexts hold separate games. Activate a context with
+    ``with context:`` or ``context.run(fn)``; code outside any ``with`` block
+    (and new threads) uses ``default_context``.
+    """
+
+    def __init__(self) -> None:
+        self.instances: dict[type, Any] = {}
+        self._tokens: list[Token[EngineContext]] = []
+
+    def get(self, cls: type[T]) -> T | None:
+        """The instance of ``cls`` in this context, without creating one."""
+        return self.instances.get(cls)
+
+    def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self:
+            return func(*args, **kwargs)
+
+    def __enter__(self) -> EngineContext:
+        self._tokens.append(_current_context.set(self))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        _current_context.reset(self._tokens.pop())
+
+
+default_context = EngineContext()
+_current_context: ContextVar[EngineContext] = ContextVar("battle_engine_context")
+
+
+def current_context() -> EngineContext:
+    return _current_context.get(default_context)
+
+
+class ContextInstances(MutableMapping[type, Any]):
+    """Mapping view of the current context's instances.
+
+    Backs ``Singleton._instances`` so code that resets singletons by popping
+    them keeps working, scoped to whichever context is active.
+    """
+
+    def __getitem__(self, cls: type) -> Any:
+        return current_context().instances[cls]
+
+    def __setitem__(self, cls: type, instance: Any) -> None:
+        current_context().instances[cls] = instance
+
+    def __delitem__(self, cls: type) -> None:
+        del current_context().instances[cls]
+
+    def __iter__(self) -> Iterator[type]:
+        return iter(current_context().instances)
+
+    def __len__(self) -> int:
+        return len(current_context().instances)
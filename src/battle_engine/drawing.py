@@ -1,5 +1,106 @@
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from itertools import pairwise
+from typing import Any
+
 import pygame
 
+GradientKey = tuple[int, int, int, tuple[int, int, int], tuple[int, ...]]
+
+
+class GradientCache:
+    """Prebuilt gradient surfaces, bounded by their pixel memory.
+
+    ``draw_gradient`` stacks ``num_blocks`` translucent bands, each half the
+    surface tall. Every row is covered by some number of bands, and covering a
+    row n times with alpha ``a`` equals one blend with alpha ``1 - (1 - a)^n``.
+    The whole gradient is therefore built once as a single surface. Entries
+    are keyed by the integer band positions, so an animated gradient reuses
+    entries whenever its bands land on the same rows again.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.used_bytes: int = 0
+        self._gradients: OrderedDict[GradientKey, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._gradients)
+
+    def get(
+        self,
+        size: tuple[int, int],
+        alpha: int,
+        num_blocks: int,
+        color: tuple[int, int, int],
+        max_height: float,
+    ) -> tuple[pygame.Surface, int]:
+        """Return the gradient surface and the row it is blitted at."""
+        width, height = size
+        block_height = max_height / num_blocks
+        starts = tuple(
+            int(height - max_height + block_height * (index + 1))
+            for index in range(num_blocks)
+        )
+        top = max(0, min(starts))
+        key = (width, height, alpha, color, starts)
+
+        gradient = self._gradients.get(key)
+        if gradient is not None:
+            self._gradients.move_to_end(key)
+            return gradient, top
+
+        gradient = self._build(width, height, alpha, color, starts, top)
+        self._gradients[key] = gradient
+        self.used_bytes += _surface_bytes(gradient)
+        while self.used_bytes > self.max_bytes and len(self._gradients) > 1:
+            _, evicted = self._gradients.popitem(last=False)
+            self.used_bytes -= _surface_bytes(evicted)
+        return gradient, top
+
+    @staticmethod
+    def _build(
+        width: int,
+        height: int,
+        alpha: int,
+        color: tuple[int, int, int],
+        starts: tuple[int, ...],
+        top: int,
+    ) -> pygame.Surface:
+        band_height = int(height / 2)
+        gradient = pygame.Surface((width, max(0, height - top)), pygame.SRCALPHA)
+        edges = sorted(
+            {top, height}
+            | {
+                min(max(edge, top), height)
+                for start in starts
+                for edge in (start, start + band_height)
+            }
+        )
+        for band_top, band_bottom in pairwise(edges):
+            layers = sum(
+                1 for start in starts if start <= band_top < start + band_height
+            )
+            if not layers:
+                continue
+            band_alpha = round(255 * (1 - (1 - alpha / 255) ** layers))
+            gradient.fill(
+                (*color, band_alpha),
+                pygame.Rect(0, band_top - top, width, band_bottom - band_top),
+            )
+        return gradient
+
+    def clear(self) -> None:
+        self._gradients.clear()
+        self.used_bytes = 0
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+gradient_cache = GradientCache()
+
 
 def draw_gradient(
     surface: pygame.Surface,
@@ -8,13 +109,140 @@ def draw_gradient(
     color: tuple[int, int, int],
     max_height: float,
 ) -> None:
-    width = surface.get_width()
-    height = surface.get_height()
-    block_height = max_height / num_blocks
-    for index in range(num_blocks):
-        color_a = (color[0], color[1], color[2], alpha)
-        rect = pygame.Surface((width, height / 2), pygame.SRCALPHA)
-        rect.fill(color_a)
-        surface.blit(
-            rect, (0, height - max_height + block_height * index + block_height)
+    gradient, top = gradient_cache.get(
+        surface.get_size(), alpha, num_blocks, color, max_height
+    )
+    surface.blit(gradient, (0, top))
+
+
+BlitRecord = tuple[Any, ...]
+DeferredDraw = Callable[[pygame.Surface], object]
+
+
+class RenderBatch:
+    """Collects blits and flushes them with one ``Surface.blits`` call per run.
+
+    Layers are drawn in ascending order, and within a layer everything is
+    drawn in submission order. Drawing that is not a plain blit can be queued
+    with ``defer``; it closes the current run of blits, so the blits queued
+    before it are drawn first. Within a run, records are sorted by blend
+    flags, and records with the same flags keep their submission order.
+    """
+
+    def __init__(self) -> None:
+        # Per layer: runs of blit records, with deferred draws between them
+        self._layers: dict[int, list[list[BlitRecord] | DeferredDraw]] = {}
+
+    def __len__(self) -> int:
+        return sum(
+            len(step)
+            for steps in self._layers.values()
+            for step in steps
+            if isinstance(step, list)
         )
+
+    def _run(self, layer: int) -> list[BlitRecord]:
+        steps = self._layers.get(layer)
+        if steps is None:
+            steps = self._layers[layer] = []
+        if not steps or not isinstance(steps[-1], list):
+            steps.append([])
+        run = steps[-1]
+        assert isinstance(run, list)
+        return run
+
+    def add(
+        self,
+        source: pygame.Surface,
+        dest: Any,
+        area: Any = None,
+        special_flags: int = 0,
+        layer: int = 0,
+    ) -> None:
+        self._run(layer).append((source, dest, area, special_flags))
+
+    def extend(self, records: Iterable[BlitRecord], layer: int = 0) -> None:
+        """Queue ready-made (source, dest, area, special_flags) records."""
+        self._run(layer).extend(records)
+
+    def defer(self, draw: DeferredDraw, layer: int = 0) -> None:
+        self._layers.setdefault(layer, []).append(draw)
+
+    def flush(self, surface: pygame.Surface) -> None:
+        for layer in sorted(self._layers):
+            for step in self._layers[layer]:
+                if isinstance(step, list):
+                    step.sort(key=_blend_flags)
+                    surface.blits(step, doreturn=False)
+                else:
+                    step(surface)
+        self.clear()
+
+    def clear(self) -> None:
+        self._layers.clear()
+
+
+def _blend_flags(record: BlitRecord) -> int:
+    return record[3]
+
+
+class RotatedSprite:
+    """A rotated copy of a sprite, positioned relative to the original."""
+
+    def __init__(self, source: pygame.Surface, angle: float) -> None:
+        self.source = source
+        self.angle = angle
+        self.surface = source if angle == 0 else pygame.transform.rotate(source, angle)
+        # Offset of the rotated top-left when it shares the source's center
+        self.offset: tuple[int, int] = (
+            source.get_width() // 2 - self.surface.get_width() // 2,
+            source.get_height() // 2 - self.surface.get_height() // 2,
+        )
+        self._mask: pygame.mask.Mask | None = None
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        if self._mask is None:
+            self._mask = pygame.mask.from_surface(self.surface)
+        return self._mask
+
+
+class RotationCache:
+    """LRU cache of rotated sprites keyed by (surface id, quantised angle).
+
+    Angles are snapped to multiples of ``angle_step`` degrees. Each entry
+    keeps its source surface alive, so an id can't be reused while cached.
+    """
+
+    def __init__(self, angle_step: float = 1.0, max_entries: int = 1024) -> None:
+        self.angle_step = angle_step
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, float], RotatedSprite] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def quantise(self, angle: float) -> float:
+        if self.angle_step > 0:
+            angle = round(angle / self.angle_step) * self.angle_step
+        return angle % 360
+
+    def get(self, surface: pygame.Surface, angle: float) -> RotatedSprite:
+        key = (id(surface), self.quantise(angle))
+        entry = self._entries.get(key)
+        if entry is not None and entry.source is surface:
+            self._entries.move_to_end(key)
+            return entry
+
+        entry = RotatedSprite(surface, key[1])
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+rotation_cache = RotationCache()
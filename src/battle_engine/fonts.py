@@ -1,18 +1,41 @@
+from collections import OrderedDict
+
 import pygame
 
 from ._assets import asset_font_path
 
-font_dictionary: dict[str, str] = {
-    "default": asset_font_path("fonts/DTM-Sans.otf"),
-    "attack": asset_font_path("fonts/undertale-attack-font.ttf"),
-    "hud": asset_font_path("fonts/undertale-in-game-hud-font.ttf"),
+ColorTuple = tuple[int, int, int]
+GlyphKey = tuple[str, int, ColorTuple, str]
+TextKey = tuple[str, str, int, ColorTuple, str, int]
+
+_ENGINE_FONTS: dict[str, str] = {
+    "default": "fonts/DTM-Sans.otf",
+    "attack": "fonts/undertale-attack-font.ttf",
+    "hud": "fonts/undertale-in-game-hud-font.ttf",
 }
 
+
+class _FontPaths(dict[str, str]):
+    """Font name -> file path; engine fonts are resolved on first lookup."""
+
+    def __missing__(self, font_name: str) -> str:
+        path = asset_font_path(_ENGINE_FONTS[font_name])
+        self[font_name] = path
+        return path
+
+
+font_dictionary: dict[str, str] = _FontPaths()
+
 font_cache: dict[str, pygame.font.Font] = {}
 
 
 def register_font(font_name: str, font_path: str) -> None:
     font_dictionary[font_name] = font_path
+    # Drop everything measured or rendered with the font previously under this name
+    for key in [key for key in metrics_cache if key[0] == font_name]:
+        del metrics_cache[key]
+    glyph_atlas.discard_font(font_name)
+    text_surface_cache.discard_font(font_name)
 
 
 def load_font(name: str, size: int) -> pygame.font.Font:
@@ -22,42 +45,227 @@ def load_font(name: str, size: int) -> pygame.font.Font:
     return font_cache[font_cache_key]
 
 
-def draw_text(
-    surface: pygame.Surface,
+def render_text(
     text: str,
     size: int,
     color: tuple[int, int, int],
-    x: float,
-    y: float,
     anchor: str = "topleft",
     rotation: int = 0,
     font_name: str = "default",
-) -> None:
+) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Render text and return it with its offset from the anchor point."""
     font = load_font(font_dictionary[font_name], size)
     text_surface = font.render(text, True, color)
     text_rect = text_surface.get_rect()
-    ix, iy = int(x), int(y)
     match anchor:
         case "center":
-            text_rect.center = (ix, iy)
+            text_rect.center = (0, 0)
         case "topleft":
-            text_rect.topleft = (ix, iy)
+            text_rect.topleft = (0, 0)
         case "midleft":
-            text_rect.midleft = (ix, iy)
+            text_rect.midleft = (0, 0)
         case "topright":
-            text_rect.topright = (ix, iy)
+            text_rect.topright = (0, 0)
         case "midright":
-            text_rect.midright = (ix, iy)
+            text_rect.midright = (0, 0)
     if rotation != 0:
         rotated_text = pygame.transform.rotate(text_surface, rotation)
         rotated_rect = rotated_text.get_rect(center=text_rect.center)
-        surface.blit(rotated_text, rotated_rect)
-    else:
-        surface.blit(text_surface, text_rect)
+        return rotated_text, rotated_rect.topleft
+    return text_surface, text_rect.topleft
+
+
+def draw_text(
+    surface: pygame.Surface,
+    text: str,
+    size: int,
+    color: tuple[int, int, int],
+    x: float,
+    y: float,
+    anchor: str = "topleft",
+    rotation: int = 0,
+    font_name: str = "default",
+) -> None:
+    text_surface, (dx, dy) = render_text(text, size, color, anchor, rotation, font_name)
+    surface.blit(text_surface, (int(x) + dx, int(y) + dy))
+
+
+class FontMetrics:
+    """Surface-free measurements for one (font, size) pair.
+
+    Uses Font.size, which matches the size of a rendered surface without
+    allocating one. Advance widths of single characters are cached.
+    """
+
+    def __init__(self, font: pygame.font.Font) -> None:
+        self.font = font
+        self.height: int = font.get_height()
+        self._advances: dict[str, int] = {}
+
+    def advance(self, char: str) -> int:
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self.font.size(char)[0]
+            self._advances[char] = advance
+        return advance
+
+    def size(self, text: str) -> tuple[int, int]:
+        if len(text) == 1:
+            return self.advance(text), self.height
+        return self.font.size(text)
+
+
+metrics_cache: dict[tuple[str, int], FontMetrics] = {}
+
+
+def font_metrics(size: int, font_name: str = "default") -> FontMetrics:
+    key = (font_name, size)
+    metrics = metrics_cache.get(key)
+    if metrics is None:
+        metrics = FontMetrics(load_font(font_dictionary[font_name], size))
+        metrics_cache[key] = metrics
+    return metrics
 
 
 def draw_text_size(text: str, size: int, font_name: str = "default") -> tuple[int, int]:
-    font = load_font(font_dictionary[font_name], size)
-    text_surface = font.render(text, True, (0, 0, 0))
-    text_rect = text_surface.get_rect()
-    return text_rect.width, text_rect.height
+    return font_metrics(size, font_name).size(text)
+
+
+class GlyphAtlas:
+    """LRU cache of rendered glyph surfaces, bounded by their pixel memory.
+
+    Entries are keyed by (font, size, color, char) and hold the rendered glyph
+    together with its advance width, so revealed text only needs to blit.
+    """
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.used_bytes: int = 0
+        self._glyphs: OrderedDict[GlyphKey, tuple[pygame.Surface, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def get(
+        self,
+        char: str,
+        size: int,
+        color: ColorTuple,
+        font_name: str = "default",
+    ) -> tuple[pygame.Surface, int]:
+        key = (font_name, size, color, char)
+        entry = self._glyphs.get(key)
+        if entry is not None:
+            self._glyphs.move_to_end(key)
+            return entry
+
+        metrics = font_metrics(size, font_name)
+        glyph = metrics.font.render(char, True, color)
+        entry = (glyph, metrics.advance(char))
+        self._glyphs[key] = entry
+        self.used_bytes += _surface_bytes(glyph)
+
+        # Always keep the glyph we just rendered, even if it alone is too big
+        while self.used_bytes > self.max_bytes and len(self._glyphs) > 1:
+            _, (evicted, _) = self._glyphs.popitem(last=False)
+            self.used_bytes -= _surface_bytes(evicted)
+        return entry
+
+    def discard_font(self, font_name: str) -> None:
+        for key in [key for key in self._glyphs if key[0] == font_name]:
+            glyph, _ = self._glyphs.pop(key)
+            self.used_bytes -= _surface_bytes(glyph)
+
+    def clear(self) -> None:
+        self._glyphs.clear()
+        self.used_bytes = 0
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+glyph_atlas = GlyphAtlas()
+
+
+def draw_glyph(
+    surface: pygame.Surface,
+    char: str,
+    size: int,
+    color: ColorTuple,
+    x: float,
+    y: float,
+    font_name: str = "default",
+) -> int:
+    """Blit a single cached glyph at (x, y) and return its advance width."""
+    glyph, advance = glyph_atlas.get(char, size, color, font_name)
+    surface.blit(glyph, (int(x), int(y)))
+    return advance
+
+
+class TextSurfaceCache:
+    """Memoised text surfaces for strings that rarely change, such as HUD labels.
+
+    Entries are keyed by (text, font, size, color, anchor, rotation); a string
+    is only rendered again once its value changes or it has been evicted.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict[TextKey, tuple[pygame.Surface, tuple[int, int]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get(
+        self,
+        text: str,
+        size: int,
+        color: ColorTuple,
+        anchor: str = "topleft",
+        rotation: int = 0,
+        font_name: str = "default",
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        key = (text, font_name, size, color, anchor, rotation)
+        entry = self._surfaces.get(key)
+        if entry is not None:
+            self._surfaces.move_to_end(key)
+            return entry
+
+        entry = render_text(text, size, color, anchor, rotation, font_name)
+        self._surfaces[key] = entry
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return entry
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        text: str,
+        size: int,
+        color: ColorTuple,
+        x: float,
+        y: float,
+        anchor: str = "topleft",
+        rotation: int = 0,
+        font_name: str = "default",
+    ) -> pygame.Rect:
+        """Blit the cached text like draw_text and return the covered rect."""
+        text_surface, (dx, dy) = self.get(
+            text, size, color, anchor, rotation, font_name
+        )
+        rect = pygame.Rect((int(x) + dx, int(y) + dy), text_surface.get_size())
+        surface.blit(text_surface, rect)
+        return rect
+
+    def discard_font(self, font_name: str) -> None:
+        for key in [key for key in self._surfaces if key[1] == font_name]:
+            del self._surfaces[key]
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
+text_surface_cache = TextSurfaceCache()
@@ -3,12 +3,14 @@ from __future__ import annotations
 import os
 import random
 import sys
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Protocol
 
 import pygame
 from pygame._sdl2 import Window
 
 from .interpolation import InterpolationManager
+from .profiler import FrameProfiler, ProfilerOverlay, now
 from .singleton import Singleton
 
 if TYPE_CHECKING:
@@ -19,8 +21,6 @@ DESIGN_RESOLUTION = (640, 480)
 FPS = 30
 BORDERLESS = os.name == "nt"
 
-os.environ["SDL_VIDEO_CENTERED"] = "1"
-
 
 class GameMode:
     def __init__(self, game: Game) -> None:
@@ -39,8 +39,59 @@ class GameMode:
         pass
 
 
+def mark_dirty(rect: pygame.Rect | None = None) -> None:
+    """Report a changed screen area to the running game, if there is one."""
+    game = Singleton._instances.get(Game)
+    if game is not None:
+        game.mark_dirty(rect)
+
+
+class KeyState(Protocol):
+    def __getitem__(self, key: int, /) -> bool: ...
+
+
+class PressedKeys:
+    """KeyState for a fixed set of held keys, indexed by pygame key constants."""
+
+    def __init__(self, keys: Iterable[int] = ()) -> None:
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+class InputProvider:
+    """Where Game reads input from each frame; the default is pygame itself.
+
+    Replace ``Game.input_provider`` to drive a game from scripts or bots.
+    """
+
+    def get_pressed(self, game: Game) -> KeyState:
+        return pygame.key.get_pressed()
+
+    def get_events(self, game: Game) -> list[pygame.event.Event]:
+        return pygame.event.get()
+
+
 class Game(metaclass=Singleton):
-    def __init__(self) -> None:
+    def __init__(self, headless: bool | None = None, render: bool = True) -> None:
+        """Create the game window, or an invisible one when ``headless``.
+
+        Headless games use SDL's dummy video and audio drivers, never touch
+        the OS window, and run() steps as fast as possible on a simulated
+        clock. ``render=False`` also skips drawing entirely. ``headless``
+        defaults to the BATTLE_ENGINE_HEADLESS environment variable.
+        """
+        if headless is None:
+            headless = os.environ.get("BATTLE_ENGINE_HEADLESS", "") not in ("", "0")
+        self.headless: bool = headless
+        self.render_enabled: bool = render
+        if headless:
+            if not pygame.display.get_init():
+                os.environ["SDL_VIDEODRIVER"] = "dummy"
+                os.environ["SDL_AUDIODRIVER"] = "dummy"
+        else:
+            os.environ["SDL_VIDEO_CENTERED"] = "1"
         pygame.init()
         screen_info = pygame.display.Info()
         self.native_resolution: tuple[int, int] = (
@@ -55,20 +106,42 @@ class Game(metaclass=Singleton):
             int(DESIGN_RESOLUTION[0] * scaling_factor),
             int(DESIGN_RESOLUTION[1] * scaling_factor),
         )
-        self.screen: pygame.Surface = pygame.display.set_mode(DESIGN_RESOLUTION)
+        if headless and pygame.display.get_surface() is not None:
+            # Another game owns the display; draw offscreen and leave it alone
+            self.screen: pygame.Surface = pygame.Surface(DESIGN_RESOLUTION)
+        else:
+            self.screen = pygame.display.set_mode(DESIGN_RESOLUTION)
         self.surface: pygame.Surface = pygame.Surface(DESIGN_RESOLUTION)
-        pygame.display.set_caption("battle-engine")
+        if not headless:
+            pygame.display.set_caption("battle-engine")
         self.clock = pygame.time.Clock()
         self.shaking_ticks: int = 0
+        # Cosmetic randomness only; gameplay draws from Battle.rng
+        self.rng = random.Random()
         self.original_position: tuple[int, int] | None = None
         self.game_mode: GameMode = GameMode(self)
-        self.window = Window.from_display_module()
+        self.window: Window | None = None
+        if not headless:
+            self.window = Window.from_display_module()
         self.interpolation_manager: InterpolationManager = InterpolationManager()
         self.running: bool = True
         self.fullscreen: bool = False
         self.progressive_texts: list[ProgressiveText] = []
-        self.keys_pressed: list[bool] | pygame.key.ScancodeWrapper = []
-        self.delta_time: int = 0
+        self.input_provider: InputProvider = InputProvider()
+        self.keys_pressed: KeyState = PressedKeys()
+        self.delta_time: float = 0
+        self.fixed_timestep: bool = False
+        self.simulation_rate: int = FPS
+        self.render_rate: int = FPS
+        self.max_catch_up: int = 5
+        self.render_alpha: float = 1.0
+        self._accumulator: float = 0
+        self._last_dirty_rects: list[pygame.Rect] = []
+        self.dirty_rect_mode: bool = False
+        self._dirty_rects: list[pygame.Rect] = []
+        self._full_redraw: bool = True
+        self.profiler: FrameProfiler | None = None
+        self.profiler_overlay: ProfilerOverlay | None = None
 
     @property
     def battle(self) -> Battle:
@@ -78,17 +151,30 @@ class Game(metaclass=Singleton):
         return self.game_mode
 
     def process_events(self) -> None:
-        self.keys_pressed = pygame.key.get_pressed()
-        for event in pygame.event.get():
+        profiler = self.profiler
+        start = 0
+        if profiler is not None:
+            profiler.begin_frame()
+            start = now()
+        self.keys_pressed = self.input_provider.get_pressed(self)
+        for event in self.input_provider.get_events(self):
             if event.type == pygame.QUIT:
                 self.running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_profiler()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
                 self.toggle_fullscreen()
             self.game_mode.process_input(event)
+        if profiler is not None:
+            profiler.lap("events", start)
 
     def update(self) -> None:
+        profiler = self.profiler
+        start = update_start = 0
+        if profiler is not None:
+            update_start = now()
         if self.shaking_ticks > 0:
-            if not self.fullscreen:
+            if self.window is not None and not self.fullscreen:
                 if self.shaking_ticks <= 30:
                     factor = self.shaking_ticks / 30
                 else:
@@ -96,35 +182,90 @@ class Game(metaclass=Singleton):
                 assert self.original_position is not None
                 random_position = (
                     self.original_position[0]
-                    + random.randint(int(-5 * factor), int(5 * factor)),
+                    + self.rng.randint(int(-5 * factor), int(5 * factor)),
                     self.original_position[1]
-                    + random.randint(int(-5 * factor), int(5 * factor)),
+                    + self.rng.randint(int(-5 * factor), int(5 * factor)),
                 )
                 self.window.position = random_position
-                self.shaking_ticks -= 1
+            self.shaking_ticks -= 1
         else:
-            if self.original_position is not None:
+            if self.original_position is not None and self.window is not None:
                 self.window.position = self.original_position
                 self.original_position = None
+        if profiler is not None:
+            start = now()
         for text in self.progressive_texts:
             text.update()
+        if profiler is not None:
+            start = profiler.lap("update.text", start)
+        if self.interpolation_manager.interpolations:
+            # Tweened properties can move anything on screen
+            self.mark_dirty()
         self.interpolation_manager.update(self.delta_time)
+        if profiler is not None:
+            profiler.lap("update.interpolations", start)
         self.game_mode.update(self.surface)
+        if profiler is not None:
+            profiler.lap("update", update_start)
+
+    def set_dirty_rect_mode(self, enabled: bool) -> None:
+        """Only redraw areas reported through mark_dirty() while enabled.
+
+        Game modes have to report every change they make; the battle UI does.
+        Fullscreen and screen shake always fall back to full redraws.
+        """
+        self.dirty_rect_mode = enabled
+        self.mark_dirty()
+
+    def mark_dirty(self, rect: pygame.Rect | None = None) -> None:
+        """Report a changed area of the design surface, or all of it."""
+        if not self.dirty_rect_mode:
+            return
+        if rect is None:
+            self._full_redraw = True
+        elif not self._full_redraw:
+            self._dirty_rects.append(pygame.Rect(rect))
 
     def render(self) -> None:
+        if not self.render_enabled:
+            return
+        profiler = self.profiler
+        if profiler is None:
+            self._render()
+            return
+        start = now()
+        self._render()
+        profiler.lap("render", start)
+
+    def _render(self) -> None:
+        if self.profiler_overlay is not None:
+            # The overlay changes every frame and is drawn over everything
+            self.mark_dirty()
+        if self.dirty_rect_mode and not self.fullscreen and not self._full_redraw:
+            self._render_dirty()
+            return
+        self._full_redraw = False
+        self._dirty_rects.clear()
+
         self.screen.fill((0, 0, 0))
         self.surface.fill((0, 0, 0))
         self.game_mode.render(self.surface)
+        profiler = self.profiler
+        start = 0
+        if profiler is not None:
+            start = now()
+            if self.profiler_overlay is not None:
+                self.profiler_overlay.render(self.surface)
+                start = profiler.lap("render.overlay", start)
 
         if self.shaking_ticks > 0 and self.fullscreen:
             if self.shaking_ticks <= 30:
                 factor = self.shaking_ticks / 30
             else:
                 factor = 1
-            offset_x = random.randint(int(-5 * factor), int(5 * factor))
-            offset_y = random.randint(int(-5 * factor), int(5 * factor))
+            offset_x = self.rng.randint(int(-5 * factor), int(5 * factor))
+            offset_y = self.rng.randint(int(-5 * factor), int(5 * factor))
             self.surface.scroll(dx=offset_x, dy=offset_y)
-            self.shaking_ticks -= 1
 
         if self.fullscreen:
             scaled_position = (
@@ -139,15 +280,67 @@ class Game(metaclass=Singleton):
             scaled = self.surface
 
         self.screen.blit(scaled, scaled_position)
-        pygame.display.flip()
+        if not self.headless:
+            pygame.display.flip()
+        if profiler is not None:
+            profiler.lap("render.present", start)
+
+    def _render_dirty(self) -> None:
+        bounds = self.surface.get_rect()
+        rects = [rect.clip(bounds) for rect in self._dirty_rects]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        self._dirty_rects.clear()
+        self._last_dirty_rects = rects
+        if not rects:
+            return
+
+        # Redraw once, clipped to the area covering every dirty rect
+        area = rects[0].unionall(rects[1:])
+        self.surface.set_clip(area)
+        self.surface.fill((0, 0, 0), area)
+        self.game_mode.render(self.surface)
+        self.surface.set_clip(None)
+
+        for rect in rects:
+            self.screen.blit(self.surface, rect, rect)
+        if not self.headless:
+            pygame.display.update(rects)
 
     def shake(self, ticks: int) -> None:
-        pos = self.window.position
-        assert isinstance(pos, tuple)
-        self.original_position = (int(pos[0]), int(pos[1]))
+        if self.window is not None:
+            pos = self.window.position
+            assert isinstance(pos, tuple)
+            self.original_position = (int(pos[0]), int(pos[1]))
         self.shaking_ticks = ticks
 
+    def set_profiling(
+        self, enabled: bool, overlay: bool = False, capacity: int = 300
+    ) -> None:
+        """Time every frame's subsystems into ``self.profiler``.
+
+        See battle_engine.profiler for the sections. ``overlay`` draws the
+        timings over the game. Disabling drops the recorded frames.
+        """
+        if not enabled:
+            self.profiler = None
+            self.profiler_overlay = None
+            self.mark_dirty()
+            return
+        if self.profiler is None or self.profiler.capacity != capacity:
+            self.profiler = FrameProfiler(capacity)
+        self.profiler_overlay = (
+            ProfilerOverlay(self.profiler, 1000 / self.render_rate) if overlay else None
+        )
+        self.mark_dirty()
+
+    def toggle_profiler(self) -> None:
+        """Debug key (F3): switch profiling with the overlay on or off."""
+        self.set_profiling(self.profiler_overlay is None, overlay=True)
+
     def toggle_fullscreen(self) -> None:
+        if self.headless:
+            return
+        self.mark_dirty()
         if self.fullscreen:
             self.screen = pygame.display.set_mode(DESIGN_RESOLUTION)
         else:
@@ -158,15 +351,78 @@ class Game(metaclass=Singleton):
         self.fullscreen = not self.fullscreen
 
     def set_mode(self, mode: GameMode) -> None:
+        self.mark_dirty()
         self.game_mode = mode
         self.game_mode.post_init()
 
-    def run(self) -> None:
-        while self.running:
-            self.process_events()
+    def set_fixed_timestep(
+        self,
+        enabled: bool,
+        simulation_rate: int = FPS,
+        render_rate: int = 60,
+        max_catch_up: int = 5,
+    ) -> None:
+        """Run updates at a fixed rate, independent of the render rate.
+
+        Every update then sees the same ``delta_time``, so gameplay no longer
+        depends on frame drops. Between updates, ``render_alpha`` tells how
+        far the next update is (0-1) for interpolated drawing. At most
+        ``max_catch_up`` updates run per rendered frame; time beyond that is
+        dropped rather than replayed.
+        """
+        self.fixed_timestep = enabled
+        self.simulation_rate = simulation_rate
+        self.render_rate = render_rate if enabled else FPS
+        self.max_catch_up = max_catch_up
+        self.render_alpha = 1.0
+        self._accumulator = 0
+
+    def step(self, frame_time: float) -> int:
+        """Advance the simulation by ``frame_time`` ms of fixed updates.
+
+        Returns the number of updates that ran.
+        """
+        step_ms = 1000 / self.simulation_rate
+        self._accumulator += frame_time
+        steps = 0
+        while self._accumulator >= step_ms and steps < self.max_catch_up:
+            self.delta_time = step_ms
             self.update()
+            self._accumulator -= step_ms
+            steps += 1
+        if self._accumulator >= step_ms:
+            # Too far behind: drop the backlog instead of spiralling
+            self._accumulator %= step_ms
+        self.render_alpha = self._accumulator / step_ms
+        if steps == 0 and self.dirty_rect_mode:
+            # Interpolated objects stay within the area of the last update
+            self._dirty_rects.extend(self._last_dirty_rects)
+        return steps
+
+    def run(self, max_frames: int | None = None) -> None:
+        """Run the main loop until quit, or for at most ``max_frames`` frames.
+
+        Headless games return instead of exiting, and advance a simulated
+        clock by one frame per iteration rather than waiting for real time.
+        """
+        frame_time: float = 0
+        frames = 0
+        while self.running and (max_frames is None or frames < max_frames):
+            self.process_events()
+            if self.fixed_timestep:
+                self.step(frame_time)
+            else:
+                self.update()
             self.render()
-            self.delta_time = self.clock.tick(FPS)
+            if self.headless:
+                frame_time = 1000 / self.render_rate
+            else:
+                frame_time = self.clock.tick(self.render_rate)
+            if not self.fixed_timestep:
+                self.delta_time = frame_time
+            frames += 1
 
+        if self.headless or self.running:
+            return
         pygame.quit()
         sys.exit()
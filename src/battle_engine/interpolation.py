@@ -1,23 +1,60 @@
-from typing import Any
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import Any, Union
 
 from .singleton import Singleton
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, plain lists are the fallback
+    np = None
+
+_COLUMNS = ("start", "change", "duration", "elapsed", "easing", "floating", "last")
+
+
+_LINEAR, _EASE_IN, _EASE_OUT, _EASE_IN_OUT = range(4)
+
+
+def _ease(easing_mode: int, t: float) -> float:
+    """Eased progress for ``t`` in [0, 1]; the batched update mirrors this."""
+    if easing_mode == _EASE_IN:
+        return t * t
+    if easing_mode == _EASE_OUT:
+        return 1 - (1 - t) * (1 - t)
+    if easing_mode == _EASE_IN_OUT:
+        if t < 0.5:
+            return 2 * t * t
+        u = 2 * t - 1
+        return 0.5 + 0.5 * (1 - (1 - u) * (1 - u))
+    return t
+
 
 class Interpolation:
-    LINEAR = 0
-    EASE_IN = 1
-    EASE_OUT = 2
-    EASE_IN_OUT = 3
+    """Tweens ``obj.attr`` from ``start`` to ``end`` over ``duration`` ms.
+
+    A ``start`` of None means the attribute's value when the tween starts.
+    ``on_complete`` is called once the tween finishes, but not when it is
+    cancelled or replaced. The Interpolation doubles as the handle of a
+    running tween, see ``active`` and InterpolationManager.remove_interpolation.
+    """
+
+    LINEAR = _LINEAR
+    EASE_IN = _EASE_IN
+    EASE_OUT = _EASE_OUT
+    EASE_IN_OUT = _EASE_IN_OUT
 
     def __init__(
         self,
         obj: Any,
         attr: str,
-        start: float,
+        start: float | None,
         end: float,
         duration: float,
         easing_mode: int = LINEAR,
         floating_point: bool = False,
+        on_complete: Callable[[], None] | None = None,
     ) -> None:
         self.obj = obj
         self.attr = attr
@@ -27,50 +64,416 @@ class Interpolation:
         self.easing_mode = easing_mode
         self.elapsed_time: float = 0
         self.floating_point = floating_point
+        self.on_complete = on_complete
+        # Row in the InterpolationManager's columns, -1 while not running
+        self._index: int = -1
+        self._from: float = start if start is not None else 0
+        self._group: TweenGroup | None = None
+        self._manager: InterpolationManager | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._index >= 0
+
+    def cancel(self) -> None:
+        """Stop the tween where it is, if it is running."""
+        if self.active:
+            assert self._manager is not None
+            self._manager.remove_interpolation(self)
+
+    def _resolve_start(self) -> None:
+        self._from = (
+            self.start if self.start is not None else getattr(self.obj, self.attr)
+        )
+
+    def _finished(self) -> None:
+        group, self._group = self._group, None
+        if self.on_complete is not None:
+            self.on_complete()
+        if group is not None:
+            group._step_done()
+
+    def _cancelled(self) -> None:
+        group, self._group = self._group, None
+        if group is not None:
+            group.cancel()
+
+    def value_at(self, t: float) -> float:
+        value = self._from + (self.end - self._from) * _ease(self.easing_mode, t)
+        return float(value) if self.floating_point else int(value)
 
     def update(self, delta_time: float) -> bool:
+        """Advance a tween that is not managed; returns False once finished."""
+        if self.elapsed_time == 0:
+            self._resolve_start()
         self.elapsed_time += delta_time
         t = self.elapsed_time / self.duration
         if self.elapsed_time >= self.duration:
             t = 1
+        setattr(self.obj, self.attr, self.value_at(t))
+        return t != 1
 
-        # LINEAR as default
-        value = self.start + (self.end - self.start) * t
 
-        if self.easing_mode == self.EASE_IN:
-            value = self.start + (self.end - self.start) * t * t
-        elif self.easing_mode == self.EASE_OUT:
-            value = self.start + (self.end - self.start) * (1 - (1 - t) * (1 - t))
-        elif self.easing_mode == self.EASE_IN_OUT:
-            if t < 0.5:
-                value = self.start + (self.end - self.start) / 2 * t * t * 2
-            else:
-                value = (
-                    self.start
-                    + (self.end - self.start)
-                    / 2
-                    * (1 - (1 - (t * 2 - 1)) * (1 - (t * 2 - 1)))
-                    + (self.end - self.start) / 2
-                )
-
-        setattr(self.obj, self.attr, value if self.floating_point else int(value))
-        return t != 1
+class Delay(Interpolation):
+    """Waits ``duration`` ms; a pause between the steps of a Sequence."""
+
+    def __init__(
+        self, duration: float, on_complete: Callable[[], None] | None = None
+    ) -> None:
+        self.progress: float = 0
+        super().__init__(
+            self,
+            "progress",
+            0,
+            1,
+            duration,
+            floating_point=True,
+            on_complete=on_complete,
+        )
+
+
+# A group step: a tween, a nested group, or a plain callback run in passing
+Step = Union[Interpolation, "TweenGroup", Callable[[], None]]
+
+
+class TweenGroup:
+    """Runs tweens, nested groups and callbacks; see Sequence and Parallel.
+
+    Groups run on an InterpolationManager, so they need no polling from
+    game code. ``on_complete`` is called when every step is done. Cancelling
+    a group stops its running steps, and a step that is cancelled or
+    replaced by another tween cancels its group.
+    """
+
+    def __init__(
+        self, *steps: Step, on_complete: Callable[[], None] | None = None
+    ) -> None:
+        self.steps: list[Step] = list(steps)
+        self.on_complete = on_complete
+        self.active: bool = False
+        self._manager: InterpolationManager | None = None
+        self._group: TweenGroup | None = None
+
+    def start(self, manager: InterpolationManager | None = None) -> TweenGroup:
+        self._manager = manager if manager is not None else InterpolationManager()
+        self.active = True
+        self._begin()
+        return self
+
+    def cancel(self) -> None:
+        if not self.active:
+            return
+        self.active = False
+        for step in self._running_steps():
+            if isinstance(step, TweenGroup):
+                step.cancel()
+            elif isinstance(step, Interpolation):
+                step._group = None
+                step.cancel()
+        group, self._group = self._group, None
+        if group is not None:
+            group.cancel()
+
+    def _run(self, step: Step) -> bool:
+        """Start ``step``; returns False if it already completed."""
+        assert self._manager is not None
+        if isinstance(step, Interpolation):
+            step._group = self
+            self._manager.add_interpolation(step)
+        elif isinstance(step, TweenGroup):
+            step._group = self
+            step.start(self._manager)
+        else:
+            step()
+            return False
+        return True
+
+    def _complete(self) -> None:
+        self.active = False
+        group, self._group = self._group, None
+        if self.on_complete is not None:
+            self.on_complete()
+        if group is not None:
+            group._step_done()
+
+    def _begin(self) -> None:
+        raise NotImplementedError
+
+    def _step_done(self) -> None:
+        raise NotImplementedError
+
+    def _running_steps(self) -> list[Step]:
+        raise NotImplementedError
+
+
+class Sequence(TweenGroup):
+    """Runs its steps one after another."""
+
+    def _begin(self) -> None:
+        self._current = -1
+        self._advance()
+
+    def _advance(self) -> None:
+        while self.active:
+            self._current += 1
+            if self._current == len(self.steps):
+                self._complete()
+                return
+            if self._run(self.steps[self._current]):
+                return
+
+    def _step_done(self) -> None:
+        self._advance()
+
+    def _running_steps(self) -> list[Step]:
+        return [self.steps[self._current]] if self._current < len(self.steps) else []
+
+
+class Parallel(TweenGroup):
+    """Runs its steps together; done when the longest one is."""
+
+    def _begin(self) -> None:
+        self._remaining = len(self.steps)
+        for step in self.steps:
+            if not self.active:
+                return
+            if not self._run(step):
+                self._remaining -= 1
+        if self.active and self._remaining == 0:
+            self._complete()
+
+    def _step_done(self) -> None:
+        self._remaining -= 1
+        if self._remaining == 0 and self.active:
+            self._complete()
+
+    def _running_steps(self) -> list[Step]:
+        return self.steps
 
 
 class InterpolationManager(metaclass=Singleton):
-    def __init__(self) -> None:
+    """Runs every active tween in one batched step per frame.
+
+    Tween parameters live in parallel columns (one row per tween) that are
+    evaluated together, with NumPy when it is installed. Attributes are only
+    written when their value changed, and finished or cancelled tweens are
+    swap-removed, so removal costs O(1) regardless of how many tweens run.
+    ``interpolations`` lists the running tweens in row order.
+
+    Each (object, attribute) pair is driven by at most one tween: starting
+    a tween on a pair replaces the one running on it.
+    """
+
+    def __init__(self, capacity: int = 64, use_numpy: bool | None = None) -> None:
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise RuntimeError("InterpolationManager(use_numpy=True) requires numpy")
         self.interpolations: list[Interpolation] = []
+        self.columns: dict[str, Any] = {}
+        self.capacity: int = 0
+        self._by_target: dict[int, list[Interpolation]] = {}
+        self._allocate(max(1, capacity))
+
+    def __len__(self) -> int:
+        return len(self.interpolations)
+
+    def _allocate(self, capacity: int) -> None:
+        count = len(self.interpolations)
+        for name in _COLUMNS:
+            old = self.columns.get(name)
+            if self.use_numpy:
+                assert np is not None
+                column = np.zeros(capacity, dtype=np.float64)
+            else:
+                # Plain lists index faster than arrays, which box every read
+                column = [0.0] * capacity
+            if old is not None:
+                column[:count] = old[:count]
+            self.columns[name] = column
+        self.capacity = capacity
 
     def add_interpolation(self, interpolation: Interpolation) -> None:
+        """Start ``interpolation`` from the beginning, restarting it if running.
+
+        A different tween running on the same attribute is cancelled.
+        """
         interpolation.elapsed_time = 0
-        self.interpolations.append(interpolation)
+        interpolation._resolve_start()
+        index = interpolation._index
+        if index < 0:
+            for other in self._by_target.get(id(interpolation.obj), ()):
+                if other.attr == interpolation.attr:
+                    self._stop(other)
+                    break
+            index = len(self.interpolations)
+            if index == self.capacity:
+                self._allocate(self.capacity * 2)
+            interpolation._index = index
+            interpolation._manager = self
+            self.interpolations.append(interpolation)
+            self._by_target.setdefault(id(interpolation.obj), []).append(interpolation)
+        c = self.columns
+        c["start"][index] = interpolation._from
+        c["change"][index] = interpolation.end - interpolation._from
+        c["duration"][index] = interpolation.duration
+        c["elapsed"][index] = 0
+        c["easing"][index] = interpolation.easing_mode
+        c["floating"][index] = interpolation.floating_point
+        # NaN never compares equal, so the first update always writes
+        c["last"][index] = math.nan
+
+    def tween(
+        self,
+        obj: Any,
+        attr: str,
+        end: float,
+        duration: float,
+        easing_mode: int = Interpolation.LINEAR,
+        start: float | None = None,
+        floating_point: bool = False,
+        on_complete: Callable[[], None] | None = None,
+    ) -> Interpolation:
+        """Start tweening ``obj.attr`` to ``end``, from its current value by
+        default, and return the running tween."""
+        interpolation = Interpolation(
+            obj, attr, start, end, duration, easing_mode, floating_point, on_complete
+        )
+        self.add_interpolation(interpolation)
+        return interpolation
 
     def remove_interpolation(self, interpolation: Interpolation) -> None:
-        self.interpolations.remove(interpolation)
+        index = interpolation._index
+        running = self.interpolations
+        if not 0 <= index < len(running) or running[index] is not interpolation:
+            raise ValueError("interpolation is not running")
+        self._stop(interpolation)
+
+    def cancel(self, obj: Any, attr: str | None = None) -> int:
+        """Stop the tweens driving ``obj`` (only ``attr`` if given).
+
+        Attributes keep their current values. Returns how many were stopped.
+        """
+        targets = self._by_target.get(id(obj))
+        if not targets:
+            return 0
+        cancelled = [i for i in targets if attr is None or i.attr == attr]
+        for interpolation in cancelled:
+            if interpolation.active:
+                self._stop(interpolation)
+        return len(cancelled)
+
+    def _stop(self, interpolation: Interpolation) -> None:
+        self._remove(interpolation)
+        interpolation._cancelled()
+
+    def _remove(self, interpolation: Interpolation) -> None:
+        index = interpolation._index
+        interpolation.elapsed_time = float(self.columns["elapsed"][index])
+        interpolation._index = -1
+        targets = self._by_target[id(interpolation.obj)]
+        targets.remove(interpolation)
+        if not targets:
+            del self._by_target[id(interpolation.obj)]
+
+        # Move the last row into the freed one
+        last = len(self.interpolations) - 1
+        moved = self.interpolations.pop()
+        if index != last:
+            for column in self.columns.values():
+                column[index] = column[last]
+            self.interpolations[index] = moved
+            moved._index = index
 
     def update(self, delta_time: float) -> None:
-        self.interpolations = [
-            interpolation
-            for interpolation in self.interpolations
-            if interpolation.update(delta_time)
-        ]
+        if not self.interpolations:
+            return
+        if self.use_numpy:
+            finished = self._step_numpy(delta_time)
+        else:
+            finished = self._step_python(delta_time)
+        # Highest rows first, so swap-removal never moves a finished tween
+        done = [self.interpolations[index] for index in sorted(finished, reverse=True)]
+        for interpolation in done:
+            self._remove(interpolation)
+        # Callbacks run last, as they may start or cancel other tweens
+        for interpolation in reversed(done):
+            interpolation._finished()
+
+    def _step_numpy(self, delta_time: float) -> list[int]:
+        assert np is not None
+        n = len(self.interpolations)
+        c = {name: column[:n] for name, column in self.columns.items()}
+        elapsed = c["elapsed"]
+        elapsed += delta_time
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(elapsed >= c["duration"], 1.0, elapsed / c["duration"])
+
+        easing = c["easing"]
+        u = 2 * t - 1
+        eased = np.select(
+            [
+                easing == Interpolation.EASE_IN,
+                easing == Interpolation.EASE_OUT,
+                (easing == Interpolation.EASE_IN_OUT) & (t < 0.5),
+                easing == Interpolation.EASE_IN_OUT,
+            ],
+            [
+                t * t,
+                1 - (1 - t) * (1 - t),
+                2 * t * t,
+                0.5 + 0.5 * (1 - (1 - u) * (1 - u)),
+            ],
+            t,
+        )
+        values = c["start"] + c["change"] * eased
+        values = np.where(c["floating"] != 0, values, np.trunc(values))
+
+        changed = np.flatnonzero(values != c["last"])
+        c["last"][:] = values
+        interpolations = self.interpolations
+        for index, value in zip(
+            changed.tolist(), values[changed].tolist(), strict=True
+        ):
+            interpolation = interpolations[index]
+            if not interpolation.floating_point:
+                value = int(value)
+            setattr(interpolation.obj, interpolation.attr, value)
+        return np.flatnonzero(t == 1.0).tolist()
+
+    def _step_python(self, delta_time: float) -> list[int]:
+        c = self.columns
+        elapsed, lasts = c["elapsed"], c["last"]
+        rows = zip(
+            self.interpolations,
+            c["start"],
+            c["change"],
+            c["duration"],
+            elapsed,
+            c["easing"],
+            lasts,
+        )
+        finished: list[int] = []
+        for index, (
+            interpolation,
+            start,
+            change,
+            duration,
+            time,
+            easing,
+            last,
+        ) in enumerate(rows):
+            time += delta_time
+            elapsed[index] = time
+            t = 1.0 if time >= duration else time / duration
+            if t == 1.0:
+                finished.append(index)
+            if easing == _LINEAR:
+                value = start + change * t
+            else:
+                value = start + change * _ease(easing, t)
+            if not interpolation.floating_point:
+                value = int(value)
+            if value != last:
+                lasts[index] = value
+                setattr(interpolation.obj, interpolation.attr, value)
+        return finished
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import pygame
+
+from ._assets import (
+    ENGINE_MANIFEST,
+    AssetManifest,
+    _frame_names,
+    asset_cache,
+    decode_surface,
+)
+from .game import Game, GameMode, mark_dirty
+from .sound import _DEFAULT_SOUNDS, load_default_sound, load_sound
+
+
+class AssetLoader:
+    """Decodes images and sounds on a thread pool.
+
+    Worker threads only read and decode files. Converting surfaces to the
+    display format and filling the asset cache happen in poll(), which the
+    main thread calls once per frame, so it never waits on I/O.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="battle_engine-loader"
+        )
+        self._pending: list[tuple[Future[Any], Callable[[Any], None] | None]] = []
+        self.total: int = 0
+        self.completed: int = 0
+
+    @property
+    def progress(self) -> float:
+        """Fraction of submitted jobs that have been finished by poll()."""
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return self.completed == self.total
+
+    def submit(
+        self, load: Callable[[], Any], on_done: Callable[[Any], None] | None = None
+    ) -> Future[Any]:
+        """Run ``load`` on a worker; ``on_done`` gets its result in poll()."""
+        future = self._executor.submit(load)
+        self._pending.append((future, on_done))
+        self.total += 1
+        return future
+
+    def load_surface(self, relative: str) -> Future[Any]:
+        def load() -> pygame.Surface | None:
+            if asset_cache.in_atlas(relative):
+                return None
+            return decode_surface(relative)
+
+        def store(decoded: pygame.Surface | None) -> None:
+            if decoded is not None:
+                asset_cache.put(relative, decoded)
+
+        return self.submit(load, store)
+
+    def load_frames(self, prefix: str, extension: str = "png") -> Future[Any]:
+        def load() -> dict[str, pygame.Surface] | None:
+            if asset_cache.in_atlas(f"{prefix}.{extension}"):
+                return None
+            names = _frame_names(prefix, extension)
+            return {name: decode_surface(name) for name in names}
+
+        def store(decoded: dict[str, pygame.Surface] | None) -> None:
+            if decoded is not None:
+                asset_cache.put_frames(prefix, extension, decoded)
+
+        return self.submit(load, store)
+
+    def load_manifest(self, manifest: AssetManifest) -> None:
+        for relative in manifest.get("surfaces", ()):
+            self.load_surface(relative)
+        for prefix in manifest.get("frames", ()):
+            self.load_frames(prefix)
+
+    def load_sounds(self, paths: Iterable[str]) -> None:
+        """Decode sound files into the cache SoundManager loads from."""
+        for path in paths:
+            self.submit(lambda path=path: load_sound(path))
+
+    def load_engine_assets(self) -> None:
+        """Queue everything Battle and SoundManager load on construction."""
+        self.load_manifest(ENGINE_MANIFEST)
+        for _, filename, _ in _DEFAULT_SOUNDS:
+            self.submit(lambda filename=filename: load_default_sound(filename))
+
+    def poll(self) -> None:
+        """Finish completed jobs; re-raises errors from failed loads."""
+        pending: list[tuple[Future[Any], Callable[[Any], None] | None]] = []
+        for future, on_done in self._pending:
+            if not future.done():
+                pending.append((future, on_done))
+                continue
+            self.completed += 1
+            result = future.result()
+            if on_done is not None:
+                on_done(result)
+        self._pending = pending
+
+    def wait(self) -> None:
+        """Block until every job has finished, then poll()."""
+        for future, _ in self._pending:
+            future.exception()
+        self.poll()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LoadingMode(GameMode):
+    """Shows a progress bar until ``loader`` is done, then switches modes.
+
+    ``next_mode`` is called to build the next GameMode only after loading
+    finishes, so its constructor finds every asset already cached::
+
+        loader = AssetLoader()
+        loader.load_engine_assets()
+        game.set_mode(LoadingMode(game, loader, PapyrusBattle))
+    """
+
+    BAR_SIZE = (300, 20)
+
+    def __init__(
+        self,
+        game: Game,
+        loader: AssetLoader,
+        next_mode: Callable[[], GameMode],
+    ) -> None:
+        super().__init__(game)
+        self.loader = loader
+        self.next_mode = next_mode
+        self.finished: bool = False
+
+    def get_bar_rect(self) -> pygame.Rect:
+        rect = pygame.Rect((0, 0), self.BAR_SIZE)
+        rect.center = self.game.surface.get_rect().center
+        return rect
+
+    def update(self, surface: pygame.Surface) -> None:
+        if self.finished:
+            return
+        completed = self.loader.completed
+        self.loader.poll()
+        if self.loader.completed != completed:
+            mark_dirty(self.get_bar_rect())
+        if self.loader.done:
+            self.finished = True
+            self.loader.shutdown()
+            self.game.set_mode(self.next_mode())
+
+    def render(self, surface: pygame.Surface) -> None:
+        rect = self.get_bar_rect()
+        pygame.draw.rect(surface, (255, 255, 255), rect, 2)
+        fill = rect.inflate(-8, -8)
+        fill.width = int(fill.width * self.loader.progress)
+        if fill.width:
+            pygame.draw.rect(surface, (255, 255, 0), fill)
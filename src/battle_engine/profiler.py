@@ -0,0 +1,203 @@
+"""Per-frame timing of the engine's subsystems.
+
+While profiling is enabled (``game.set_profiling(True)`` or F3), Game and
+Battle time their work into named sections with ``time.perf_counter_ns``:
+
+    events              Game.process_events
+    update              Game.update, of which
+      update.interpolations, update.text, update.state (including the
+      round it runs), update.round, update.enemies, update.objects, update.ui
+    render              Game.render, of which
+      render.background, render.ui, render.enemies, render.state,
+      render.objects, render.soul, render.overlay, render.present
+
+Sections are summed per frame, and the last ``capacity`` frames are kept.
+A frame starts at ``process_events``, so loops that drive the game by hand
+are profiled too. When profiling is off ``game.profiler`` is None and each
+hook costs one attribute check.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+from .fonts import draw_text
+
+now = time.perf_counter_ns
+
+
+class FrameProfiler:
+    """Ring buffer of per-frame section timings, in nanoseconds."""
+
+    def __init__(self, capacity: int = 300) -> None:
+        self.capacity = capacity
+        self.frames: deque[dict[str, int]] = deque(maxlen=capacity)
+        self.sections: list[str] = []
+        self._current: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def begin_frame(self) -> None:
+        """Close the frame in progress, if any, and start a new one."""
+        self.end_frame()
+        self._current = {}
+
+    def end_frame(self) -> None:
+        current = self._current
+        if current is None:
+            return
+        self._current = None
+        current["frame"] = sum(
+            elapsed for name, elapsed in current.items() if "." not in name
+        )
+        self.frames.append(current)
+
+    def lap(self, section: str, start: int) -> int:
+        """Add the time since ``start`` to ``section``; returns the new start."""
+        end = now()
+        current = self._current
+        if current is None:
+            current = self._current = {}
+        if section not in current:
+            if section not in self.sections:
+                self.sections.append(section)
+            current[section] = end - start
+        else:
+            current[section] += end - start
+        return end
+
+    def clear(self) -> None:
+        self.frames.clear()
+        self._current = None
+
+    def samples(self, section: str) -> list[float]:
+        """The section's time in each recorded frame, in milliseconds."""
+        return [frame.get(section, 0) / 1e6 for frame in self.frames]
+
+    def percentile(self, section: str, q: float) -> float:
+        """The ``q``-th percentile (0-100) of a section, in milliseconds."""
+        samples = sorted(self.samples(section))
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, max(0, math.ceil(q / 100 * len(samples)) - 1))
+        return samples[index]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Mean, p50, p95, p99 and max of every section, in milliseconds."""
+        result: dict[str, dict[str, float]] = {}
+        for section in ["frame", *self.sections]:
+            samples = self.samples(section)
+            result[section] = {
+                "mean": sum(samples) / len(samples) if samples else 0.0,
+                "p50": self.percentile(section, 50),
+                "p95": self.percentile(section, 95),
+                "p99": self.percentile(section, 99),
+                "max": max(samples, default=0.0),
+            }
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sections": ["frame", *self.sections],
+            "frames": [
+                {name: elapsed / 1e6 for name, elapsed in frame.items()}
+                for frame in self.frames
+            ],
+            "summary": self.summary(),
+        }
+
+    def dump_json(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    def dump_csv(self, path: str | Path) -> None:
+        """One row per frame and one column per section, in milliseconds."""
+        columns = ["frame", *self.sections]
+        with Path(path).open("w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["index", *columns])
+            for index, frame in enumerate(self.frames):
+                writer.writerow(
+                    [index, *(frame.get(name, 0) / 1e6 for name in columns)]
+                )
+
+
+class ProfilerOverlay:
+    """Draws frame times and section percentiles over the game.
+
+    The graph shows the last frames against the frame budget, with lines at
+    the p50 and p95 frame time. The table is refreshed a few times a second.
+    """
+
+    GRAPH_SIZE = (200, 60)
+    REFRESH_FRAMES = 10
+    TEXT_SIZE = 12
+    LINE_HEIGHT = 13
+
+    def __init__(self, profiler: FrameProfiler, budget_ms: float) -> None:
+        self.profiler = profiler
+        self.budget_ms = budget_ms
+        self._table: pygame.Surface | None = None
+        self._frames_until_refresh = 0
+
+    def _refresh(self) -> None:
+        """Render the percentile table once; it is blitted until the next refresh."""
+        rows = [("ms", "p50", "p95")]
+        rows.extend(
+            (name, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}")
+            for name, stats in self.profiler.summary().items()
+        )
+        width = self.GRAPH_SIZE[0]
+        table = pygame.Surface((width, len(rows) * self.LINE_HEIGHT), pygame.SRCALPHA)
+        white = (255, 255, 255)
+        for i, (name, p50, p95) in enumerate(rows):
+            y = i * self.LINE_HEIGHT
+            draw_text(table, name, self.TEXT_SIZE, white, 0, y)
+            draw_text(table, p50, self.TEXT_SIZE, white, width - 45, y, "topright")
+            draw_text(table, p95, self.TEXT_SIZE, white, width, y, "topright")
+        self._table = table
+        self._frames_until_refresh = self.REFRESH_FRAMES
+
+    def render(self, surface: pygame.Surface) -> None:
+        if self._table is None or self._frames_until_refresh <= 0:
+            self._refresh()
+        self._frames_until_refresh -= 1
+        assert self._table is not None
+
+        width, height = self.GRAPH_SIZE
+        panel = pygame.Rect(4, 4, width + 8, height + 12 + self._table.get_height())
+        shade = pygame.Surface(panel.size)
+        shade.set_alpha(180)
+        surface.blit(shade, panel)
+
+        graph = pygame.Rect(panel.x + 4, panel.y + 4, width, height)
+        scale = height / (self.budget_ms * 2)
+        frames = self.profiler.samples("frame")[-width:]
+        for x, elapsed in enumerate(frames):
+            bar = min(height, max(1, int(elapsed * scale)))
+            color = (0, 200, 0) if elapsed <= self.budget_ms else (220, 40, 40)
+            pygame.draw.line(
+                surface,
+                color,
+                (graph.x + x, graph.bottom - 1),
+                (graph.x + x, graph.bottom - bar),
+            )
+        for q, color in ((50, (255, 255, 255)), (95, (255, 220, 0))):
+            y = graph.bottom - min(
+                height, int(self.profiler.percentile("frame", q) * scale)
+            )
+            pygame.draw.line(surface, color, (graph.x, y), (graph.right - 1, y))
+        budget_y = graph.bottom - int(self.budget_ms * scale)
+        pygame.draw.line(
+            surface, (90, 90, 90), (graph.x, budget_y), (graph.right - 1, budget_y)
+        )
+
+        surface.blit(self._table, (graph.x, graph.bottom + 4))
@@ -0,0 +1,290 @@
+"""Record a battle's input and replay it bit-for-bit.
+
+A battle draws all gameplay randomness from ``Battle.rng``, so its seed plus
+the input of every tick (held keys, key events and the frame's delta time)
+determine the whole run. InputRecorder captures exactly that into a compact
+binary log, and replay() plays a log back headless as fast as possible::
+
+    recorder = InputRecorder(battle)
+    game.input_provider = recorder
+    game.run()
+    recorder.log.save("papyrus.replay")
+
+    battle = replay(ReplayLog.load("papyrus.replay"), PapyrusBattle)
+    print(battle_digest(battle))
+
+Only the keys in ``ReplayLog.keys`` are recorded, and the game only sees
+those keys while recording, so both runs get identical input.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pygame
+
+from .battle.objects import BattleObject
+from .constants import CONFIRM_BUTTON, DISMISS_BUTTON, MENU_BUTTON
+from .context import EngineContext
+from .game import Game, InputProvider, KeyState, PressedKeys
+
+if TYPE_CHECKING:
+    from .battle.core import Battle
+
+MAGIC = b"BERP"
+VERSION = 2
+
+# Every key the battle reacts to; at most 32 so held keys fit one bitmask
+TRACKED_KEYS: tuple[int, ...] = (
+    pygame.K_UP,
+    pygame.K_DOWN,
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    *CONFIRM_BUTTON,
+    DISMISS_BUTTON,
+    MENU_BUTTON,
+    pygame.K_q,
+    pygame.K_e,
+)
+
+_HEADER = struct.Struct("<4sBQB")
+_KEY = struct.Struct("<i")
+_DELTA = struct.Struct("<d")
+_HELD = struct.Struct("<I")
+_COUNT = struct.Struct("<H")
+_EVENT = struct.Struct("<BB")
+
+# Tick flags: which fields follow; unchanged fields are left out
+_NEW_DELTA = 1
+_NEW_HELD = 2
+_HAS_EVENTS = 4
+
+_EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP)
+
+
+class ReplayTick:
+    """Input of one frame: delta time, held-key bitmask and key events.
+
+    Events are (0 for KEYDOWN or 1 for KEYUP, index into the log's keys).
+    """
+
+    def __init__(
+        self, delta: float, held: int = 0, events: list[tuple[int, int]] | None = None
+    ) -> None:
+        self.delta = delta
+        self.held = held
+        self.events: list[tuple[int, int]] = events if events is not None else []
+
+
+class ReplayLog:
+    """A battle seed and the input of every tick, in a binary file format.
+
+    Each tick is one flags byte, followed only by what changed since the
+    previous tick, so idle frames cost a single byte.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        keys: Iterable[int] = TRACKED_KEYS,
+        ticks: list[ReplayTick] | None = None,
+    ) -> None:
+        self.seed = seed
+        self.keys: tuple[int, ...] = tuple(keys)
+        if len(self.keys) > 32:
+            raise ValueError("a replay log can track at most 32 keys")
+        self.ticks: list[ReplayTick] = ticks if ticks is not None else []
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def to_bytes(self) -> bytes:
+        parts = [_HEADER.pack(MAGIC, VERSION, self.seed, len(self.keys))]
+        parts.extend(_KEY.pack(key) for key in self.keys)
+        delta: float | None = None
+        held = 0
+        for tick in self.ticks:
+            flags = 0
+            fields: list[bytes] = []
+            if tick.delta != delta:
+                flags |= _NEW_DELTA
+                fields.append(_DELTA.pack(tick.delta))
+                delta = tick.delta
+            if tick.held != held:
+                flags |= _NEW_HELD
+                fields.append(_HELD.pack(tick.held))
+                held = tick.held
+            if tick.events:
+                flags |= _HAS_EVENTS
+                fields.append(_COUNT.pack(len(tick.events)))
+                fields.extend(_EVENT.pack(*event) for event in tick.events)
+            parts.append(bytes((flags,)))
+            parts.extend(fields)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ReplayLog:
+        magic, version, seed, key_count = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a battle replay")
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        offset = _HEADER.size
+        keys = []
+        for _ in range(key_count):
+            keys.append(_KEY.unpack_from(data, offset)[0])
+            offset += _KEY.size
+        log = cls(seed, keys)
+        delta = 0.0
+        held = 0
+        while offset < len(data):
+            flags = data[offset]
+            offset += 1
+            if flags & _NEW_DELTA:
+                delta = _DELTA.unpack_from(data, offset)[0]
+                offset += _DELTA.size
+            if flags & _NEW_HELD:
+                held = _HELD.unpack_from(data, offset)[0]
+                offset += _HELD.size
+            events: list[tuple[int, int]] = []
+            if flags & _HAS_EVENTS:
+                count = _COUNT.unpack_from(data, offset)[0]
+                offset += _COUNT.size
+                for _ in range(count):
+                    events.append(_EVENT.unpack_from(data, offset))
+                    offset += _EVENT.size
+            log.ticks.append(ReplayTick(delta, held, events))
+        return log
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> ReplayLog:
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class InputRecorder(InputProvider):
+    """Passes input from ``source`` through to the game and logs every tick.
+
+    Recording restarts the battle's RNG from its seed; replay() does the
+    same, so both runs see identical random draws from here on. Only
+    variable-timestep games can be recorded, as the fixed-timestep loop
+    derives its updates from wall-clock time the log does not hold.
+    """
+
+    def __init__(
+        self,
+        battle: Battle,
+        source: InputProvider | None = None,
+        keys: Iterable[int] = TRACKED_KEYS,
+    ) -> None:
+        self.source = source if source is not None else InputProvider()
+        self.log = ReplayLog(battle.reseed(battle.seed), keys)
+        self._indices = {key: i for i, key in enumerate(self.log.keys)}
+        self._tick: ReplayTick | None = None
+
+    def get_pressed(self, game: Game) -> KeyState:
+        if game.fixed_timestep:
+            raise ValueError("cannot record a game running with a fixed timestep")
+        keys = self.source.get_pressed(game)
+        held = 0
+        for i, key in enumerate(self.log.keys):
+            if keys[key]:
+                held |= 1 << i
+        self._tick = ReplayTick(game.delta_time, held)
+        self.log.ticks.append(self._tick)
+        return _held_keys(self.log.keys, held)
+
+    def get_events(self, game: Game) -> list[pygame.event.Event]:
+        assert self._tick is not None, "get_pressed() starts every tick"
+        events = self.source.get_events(game)
+        for event in events:
+            if event.type in _EVENT_TYPES and event.key in self._indices:
+                kind = _EVENT_TYPES.index(event.type)
+                self._tick.events.append((kind, self._indices[event.key]))
+        return events
+
+
+class InputReplayer(InputProvider):
+    """Feeds a ReplayLog back to the game, including each tick's delta time.
+
+    Once the log runs out the game stops running.
+    """
+
+    def __init__(self, log: ReplayLog) -> None:
+        self.log = log
+        self.index: int = 0
+        self._tick: ReplayTick | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.index >= len(self.log.ticks)
+
+    def get_pressed(self, game: Game) -> KeyState:
+        if self.finished:
+            game.running = False
+            self._tick = None
+            return PressedKeys()
+        self._tick = self.log.ticks[self.index]
+        self.index += 1
+        game.delta_time = self._tick.delta
+        return _held_keys(self.log.keys, self._tick.held)
+
+    def get_events(self, game: Game) -> list[pygame.event.Event]:
+        pygame.event.pump()
+        if self._tick is None:
+            return []
+        return [
+            pygame.event.Event(_EVENT_TYPES[kind], key=self.log.keys[index], mod=0)
+            for kind, index in self._tick.events
+        ]
+
+
+def _held_keys(keys: tuple[int, ...], held: int) -> PressedKeys:
+    return PressedKeys(key for i, key in enumerate(keys) if held >> i & 1)
+
+
+def replay(log: ReplayLog, battle_factory: Callable[[], Battle]) -> Battle:
+    """Play ``log`` in a fresh EngineContext and return the finished battle.
+
+    ``battle_factory`` must build the same kind of battle that was recorded.
+    Nothing is drawn; the result can be checked with battle_digest().
+    """
+    with EngineContext():
+        game = Game(headless=True, render=False)
+        battle = battle_factory()
+        game.set_mode(battle)
+        battle.reseed(log.seed)
+        replayer = InputReplayer(log)
+        game.input_provider = replayer
+        while not replayer.finished:
+            game.process_events()
+            game.update()
+        return battle
+
+
+def battle_digest(battle: Battle) -> str:
+    """Hash of the gameplay state two equal runs must agree on."""
+    player = battle.player_stats.player
+    soul = battle.player_object
+    state = (
+        battle.current_round.time if battle.current_round is not None else None,
+        player.health,
+        player.invulnerability_time,
+        tuple(soul.rect),
+        soul.rotation,
+        [(enemy.health, tuple(enemy.position)) for enemy in battle.enemies],
+        [type(state).__name__ for state in battle.gameStateStack],
+        [
+            (type(obj).__name__, tuple(obj.position), obj.rotation)
+            for obj in battle.objects
+            if isinstance(obj, BattleObject)
+        ],
+        battle.rng.getstate(),
+    )
+    return hashlib.sha256(repr(state).encode()).hexdigest()
@@ -0,0 +1,292 @@
+"""Batch simulation of battle rounds for balancing and regression tests.
+
+Every run plays one ``Round`` in a headless ``Battle`` with the soul driven by
+an input policy, and reports how much damage the soul took. Runs are spread
+across worker processes, each with its own game, so throughput scales with
+the number of cores::
+
+    stats = simulate(BoneRound, runs=1000, policy=random_walk_policy)
+    print(stats.death_rate, stats.mean_damage)
+
+or from a shell::
+
+    python -m battle_engine.sim examples.papyrus.main:TestRound --runs 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import pygame
+
+from .context import EngineContext
+from .game import FPS, Game, InputProvider, KeyState, PressedKeys
+
+if TYPE_CHECKING:
+    from .battle.core import Battle, Round
+
+# Maps (game, rng) to the keys held for the next frame. game.keys_pressed
+# still holds the previous frame's keys when the policy is asked.
+InputPolicy = Callable[[Game, random.Random], KeyState]
+RoundFactory = Callable[["Battle"], "Round"]
+BattleFactory = Callable[[], "Battle"]
+
+_DIRECTIONS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
+
+
+def idle_policy(game: Game, rng: random.Random) -> KeyState:
+    """Never move."""
+    return PressedKeys()
+
+
+def random_walk_policy(game: Game, rng: random.Random) -> KeyState:
+    """Hold a random direction (or none), changing it a few times a second."""
+    if rng.random() < 0.15:
+        count = rng.choice((0, 1, 1, 2))
+        return PressedKeys(rng.sample(_DIRECTIONS, count))
+    return game.keys_pressed
+
+
+class PolicyInput(InputProvider):
+    """Feeds a policy's held keys to the game and produces no events."""
+
+    def __init__(self, policy: InputPolicy, rng: random.Random) -> None:
+        self.policy = policy
+        self.rng = rng
+
+    def get_pressed(self, game: Game) -> KeyState:
+        return self.policy(game, self.rng)
+
+    def get_events(self, game: Game) -> list[pygame.event.Event]:
+        pygame.event.pump()
+        return []
+
+
+class SimJob:
+    """Everything one run needs; must be picklable to reach a worker."""
+
+    def __init__(
+        self,
+        seed: int,
+        round_factory: RoundFactory,
+        policy: InputPolicy = random_walk_policy,
+        battle_factory: BattleFactory | None = None,
+        max_time: float = 60_000,
+        render: bool = False,
+    ) -> None:
+        self.seed = seed
+        self.round_factory = round_factory
+        self.policy = policy
+        self.battle_factory = battle_factory
+        self.max_time = max_time
+        self.render = render
+
+
+class RunResult:
+    """Outcome of one simulated round. Times are in simulated milliseconds."""
+
+    def __init__(
+        self,
+        seed: int,
+        damage_taken: int,
+        hits: int,
+        time_to_death: float | None,
+        duration: float,
+        frames: int,
+        frame_cost_ns: float,
+    ) -> None:
+        self.seed = seed
+        self.damage_taken = damage_taken
+        self.hits = hits
+        self.time_to_death = time_to_death
+        self.duration = duration
+        self.frames = frames
+        self.frame_cost_ns = frame_cost_ns
+
+    @property
+    def died(self) -> bool:
+        return self.time_to_death is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(vars(self))
+
+
+class SimStats:
+    """Aggregate of many RunResults."""
+
+    def __init__(self, results: list[RunResult], wall_time: float = 0) -> None:
+        self.results = results
+        self.wall_time = wall_time
+        self.runs = len(results)
+        self.deaths = sum(result.died for result in results)
+        self.death_rate = self.deaths / self.runs if self.runs else 0.0
+        self.total_damage = sum(result.damage_taken for result in results)
+        self.mean_damage = self.total_damage / self.runs if self.runs else 0.0
+        self.mean_hits = sum(r.hits for r in results) / self.runs if self.runs else 0.0
+        death_times = [r.time_to_death for r in results if r.time_to_death is not None]
+        self.mean_time_to_death: float | None = (
+            sum(death_times) / len(death_times) if death_times else None
+        )
+        frames = sum(result.frames for result in results)
+        self.frames = frames
+        self.mean_frame_cost_ns = (
+            sum(r.frame_cost_ns * r.frames for r in results) / frames if frames else 0.0
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "deaths": self.deaths,
+            "death_rate": self.death_rate,
+            "mean_damage": self.mean_damage,
+            "mean_hits": self.mean_hits,
+            "mean_time_to_death": self.mean_time_to_death,
+            "frames": self.frames,
+            "mean_frame_cost_ns": self.mean_frame_cost_ns,
+            "wall_time": self.wall_time,
+        }
+
+
+def _start_round(job: SimJob) -> tuple[Battle, Round]:
+    from .battle.core import Battle
+    from .battle.states import DefendingState
+
+    game = Game()
+    if job.battle_factory is not None:
+        battle = job.battle_factory()
+        battle.reseed(job.seed)
+    else:
+        battle = Battle(game, seed=job.seed)
+    game.set_mode(battle)
+    current_round = job.round_factory(battle)
+    battle.current_round = current_round
+    battle.gameStateStack = [DefendingState()]
+    box = battle.battle_box.get_internal_rect()
+    soul = battle.player_object
+    soul.set_position(
+        box.centerx - soul.rect.width // 2, box.centery - soul.rect.height // 2
+    )
+    current_round.start()
+    return battle, current_round
+
+
+def run_once(job: SimJob) -> RunResult:
+    """Play one round in a fresh EngineContext with its own headless game."""
+    with EngineContext():
+        return _play(job)
+
+
+def _play(job: SimJob) -> RunResult:
+    game = Game(headless=True, render=job.render)
+    game.input_provider = PolicyInput(job.policy, random.Random(job.seed))
+    battle, current_round = _start_round(job)
+    player = battle.player_stats.player
+    start_health = last_health = player.health
+    hits = frames = 0
+    time_to_death: float | None = None
+    game.delta_time = 1000 / FPS
+    started = time.perf_counter_ns()
+    while current_round.active and current_round.time < job.max_time:
+        game.process_events()
+        game.update()
+        game.render()
+        frames += 1
+        if player.health < last_health:
+            hits += 1
+        last_health = player.health
+        if player.health <= 0:
+            time_to_death = current_round.time
+            break
+    elapsed = time.perf_counter_ns() - started
+    return RunResult(
+        seed=job.seed,
+        damage_taken=start_health - max(player.health, 0),
+        hits=hits,
+        time_to_death=time_to_death,
+        duration=current_round.time,
+        frames=frames,
+        frame_cost_ns=elapsed / frames if frames else 0.0,
+    )
+
+
+def simulate(
+    round_factory: RoundFactory,
+    runs: int = 100,
+    policy: InputPolicy = random_walk_policy,
+    seed: int = 0,
+    battle_factory: BattleFactory | None = None,
+    max_time: float = 60_000,
+    workers: int | None = None,
+) -> SimStats:
+    """Run ``runs`` rounds with seeds ``seed, seed + 1, ...`` and aggregate.
+
+    ``workers`` defaults to the CPU count; with ``workers=1`` everything runs
+    in this process, each run in its own EngineContext. Factories and the policy must
+    be importable top-level callables so they can be sent to workers.
+    """
+    jobs = [
+        SimJob(seed + i, round_factory, policy, battle_factory, max_time)
+        for i in range(runs)
+    ]
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    if workers == 1:
+        results = [run_once(job) for job in jobs]
+    else:
+        # Spawned workers do not inherit this process's SDL state
+        context = multiprocessing.get_context("spawn")
+        chunksize = max(1, math.ceil(runs / (workers * 4)))
+        with ProcessPoolExecutor(workers, mp_context=context) as executor:
+            results = list(executor.map(run_once, jobs, chunksize=chunksize))
+    return SimStats(results, wall_time=time.perf_counter() - started)
+
+
+_POLICIES: dict[str, InputPolicy] = {
+    "idle": idle_policy,
+    "random": random_walk_policy,
+}
+
+
+def _load_object(path: str) -> Any:
+    module_name, _, name = path.partition(":")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m battle_engine.sim",
+        description="Simulate a Round many times and print aggregate stats.",
+    )
+    parser.add_argument("round", help="Round class or factory, as module:name")
+    parser.add_argument("--battle", help="Battle class or factory, as module:name")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", choices=sorted(_POLICIES), default="random")
+    parser.add_argument("--max-time", type=float, default=60_000)
+    args = parser.parse_args(argv)
+
+    stats = simulate(
+        _load_object(args.round),
+        runs=args.runs,
+        policy=_POLICIES[args.policy],
+        seed=args.seed,
+        battle_factory=_load_object(args.battle) if args.battle else None,
+        max_time=args.max_time,
+        workers=args.workers,
+    )
+    print(json.dumps(stats.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
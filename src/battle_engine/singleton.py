@@ -1,10 +1,15 @@
 from typing import Any
 
+from .context import ContextInstances, current_context
+
 
 class Singleton(type):
-    _instances: dict[type, Any] = {}
+    """One instance per class within the current EngineContext."""
+
+    _instances: ContextInstances = ContextInstances()
 
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instances = current_context().instances
+        if cls not in instances:
+            instances[cls] = super().__call__(*args, **kwargs)
+        return instances[cls]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from enum import Enum
 
 import pygame
@@ -31,6 +32,44 @@ _DEFAULT_SOUNDS: list[tuple[str, str, SoundCategory]] = [
 ]
 
 
+# Keyed by path and mixer format, as decoded samples match the mixer's format
+_sound_cache: dict[tuple[str, tuple[int, int, int] | None], pygame.mixer.Sound] = {}
+_sound_cache_lock = threading.Lock()
+
+
+def default_sound_path(filename: str) -> str:
+    return str(_asset_path(f"audio/{filename}"))
+
+
+def load_sound(path: str) -> pygame.mixer.Sound | None:
+    """Decode a sound file once; later calls share the decoded Sound.
+
+    Safe to call from loader threads. Returns None if the file cannot be
+    decoded, e.g. when no audio device is available; a missing file raises.
+    The shared Sound is never given a volume; SoundManager sets volumes on
+    the channel it plays on.
+    """
+    key = (path, pygame.mixer.get_init())
+    with _sound_cache_lock:
+        sound = _sound_cache.get(key)
+    if sound is not None:
+        return sound
+    try:
+        sound = pygame.mixer.Sound(path)
+    except pygame.error:
+        return None
+    with _sound_cache_lock:
+        return _sound_cache.setdefault(key, sound)
+
+
+def load_default_sound(filename: str) -> pygame.mixer.Sound | None:
+    """Like load_sound for a bundled sound, which may be left out of a build."""
+    try:
+        return load_sound(default_sound_path(filename))
+    except FileNotFoundError:
+        return None
+
+
 class SoundManager(metaclass=Singleton):
     def __init__(self) -> None:
         self._sounds: dict[str, pygame.mixer.Sound | None] = {}
@@ -52,13 +91,10 @@ class SoundManager(metaclass=Singleton):
 
     def _load_defaults(self) -> None:
         for name, filename, category in _DEFAULT_SOUNDS:
-            try:
-                path = _asset_path(f"audio/{filename}")
-                sound = pygame.mixer.Sound(str(path))
+            sound = load_default_sound(filename)
+            if sound is not None:
                 self._sounds[name] = sound
                 self._categories[name] = category
-            except (pygame.error, FileNotFoundError):
-                pass
 
     def register(
         self,
@@ -75,11 +111,9 @@ class SoundManager(metaclass=Singleton):
         path: str,
         category: SoundCategory = SoundCategory.SFX,
     ) -> None:
-        try:
-            sound = pygame.mixer.Sound(path)
+        sound = load_sound(path)
+        if sound is not None:
             self.register(name, sound, category)
-        except pygame.error:
-            pass
 
     def play(
         self, name: str, channel: pygame.mixer.Channel | None = None
@@ -89,14 +123,17 @@ class SoundManager(metaclass=Singleton):
             return None
         category = self._categories.get(name, SoundCategory.SFX)
         volume = self._volumes.get(category, 1.0)
-        sound.set_volume(volume)
         try:
             if channel is not None:
                 channel.play(sound)
-                return channel
-            return sound.play()
+            else:
+                channel = sound.play()
         except pygame.error:
             return None
+        # Sounds are shared between managers, so the volume goes on the channel
+        if channel is not None:
+            channel.set_volume(volume)
+        return channel
 
     def set_volume(self, category: SoundCategory, volume: float) -> None:
         self._volumes[category] = max(0.0, min(1.0, volume))
@@ -2,7 +2,8 @@ import random
 
 import pygame
 
-from .fonts import draw_text, draw_text_size
+from .fonts import font_metrics, glyph_atlas
+from .game import mark_dirty
 
 ColorTuple = tuple[int, int, int]
 
@@ -38,7 +39,9 @@ class ProgressiveText:
         y: int = 0,
         tick_length: int = 2,
         blip_sound: str | None = "txt_default",
+        rng: random.Random | None = None,
     ) -> None:
+        self.rng = rng if rng is not None else random.Random()
         self.target_text = target_text
         self.current_text: str = ""
         self.max_width = max_width
@@ -56,6 +59,10 @@ class ProgressiveText:
         self.asterisk: bool = False
         self.target_command_positions: dict[int, list[str]] = {}
         self.target_text_clean: str = ""
+        self.layout: list[StyledText] = []
+        self._layout_key: tuple[object, ...] | None = None
+        self._canvas: pygame.Surface | None = None
+        self._canvas_chars: int = 0
         self._blip_sound_default: str | None = blip_sound
         self.blip_sound: str | None = blip_sound
         self._blip_channel: pygame.mixer.Channel | None = None
@@ -100,6 +107,12 @@ class ProgressiveText:
                 char = self.target_text_clean[pos]
                 self.current_text += char
                 self.tick = 0
+                if self._canvas is not None:
+                    mark_dirty(
+                        pygame.Rect((int(self.x), int(self.y)), self._canvas.get_size())
+                    )
+                else:
+                    mark_dirty()
 
                 # Process sound commands at this position
                 cmd_list = self.target_command_positions.get(pos)
@@ -120,15 +133,18 @@ class ProgressiveText:
         elif not self.finished:
             self.finished = True
 
-    def draw(self, surface: pygame.Surface) -> None:
-        styled_texts: list[StyledText] = []
-        x_offset = self.x
-        y_offset = self.y
+    def layout_text(self) -> list[StyledText]:
+        """Place every glyph of the clean target text relative to the origin.
+
+        Wrapping looks ahead at whole words of the target text, so glyphs keep
+        their position while the text is being revealed.
+        """
+        glyphs: list[StyledText] = []
         current_color = self.color
         current_font_name = self.font_name
         current_char_spacing = self.char_spacing
 
-        for idx, char in enumerate(self.current_text):
+        for idx, char in enumerate(self.target_text_clean):
             cmd_list = self.target_command_positions.get(idx)
 
             if cmd_list:
@@ -145,67 +161,113 @@ class ProgressiveText:
                     elif key == "sound":
                         pass  # handled in update()
 
-            if char == "\n":
-                line_height = draw_text_size(
-                    "A", self.font_size, font_name=current_font_name
-                )[1]
-                x_offset = self.x
-                y_offset += line_height
-                continue
-
-            char_width, char_height = draw_text_size(
-                char, self.font_size, font_name=current_font_name
+            glyphs.append(
+                StyledText(
+                    char,
+                    current_color,
+                    current_font_name,
+                    self.font_size,
+                    0,
+                    0,
+                    char_spacing=current_char_spacing,
+                )
             )
 
-            if char == " ":
-                word_end_idx = self.current_text.find(" ", idx + 1)
-                next_word = self.current_text[
-                    idx + 1 : word_end_idx
-                    if word_end_idx != -1
-                    else len(self.current_text)
-                ]
-                next_word_width = draw_text_size(
-                    next_word, self.font_size, font_name=current_font_name
-                )[0]
+        x_offset = 0
+        y_offset = 0
+        for idx, glyph in enumerate(glyphs):
+            glyph.x, glyph.y = x_offset, y_offset
+
+            metrics = font_metrics(glyph.font_size, glyph.font_name)
+            if glyph.text == "\n":
+                x_offset = 0
+                y_offset += metrics.height
+                continue
+
+            char_width = metrics.advance(glyph.text)
 
+            if glyph.text == " ":
+                next_word_width = self._word_width(glyphs, idx + 1)
                 if x_offset + next_word_width > self.max_width:
-                    x_offset = self.x
-                    y_offset += char_height
-
-            styled_text = StyledText(
-                char,
-                current_color,
-                current_font_name,
-                self.font_size,
-                x_offset,
-                y_offset,
+                    x_offset = 0
+                    y_offset += metrics.height
+                    glyph.x, glyph.y = x_offset, y_offset
+
+            x_offset += char_width + glyph.char_spacing
+
+        return glyphs
+
+    @staticmethod
+    def _word_width(glyphs: list[StyledText], start: int) -> int:
+        width = 0
+        for glyph in glyphs[start:]:
+            if glyph.text in (" ", "\n"):
+                break
+            metrics = font_metrics(glyph.font_size, glyph.font_name)
+            width += metrics.advance(glyph.text) + glyph.char_spacing
+        return width
+
+    def _create_canvas(self) -> pygame.Surface:
+        width = 0
+        height = 0
+        for glyph in self.layout:
+            metrics = font_metrics(glyph.font_size, glyph.font_name)
+            width = max(width, glyph.x + metrics.advance(glyph.text))
+            height = max(height, glyph.y + metrics.height)
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+
+    def _layout_settings(self) -> tuple[object, ...]:
+        return (
+            self.max_width,
+            self.font_name,
+            self.font_size,
+            self.color,
+            self.char_spacing,
+        )
+
+    def _relayout(self) -> None:
+        self.layout = self.layout_text()
+        self._layout_key = self._layout_settings()
+        self._canvas = None
+
+    def draw(self, surface: pygame.Surface) -> None:
+        # set_text lays out new text; this catches settings changed since then
+        if self._layout_settings() != self._layout_key:
+            self._relayout()
+
+        revealed = min(len(self.current_text), len(self.layout))
+        if self._canvas is None or revealed < self._canvas_chars:
+            self._canvas = self._create_canvas()
+            self._canvas_chars = 0
+
+        # Only glyphs revealed since the last draw are added to the canvas
+        for glyph in self.layout[self._canvas_chars : revealed]:
+            if glyph.text == "\n":
+                continue
+            glyph_surface, _ = glyph_atlas.get(
+                glyph.text, glyph.font_size, glyph.color, glyph.font_name
             )
-            styled_texts.append(styled_text)
-
-            x_offset += char_width + current_char_spacing
-
-        for styled_text in styled_texts:
-            draw_text(
-                surface,
-                styled_text.text,
-                styled_text.font_size,
-                styled_text.color,
-                styled_text.x,
-                styled_text.y,
-                font_name=styled_text.font_name,
+            self._canvas.blit(
+                glyph_surface,
+                (glyph.x, glyph.y),
+                special_flags=pygame.BLEND_RGBA_MAX,
             )
+        self._canvas_chars = revealed
+
+        surface.blit(self._canvas, (int(self.x), int(self.y)))
 
     def skip(self) -> None:
-        self.current_text = self.target_text
+        self.current_text = self.target_text_clean
 
     def set_text(self, text: str) -> None:
         self.target_text = text
         self.current_text = ""
+        mark_dirty()
 
         # Reset blip sound from configured default, then resolve sentinel
         self.blip_sound = self._blip_sound_default
         if self.blip_sound == "txt_default":
-            self.blip_sound = random.choice(["txt_default1", "txt_default2"])
+            self.blip_sound = self.rng.choice(["txt_default1", "txt_default2"])
 
         if "[instant]" in self.target_text:
             self.instant_command = True
@@ -221,3 +283,4 @@ class ProgressiveText:
 
         if self.instant_command:
             self.current_text = self.target_text_clean
+        self._relayout()
@@ -1,5 +1,18 @@
 import os
 
+import pytest
+
 # Use dummy video driver so tests run without a display
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def battle():
+    """A default Battle, set as the game's mode, for tests of battle objects."""
+    from battle_engine import Battle, Game
+
+    game = Game()
+    battle = Battle(game)
+    game.set_mode(battle)
+    return battle
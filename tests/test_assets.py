@@ -0,0 +1,68 @@
+import pygame
+import pytest
+
+from battle_engine import Game
+from battle_engine._assets import (
+    AssetCache,
+    asset_cache,
+    asset_frames,
+    asset_surface,
+    preload_assets,
+)
+
+
+@pytest.fixture(autouse=True)
+def display():
+    Game()
+    asset_cache.clear()
+
+
+def test_surfaces_decode_once():
+    cache = AssetCache()
+    first = cache.surface("battle/hp.png")
+    assert cache.surface("battle/hp.png") is first
+    assert len(cache) == 1
+
+
+def test_asset_surface_returns_private_copies():
+    first = asset_surface("battle/soul/soul.png")
+    first.fill((0, 0, 0, 0))
+    second = asset_surface("battle/soul/soul.png")
+    assert second is not first
+    assert second.get_bounding_rect().w > 0
+
+
+def test_surfaces_use_display_format():
+    surface = asset_cache.surface("battle/soul/soul.png")
+    assert surface.get_bitsize() == pygame.display.get_surface().get_bitsize()
+
+
+def test_frames_are_shared():
+    frames = asset_frames("battle/hit/knife")
+    assert frames
+    assert asset_frames("battle/hit/knife")[0] is frames[0]
+
+
+def test_cache_evicts_least_recently_used():
+    cache = AssetCache(max_entries=2)
+    hp = cache.surface("battle/hp.png")
+    cache.surface("battle/karma.png")
+    cache.surface("battle/hp.png")
+    cache.surface("battle/soul/soul.png")
+    assert len(cache) == 2
+    assert cache.surface("battle/hp.png") is hp
+
+
+def test_preload_warms_manifest():
+    cache = AssetCache()
+    cache.preload(
+        {"surfaces": ["battle/hp.png"], "frames": ["battle/soul/break/shard_"]}
+    )
+    assert len(cache) == 1 + len(asset_frames("battle/soul/break/shard_"))
+
+
+def test_preload_assets_accepts_absolute_paths(tmp_path):
+    path = tmp_path / "square.png"
+    pygame.image.save(pygame.Surface((3, 3)), str(path))
+    preload_assets({"surfaces": [str(path)]})
+    assert asset_surface(str(path)).get_size() == (3, 3)
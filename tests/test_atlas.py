@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+
+import pygame
+import pytest
+
+from battle_engine import Game
+from battle_engine._assets import asset_cache, asset_frames, asset_surface
+from battle_engine.atlas import TextureAtlas, build_atlas
+
+ENGINE_ASSETS = Path(__file__).parent.parent / "src" / "battle_engine" / "assets"
+
+
+def _save(path: Path, size, color):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    pygame.image.save(surface, str(path))
+
+
+@pytest.fixture
+def source(tmp_path):
+    _save(tmp_path / "src" / "big.png", (30, 20), (255, 0, 0, 255))
+    _save(tmp_path / "src" / "seq" / "run1.png", (5, 5), (0, 255, 0, 128))
+    _save(tmp_path / "src" / "seq" / "run2.png", (5, 5), (0, 0, 255, 255))
+    _save(tmp_path / "src" / "seq" / "run4.png", (5, 5), (0, 0, 0, 255))
+    return tmp_path / "src"
+
+
+def test_build_packs_frames_without_overlap(source, tmp_path):
+    atlas = build_atlas(source, tmp_path / "out" / "sheet", max_width=40)
+    rects = [pygame.Rect(frame) for frame in atlas.frames.values()]
+    assert len(rects) == 4
+    for i, rect in enumerate(rects):
+        assert atlas.sheet.get_rect().contains(rect)
+        assert rect.collidelist(rects[i + 1 :]) == -1
+
+
+def test_sequences_stop_at_first_gap(source, tmp_path):
+    atlas = build_atlas(source, tmp_path / "sheet")
+    assert atlas.sequences == {"seq/run.png": ["seq/run1.png", "seq/run2.png"]}
+
+
+def test_load_round_trips_pixels(source, tmp_path):
+    build_atlas(source, tmp_path / "sheet")
+    atlas = TextureAtlas.load(tmp_path / "sheet.json")
+    assert atlas.get("big.png").get_at((3, 3)) == (255, 0, 0, 255)
+    run1, run2 = atlas.sequence("seq/run")
+    assert run1.get_at((0, 0)) == (0, 255, 0, 128)
+    assert run2.get_at((4, 4)) == (0, 0, 255, 255)
+    assert run1.get_parent() is atlas.sheet
+
+
+def test_unknown_version_is_rejected(source, tmp_path):
+    build_atlas(source, tmp_path / "sheet")
+    index = json.loads((tmp_path / "sheet.json").read_text())
+    index["version"] = 99
+    with pytest.raises(ValueError):
+        TextureAtlas(pygame.Surface((1, 1)), index)
+
+
+def test_engine_atlas_matches_source_images():
+    atlas = TextureAtlas.load(ENGINE_ASSETS / "atlas.json")
+    names = {
+        path.relative_to(ENGINE_ASSETS).as_posix()
+        for path in ENGINE_ASSETS.rglob("*.png")
+        if path.name != "atlas.png"
+    }
+    assert set(atlas.frames) == names, "run python -m battle_engine.atlas"
+    for name in names:
+        image = pygame.image.load(str(ENGINE_ASSETS / name))
+        frame = atlas.get(name)
+        assert frame.get_size() == image.get_size()
+        keyed = image.get_colorkey() is not None
+        opaque = pygame.mask.from_surface(image)
+        for x in range(0, image.get_width(), 3):
+            for y in range(0, image.get_height(), 3):
+                expected = image.get_at((x, y))
+                if keyed and not opaque.get_at((x, y)):
+                    assert frame.get_at((x, y)).a == 0, name
+                else:
+                    assert frame.get_at((x, y)) == expected, name
+
+
+def test_engine_assets_are_served_from_atlas():
+    Game()
+    asset_cache.clear()
+    knife = asset_frames("battle/hit/knife")
+    assert len(knife) == 6
+    assert knife[0].get_parent() is knife[1].get_parent()
+    assert asset_surface("battle/hp.png").get_parent() is None
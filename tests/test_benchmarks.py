@@ -0,0 +1,268 @@
+"""Benchmarks for engine hot paths, compared against stored baselines.
+
+Skipped by default, as timings only mean something on a quiet machine::
+
+    BATTLE_ENGINE_BENCHMARK=1 pytest tests/test_benchmarks.py
+
+Each round of a benchmark is paired with a round of a fixed pure-Python
+workload, and the benchmark's cost is stored relative to it. This cancels
+out the machine being slower or faster as a whole, which would otherwise
+swamp any regression. A benchmark whose relative cost exceeds its baseline
+in benchmark_baselines.json by more than BATTLE_ENGINE_BENCHMARK_THRESHOLD
+(1.5x by default, or the spread recorded with the baseline if larger)
+emits a warning. With ``BATTLE_ENGINE_BENCHMARK=strict`` it fails instead.
+After an intended change, or on new hardware, record new baselines with
+``BATTLE_ENGINE_BENCHMARK=update``.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import time
+import warnings
+from pathlib import Path
+
+import pygame
+import pytest
+
+from battle_engine import (
+    BattleObject,
+    BulletPool,
+    Interpolation,
+    InterpolationManager,
+    Menu,
+    MenuContainer,
+    MenuItem,
+    ProgressiveText,
+    Round,
+    draw_gradient,
+)
+from battle_engine.battle.states import _ShatterEffect
+from battle_engine.drawing import rotation_cache
+from battle_engine.singleton import Singleton
+
+MODE = os.environ.get("BATTLE_ENGINE_BENCHMARK", "")
+THRESHOLD = float(os.environ.get("BATTLE_ENGINE_BENCHMARK_THRESHOLD", "1.5"))
+BASELINES = Path(__file__).with_name("benchmark_baselines.json")
+
+pytestmark = pytest.mark.skipif(
+    MODE in ("", "0"), reason="set BATTLE_ENGINE_BENCHMARK=1 to run benchmarks"
+)
+
+
+def _calibration():
+    """The fixed workload every benchmark is measured against."""
+    total = 0
+    for i in range(2000):
+        total += i * i % 7
+    return total
+
+
+def _loops(func, min_round_time):
+    """Calls of ``func`` needed for one round to last ``min_round_time``."""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= min_round_time:
+            return number
+        number *= 2
+
+
+def _time(func, number):
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) / number
+
+
+def _measure(func, rounds=15, min_round_time=0.05):
+    """Time ``func`` in rounds, each paired with a round of the calibration.
+
+    Returns the best time per call in microseconds, the median cost relative
+    to the calibration, and the spread of that cost between rounds.
+    """
+    number = _loops(func, min_round_time)
+    calibration_number = _loops(_calibration, min_round_time)
+    best = math.inf
+    costs = []
+    for _ in range(rounds):
+        calibration = _time(_calibration, calibration_number)
+        seconds = _time(func, number)
+        best = min(best, seconds)
+        costs.append(seconds / calibration)
+    return {
+        "us": round(best * 1e6, 3),
+        "relative": round(statistics.median(costs), 4),
+        "spread": round(max(costs) / min(costs), 3),
+    }
+
+
+@pytest.fixture(scope="module")
+def results():
+    measured = {}
+    yield measured
+    if MODE == "update" and measured:
+        data = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+        data["machine"] = {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        }
+        data.setdefault("benchmarks", {}).update(measured)
+        data["benchmarks"] = dict(sorted(data["benchmarks"].items()))
+        BASELINES.write_text(json.dumps(data, indent=2) + "\n")
+
+
+@pytest.fixture
+def benchmark(request, results):
+    """Time ``func`` and check it against the baseline of the running test."""
+    name = request.node.name
+
+    def run(func, **kwargs):
+        measured = _measure(func, **kwargs)
+        results[name] = measured
+        if MODE == "update":
+            return measured
+        baselines = (
+            json.loads(BASELINES.read_text()).get("benchmarks", {})
+            if BASELINES.exists()
+            else {}
+        )
+        baseline = baselines.get(name)
+        if baseline is None:
+            pytest.skip(f"no baseline for {name}: {measured['us']:.1f} us")
+        limit = max(THRESHOLD, baseline["spread"])
+        ratio = measured["relative"] / baseline["relative"]
+        if ratio > limit:
+            message = (
+                f"{name} costs {ratio:.2f}x its baseline relative to the "
+                f"calibration, over the {limit:.2f}x limit "
+                f"({measured['us']:.1f} us now, {baseline['us']:.1f} us recorded)"
+            )
+            if MODE == "strict":
+                pytest.fail(message)
+            warnings.warn(message, stacklevel=2)
+        return measured
+
+    return run
+
+
+STYLED_TEXT = " ".join(
+    f"[color:{color}]Papyrus[color:FFFFFF] attacks with bone number {i}!"
+    for i, color in zip(range(12), ["FF0000", "00FF00", "FFFF00"] * 4, strict=True)
+)
+
+
+def test_progressive_text_reveal(benchmark, battle):
+    text = ProgressiveText(max_width=540, tick_length=1, blip_sound=None)
+    surface = pygame.Surface((640, 480))
+
+    def reveal():
+        text.set_text(STYLED_TEXT)
+        while len(text.current_text) < len(text.target_text_clean):
+            text.update()
+            text.draw(surface)
+
+    benchmark(reveal, rounds=5)
+
+
+class Bone(BattleObject):
+    SPRITE = pygame.Surface((8, 40))
+
+    def __init__(self, position=(0, 0)):
+        super().__init__(self.SPRITE, position, damage=1)
+        self.direction = 1
+
+    def update(self):
+        x, y = self.position
+        if not 0 <= x <= 600:
+            self.direction = -self.direction
+        self.position = (x + 2 * self.direction, y)
+
+
+@pytest.mark.parametrize("count", [100, 1000])
+def test_round_update_with_objects(benchmark, battle, count):
+    battle.game.delta_time = 1000 / 30
+    current_round = Round(battle)
+    for i in range(count):
+        current_round.spawn(Bone, ((i * 37) % 600, (i * 53) % 440))
+    # Keep the soul out of reach so collisions are tested but never hit
+    battle.player_object.set_position(-100, -100)
+    benchmark(current_round.update)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True], ids=["python", "numpy"])
+def test_bullet_pool_update(benchmark, battle, use_numpy):
+    battle.game.delta_time = 1000 / 30
+    if use_numpy:
+        pytest.importorskip("numpy")
+    sprite = pygame.Surface((6, 6))
+    bounds = pygame.Rect(-100_000, -100_000, 200_000, 200_000)
+    pool = BulletPool(sprite, capacity=1000, bounds=bounds, use_numpy=use_numpy)
+    for i in range(1000):
+        pool.spawn(i % 640, i % 480, vx=1, vy=-1, spin=10)
+    benchmark(pool.update)
+
+
+def test_player_mask_rebuild(benchmark, battle):
+    soul = battle.player_object
+    angles = iter(range(10**9))
+
+    def rebuild():
+        rotation_cache.clear()
+        soul.set_rotation(next(angles) % 360)
+        return soul.mask
+
+    benchmark(rebuild)
+
+
+def test_menu_container_render_paginated(benchmark):
+    menu = Menu(items=[MenuItem(f"* Item {i}") for i in range(60)])
+    container = MenuContainer(menu, x=40, y=250, width=560, height=130)
+    container.select_item(25)
+    surface = pygame.Surface((640, 480))
+    benchmark(lambda: container.render(surface))
+
+
+def test_draw_gradient(benchmark):
+    surface = pygame.Surface((640, 480))
+    benchmark(lambda: draw_gradient(surface, 25, 6, (255, 255, 255), 240))
+
+
+def test_shatter_effect_large_sprite(benchmark):
+    sprite = pygame.Surface((200, 300), pygame.SRCALPHA)
+    sprite.fill((255, 255, 255, 255))
+
+    def shatter():
+        effect = _ShatterEffect(sprite, (220, 40))
+        while not effect.finished:
+            effect.update(1000 / 30)
+
+    benchmark(shatter)
+
+
+class Tweened:
+    def __init__(self):
+        self.x = 0
+
+
+@pytest.mark.parametrize("use_numpy", [False, True], ids=["python", "numpy"])
+@pytest.mark.parametrize("count", [100, 1000])
+def test_interpolation_manager_update(benchmark, battle, use_numpy, count):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    # A manager of its own, so the game's keeps running untouched
+    game_manager = Singleton._instances.pop(InterpolationManager)
+    try:
+        manager = InterpolationManager(use_numpy=use_numpy)
+        for i in range(count):
+            manager.add_interpolation(
+                Interpolation(Tweened(), "x", 0, 1000, 10**9, i % 4, i % 2 == 0)
+            )
+        benchmark(lambda: manager.update(1000 / 30))
+    finally:
+        Singleton._instances[InterpolationManager] = game_manager
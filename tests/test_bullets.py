@@ -0,0 +1,76 @@
+import pygame
+import pytest
+
+from battle_engine import BulletPool
+from battle_engine.battle import bullets
+
+BACKENDS = [False] + ([True] if bullets.np is not None else [])
+
+
+def _pool(use_numpy, **kwargs):
+    sprite = pygame.Surface((4, 4))
+    sprite.fill((255, 255, 255))
+    bounds = pygame.Rect(0, 0, 100, 100)
+    return BulletPool(
+        sprite, bounds=bounds, cull_margin=0, use_numpy=use_numpy, **kwargs
+    )
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_integrates_velocity_and_acceleration(battle, use_numpy):
+    battle.game.delta_time = 100
+    pool = _pool(use_numpy)
+    pool.spawn(10, 10, vx=100, ay=100)
+    pool.update()
+    assert pool.columns["x"][0] == pytest.approx(20)
+    assert pool.columns["vy"][0] == pytest.approx(10)
+    assert pool.columns["y"][0] == pytest.approx(11)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_culls_out_of_bounds_and_expired(battle, use_numpy):
+    battle.game.delta_time = 100
+    pool = _pool(use_numpy)
+    pool.spawn(10, 10, vx=-1000)  # leaves the box
+    pool.spawn(20, 20, lifetime=50)  # expires
+    pool.spawn(30, 30, vx=10)
+    pool.update()
+    assert len(pool) == 1
+    assert pool.columns["x"][0] == pytest.approx(31)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_grows_past_capacity(battle, use_numpy):
+    pool = _pool(use_numpy, capacity=2)
+    for i in range(5):
+        pool.spawn(i, i)
+    assert len(pool) == 5
+    assert pool.capacity >= 5
+    assert list(pool.columns["x"][:5]) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_hits_soul_with_bullet_damage(battle, use_numpy):
+    player = battle.player_stats.player
+    player.invulnerability_time = 0
+    health = player.health
+    soul = battle.player_object
+    pool = _pool(use_numpy)
+    pool.bounds = None
+    pool.spawn(500, 500, damage=2)
+    pool.spawn(*soul.rect.topleft, damage=4)
+    assert pool.collides_with(soul)
+    pool.on_hit(soul)
+    assert player.health == health - 4
+    assert pool.damage == 1
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_renders_every_bullet(battle, use_numpy):
+    pool = _pool(use_numpy)
+    pool.spawn(0, 0)
+    pool.spawn(10, 0, rotation=90)
+    surface = pygame.Surface((20, 20))
+    pool.render(surface)
+    assert surface.get_at((1, 1)) == (255, 255, 255, 255)
+    assert surface.get_at((11, 1)) == (255, 255, 255, 255)
@@ -0,0 +1,76 @@
+import pygame
+
+from battle_engine import BattleObject
+from battle_engine.battle.collision import SpatialHash
+
+
+class Target:
+    def __init__(self, x, y, size=10):
+        self.rect = pygame.Rect(x, y, size, size)
+        self.mask = pygame.mask.Mask((size, size), fill=True)
+
+
+class Recorder(BattleObject):
+    def __init__(self, position):
+        sprite = pygame.Surface((8, 8), pygame.SRCALPHA)
+        sprite.fill((255, 255, 255, 255))
+        super().__init__(sprite, position)
+        self.hits = []
+
+    def on_hit(self, target):
+        self.hits.append(target)
+
+
+def test_query_only_returns_nearby_objects(battle):
+    grid = SpatialHash(cell_size=16)
+    near = Recorder((0, 0))
+    far = Recorder((200, 200))
+    grid.rebuild([near, far])
+    assert grid.query(pygame.Rect(4, 4, 4, 4)) == [near]
+
+
+def test_query_deduplicates_objects_spanning_cells(battle):
+    grid = SpatialHash(cell_size=4)
+    obj = Recorder((0, 0))
+    grid.rebuild([obj])
+    assert grid.query(pygame.Rect(0, 0, 8, 8)) == [obj]
+
+
+def test_rect_rejection_before_mask_test(battle):
+    obj = Recorder((0, 0))
+    assert obj.collides_with(Target(4, 4))
+    assert not obj.collides_with(Target(50, 50))
+
+
+def test_resolve_hits_several_targets(battle):
+    grid = SpatialHash()
+    left = Recorder((0, 0))
+    right = Recorder((100, 0))
+    first, second = Target(2, 2), Target(102, 2)
+    grid.resolve([left, right], [first, second])
+    assert left.hits == [first]
+    assert right.hits == [second]
+
+
+def test_destroyed_objects_are_skipped(battle):
+    grid = SpatialHash()
+    obj = Recorder((0, 0))
+    obj.destroyed = True
+    grid.resolve([obj], [Target(2, 2)])
+    assert obj.hits == []
+
+
+def test_round_damages_player(battle):
+    from battle_engine import Round
+
+    player = battle.player_stats.player
+    player.invulnerability_time = 0
+    health = player.health
+    game_round = Round(battle)
+    soul = battle.player_object
+    game_round.add_object(
+        BattleObject(pygame.Surface(soul.rect.size), soul.rect.topleft, damage=3)
+    )
+    game_round.update()
+    assert player.health == health - 3
+    assert soul.invulnerable
@@ -0,0 +1,62 @@
+import threading
+
+import pygame
+
+from battle_engine import Battle, EngineContext, Game, Player, current_context
+from battle_engine.context import default_context
+from battle_engine.game import mark_dirty
+from battle_engine.singleton import Singleton
+
+
+def test_singletons_are_scoped_to_the_active_context():
+    outer = Game()
+    with EngineContext() as context:
+        assert current_context() is context
+        inner = Game(headless=True)
+        assert inner is not outer
+        assert Game() is inner
+        assert context.get(Game) is inner
+    assert Game() is outer
+    assert current_context() is default_context
+
+
+def test_contexts_hold_independent_battles():
+    def start():
+        game = Game(headless=True, render=False)
+        battle = Battle()
+        game.set_mode(battle)
+        return battle
+
+    first = EngineContext().run(start)
+    second = EngineContext().run(start)
+    assert first.game is not second.game
+    assert first.player_stats.player is not second.player_stats.player
+    assert first.player_object is not second.player_object
+
+
+def test_resetting_a_singleton_only_affects_the_active_context():
+    player = Player()
+    with EngineContext():
+        Player()
+        Singleton._instances.pop(Player)
+        assert Player not in Singleton._instances
+    assert Player() is player
+
+
+def test_new_threads_start_in_the_default_context():
+    seen = []
+    with EngineContext():
+        thread = threading.Thread(target=lambda: seen.append(current_context()))
+        thread.start()
+        thread.join()
+    assert seen == [default_context]
+
+
+def test_mark_dirty_reaches_the_current_game():
+    with EngineContext():
+        game = Game(headless=True)
+        game.set_dirty_rect_mode(True)
+        game.render()
+        mark_dirty(pygame.Rect(1, 2, 3, 4))
+        assert game._dirty_rects == [pygame.Rect(1, 2, 3, 4)]
+    assert Game()._dirty_rects == []
@@ -0,0 +1,145 @@
+import pygame
+
+from battle_engine.drawing import (
+    GradientCache,
+    RenderBatch,
+    RotationCache,
+    draw_gradient,
+)
+
+
+def _sprite():
+    sprite = pygame.Surface((10, 20), pygame.SRCALPHA)
+    sprite.fill((255, 255, 255, 255))
+    return sprite
+
+
+def test_rotation_cache_zero_angle_returns_source():
+    cache = RotationCache()
+    sprite = _sprite()
+    rotated = cache.get(sprite, 0)
+    assert rotated.surface is sprite
+    assert rotated.offset == (0, 0)
+
+
+def test_rotation_cache_reuses_quantised_angles():
+    cache = RotationCache(angle_step=5)
+    sprite = _sprite()
+    first = cache.get(sprite, 44)
+    assert cache.get(sprite, 46) is first
+    assert first.angle == 45
+    assert cache.get(sprite, -315) is first
+
+
+def test_rotation_cache_offset_keeps_center():
+    cache = RotationCache()
+    sprite = _sprite()
+    rotated = cache.get(sprite, 90)
+    assert rotated.surface.get_size() == (20, 10)
+    rect = rotated.surface.get_rect(center=sprite.get_rect().center)
+    assert rect.topleft == rotated.offset
+
+
+def test_rotation_cache_mask_is_shared():
+    cache = RotationCache()
+    sprite = _sprite()
+    mask = cache.get(sprite, 30).mask
+    assert cache.get(sprite, 30).mask is mask
+    assert mask.count() > 0
+
+
+def test_rotation_cache_is_bounded():
+    cache = RotationCache(max_entries=2)
+    sprite = _sprite()
+    for angle in (10, 20, 30):
+        cache.get(sprite, angle)
+    assert len(cache) == 2
+
+
+def _solid(color):
+    surface = pygame.Surface((4, 4))
+    surface.fill(color)
+    return surface
+
+
+def test_render_batch_draws_layers_in_order():
+    batch = RenderBatch()
+    target = pygame.Surface((4, 4))
+    batch.add(_solid((0, 255, 0)), (0, 0), layer=1)
+    batch.add(_solid((255, 0, 0)), (0, 0), layer=0)
+    batch.flush(target)
+    assert target.get_at((0, 0)) == (0, 255, 0, 255)
+    assert len(batch) == 0
+
+
+def test_render_batch_keeps_submission_order_within_layer():
+    batch = RenderBatch()
+    target = pygame.Surface((4, 4))
+    batch.add(_solid((255, 0, 0)), (0, 0))
+    batch.add(_solid((0, 0, 255)), (0, 0))
+    batch.flush(target)
+    assert target.get_at((0, 0)) == (0, 0, 255, 255)
+
+
+def test_render_batch_sorts_by_blend_mode():
+    batch = RenderBatch()
+    target = pygame.Surface((4, 4))
+    batch.add(_solid((0, 0, 100)), (0, 0), special_flags=pygame.BLEND_ADD)
+    batch.add(_solid((100, 0, 0)), (0, 0))
+    batch.flush(target)
+    assert target.get_at((0, 0)) == (100, 0, 100, 255)
+
+
+def test_render_batch_keeps_deferred_draws_in_submission_order():
+    batch = RenderBatch()
+    target = pygame.Surface((4, 4))
+    batch.add(_solid((255, 0, 0)), (0, 0))
+    batch.defer(lambda surface: surface.fill((0, 255, 0), (0, 0, 2, 4)))
+    batch.add(_solid((0, 0, 255)), (2, 0))
+    batch.flush(target)
+    assert target.get_at((0, 0)) == (0, 255, 0, 255)
+    assert target.get_at((3, 0)) == (0, 0, 255, 255)
+
+
+def test_render_batch_only_sorts_blits_between_deferred_draws():
+    batch = RenderBatch()
+    target = pygame.Surface((4, 4))
+    batch.add(_solid((0, 0, 100)), (0, 0), special_flags=pygame.BLEND_ADD)
+    batch.defer(lambda surface: surface.fill((0, 0, 0)))
+    batch.add(_solid((100, 0, 0)), (0, 0))
+    batch.flush(target)
+    assert target.get_at((0, 0)) == (100, 0, 0, 255)
+
+
+def _stacked_gradient(surface, alpha, num_blocks, color, max_height):
+    width, height = surface.get_size()
+    block_height = max_height / num_blocks
+    for index in range(num_blocks):
+        block = pygame.Surface((width, height / 2), pygame.SRCALPHA)
+        block.fill((*color, alpha))
+        surface.blit(block, (0, height - max_height + block_height * (index + 1)))
+
+
+def test_cached_gradient_matches_stacked_blocks():
+    expected = pygame.Surface((64, 96))
+    actual = pygame.Surface((64, 96))
+    _stacked_gradient(expected, 25, 6, (255, 255, 255), 48)
+    draw_gradient(actual, 25, 6, (255, 255, 255), 48)
+    for y in range(96):
+        want, got = expected.get_at((0, y)), actual.get_at((0, y))
+        assert all(abs(want[i] - got[i]) <= 4 for i in range(3)), y
+
+
+def test_gradient_cache_reuses_surfaces():
+    cache = GradientCache()
+    first, top = cache.get((64, 96), 25, 6, (255, 255, 255), 48)
+    assert cache.get((64, 96), 25, 6, (255, 255, 255), 48) == (first, top)
+    assert cache.get((64, 96), 25, 6, (255, 255, 255), 30)[0] is not first
+
+
+def test_gradient_cache_is_bounded_by_memory():
+    cache = GradientCache()
+    cache.get((64, 96), 25, 6, (255, 255, 255), 48)
+    cache.max_bytes = cache.used_bytes
+    cache.get((64, 96), 25, 6, (255, 255, 255), 30)
+    assert len(cache) == 1
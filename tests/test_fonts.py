@@ -0,0 +1,107 @@
+import pygame
+
+from battle_engine.fonts import (
+    GlyphAtlas,
+    TextSurfaceCache,
+    draw_glyph,
+    draw_text,
+    draw_text_size,
+    font_dictionary,
+    font_metrics,
+    glyph_atlas,
+    load_font,
+    register_font,
+    text_surface_cache,
+)
+
+
+def setup_module():
+    pygame.init()
+
+
+def test_glyph_atlas_reuses_surfaces():
+    atlas = GlyphAtlas()
+    first, advance = atlas.get("A", 16, (255, 255, 255))
+    second, _ = atlas.get("A", 16, (255, 255, 255))
+    assert first is second
+    assert advance == draw_text_size("A", 16)[0]
+
+
+def test_glyph_atlas_keys_on_color():
+    atlas = GlyphAtlas()
+    white, _ = atlas.get("A", 16, (255, 255, 255))
+    red, _ = atlas.get("A", 16, (255, 0, 0))
+    assert white is not red
+    assert len(atlas) == 2
+
+
+def test_glyph_atlas_evicts_least_recently_used():
+    atlas = GlyphAtlas()
+    a, _ = atlas.get("A", 16, (255, 255, 255))
+    b, _ = atlas.get("B", 16, (255, 255, 255))
+    atlas.max_bytes = atlas.used_bytes
+    atlas.get("A", 16, (255, 255, 255))  # touch A so B is the oldest
+    c, _ = atlas.get("C", 16, (255, 255, 255))
+    assert atlas.used_bytes <= atlas.max_bytes
+    assert atlas.get("C", 16, (255, 255, 255))[0] is c
+    assert atlas.get("B", 16, (255, 255, 255))[0] is not b
+
+
+def test_draw_glyph_returns_advance():
+    surface = pygame.Surface((50, 50))
+    advance = draw_glyph(surface, "W", 16, (255, 255, 255), 0, 0)
+    assert advance == draw_text_size("W", 16)[0]
+
+
+def test_text_surface_cache_reuses_until_value_changes():
+    cache = TextSurfaceCache()
+    first, _ = cache.get("LV 1", 15, (255, 255, 255), font_name="hud")
+    assert cache.get("LV 1", 15, (255, 255, 255), font_name="hud")[0] is first
+    assert cache.get("LV 2", 15, (255, 255, 255), font_name="hud")[0] is not first
+
+
+def test_text_surface_cache_matches_draw_text():
+    cache = TextSurfaceCache()
+    for anchor, rotation in (("topleft", 0), ("center", 0), ("midright", 30)):
+        expected = pygame.Surface((200, 200))
+        actual = pygame.Surface((200, 200))
+        draw_text(expected, "Hi", 20, (255, 255, 255), 100, 100, anchor, rotation)
+        cache.draw(actual, "Hi", 20, (255, 255, 255), 100, 100, anchor, rotation)
+        assert pygame.image.tobytes(expected, "RGB") == pygame.image.tobytes(
+            actual, "RGB"
+        )
+
+
+def test_text_surface_cache_is_bounded():
+    cache = TextSurfaceCache(max_entries=2)
+    for text in ("a", "b", "c"):
+        cache.get(text, 15, (255, 255, 255))
+    assert len(cache) == 2
+
+
+def test_metrics_match_rendered_size():
+    font = load_font(font_dictionary["default"], 27)
+    for text in ("A", "Sample", "* Papyrus"):
+        assert draw_text_size(text, 27) == font.render(text, True, (0, 0, 0)).get_size()
+
+
+def test_metrics_are_cached_per_font_and_size():
+    metrics = font_metrics(27)
+    assert font_metrics(27) is metrics
+    assert font_metrics(28) is not metrics
+    assert metrics.advance("W") == metrics.size("W")[0]
+
+
+def test_register_font_drops_cached_glyphs_and_surfaces():
+    register_font("swap", font_dictionary["default"])
+    glyph, _ = glyph_atlas.get("A", 20, (255, 255, 255), "swap")
+    text, _ = text_surface_cache.get("HP", 20, (255, 255, 255), font_name="swap")
+    default_glyph, _ = glyph_atlas.get("A", 20, (255, 255, 255))
+
+    register_font("swap", font_dictionary["hud"])
+    assert glyph_atlas.get("A", 20, (255, 255, 255), "swap")[0] is not glyph
+    assert (
+        text_surface_cache.get("HP", 20, (255, 255, 255), font_name="swap")[0]
+        is not text
+    )
+    assert glyph_atlas.get("A", 20, (255, 255, 255))[0] is default_glyph
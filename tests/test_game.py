@@ -0,0 +1,175 @@
+import pygame
+import pytest
+
+from battle_engine import Battle, Game, GameMode
+from battle_engine.game import InputProvider, PressedKeys
+from battle_engine.singleton import Singleton
+
+
+class RecordingMode(GameMode):
+    def __init__(self, game):
+        super().__init__(game)
+        self.clips = []
+
+    def render(self, surface):
+        self.clips.append(surface.get_clip())
+        surface.fill((255, 255, 255))
+
+
+class CountingMode(GameMode):
+    def __init__(self, game):
+        super().__init__(game)
+        self.deltas = []
+
+    def update(self, surface):
+        self.deltas.append(self.game.delta_time)
+
+
+@pytest.fixture
+def game():
+    game = Game()
+    yield game
+    game.set_dirty_rect_mode(False)
+    game.set_fixed_timestep(False)
+
+
+def test_mark_dirty_is_ignored_by_default(game):
+    game.mark_dirty(pygame.Rect(0, 0, 10, 10))
+    assert game._dirty_rects == []
+
+
+def test_dirty_rect_mode_redraws_only_reported_areas(game):
+    mode = RecordingMode(game)
+    game.set_mode(mode)
+    game.set_dirty_rect_mode(True)
+    game.render()  # first frame is always a full redraw
+    assert mode.clips == [game.surface.get_rect()]
+
+    game.render()  # nothing changed
+    assert len(mode.clips) == 1
+
+    game.mark_dirty(pygame.Rect(10, 10, 5, 5))
+    game.mark_dirty(pygame.Rect(30, 10, 5, 5))
+    game.render()
+    assert mode.clips[-1] == pygame.Rect(10, 10, 25, 5)
+
+
+def test_mark_dirty_without_rect_forces_full_redraw(game):
+    mode = RecordingMode(game)
+    game.set_mode(mode)
+    game.set_dirty_rect_mode(True)
+    game.render()
+    game.mark_dirty()
+    game.render()
+    assert mode.clips[-1] == game.surface.get_rect()
+
+
+def test_fixed_timestep_runs_whole_steps(game):
+    mode = CountingMode(game)
+    game.set_mode(mode)
+    game.set_fixed_timestep(True, simulation_rate=50)
+    assert game.step(10) == 0
+    assert game.render_alpha == pytest.approx(0.5)
+    assert game.step(35) == 2
+    assert mode.deltas == [20, 20]
+    assert game.render_alpha == pytest.approx(0.25)
+
+
+def test_fixed_timestep_caps_catch_up(game):
+    mode = CountingMode(game)
+    game.set_mode(mode)
+    game.set_fixed_timestep(True, simulation_rate=100, max_catch_up=3)
+    assert game.step(1005) == 3
+    assert game.render_alpha == pytest.approx(0.5)
+    assert game.step(0) == 0
+
+
+def test_update_count_is_independent_of_frame_rate(game):
+    totals = []
+    for frame_time in (1000 / 30, 1000 / 60, 1000 / 144):
+        mode = CountingMode(game)
+        game.set_mode(mode)
+        game.set_fixed_timestep(True, simulation_rate=30)
+        for _ in range(round(1000 / frame_time)):
+            game.step(frame_time)
+        totals.append(len(mode.deltas))
+    assert max(totals) - min(totals) <= 1
+
+
+class ScriptedInput(InputProvider):
+    def __init__(self, keys, events):
+        self.keys = keys
+        self.events = events
+
+    def get_pressed(self, game):
+        return PressedKeys(self.keys)
+
+    def get_events(self, game):
+        events, self.events = self.events, []
+        return events
+
+
+class InputMode(CountingMode):
+    def __init__(self, game):
+        super().__init__(game)
+        self.events = []
+        self.renders = 0
+
+    def process_input(self, event):
+        self.events.append(event)
+
+    def render(self, surface):
+        self.renders += 1
+
+
+@pytest.fixture
+def headless_game():
+    previous = Singleton._instances.pop(Game, None)
+    game = Game(headless=True)
+    yield game
+    Singleton._instances[Game] = previous
+
+
+def test_headless_game_has_no_window(headless_game):
+    assert headless_game.headless
+    assert headless_game.window is None
+    headless_game.shake(5)
+    headless_game.update()
+    headless_game.toggle_fullscreen()
+    assert not headless_game.fullscreen
+
+
+def test_headless_run_steps_a_simulated_clock(headless_game):
+    mode = InputMode(headless_game)
+    headless_game.set_mode(mode)
+    headless_game.run(max_frames=4)
+    assert mode.deltas == [0, 1000 / 30, 1000 / 30, 1000 / 30]
+    assert mode.renders == 4
+
+
+def test_render_can_be_disabled(headless_game):
+    mode = InputMode(headless_game)
+    headless_game.set_mode(mode)
+    headless_game.render_enabled = False
+    headless_game.run(max_frames=3)
+    assert len(mode.deltas) == 3
+    assert mode.renders == 0
+
+
+def test_input_provider_supplies_keys_and_events(game):
+    mode = InputMode(game)
+    game.set_mode(mode)
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_z)
+    default = game.input_provider
+    game.input_provider = ScriptedInput({pygame.K_UP}, [event])
+    try:
+        game.process_events()
+    finally:
+        game.input_provider = default
+    assert mode.events == [event]
+    assert game.keys_pressed[pygame.K_UP]
+    assert not game.keys_pressed[pygame.K_DOWN]
+
+
+def test_battle_defaults_to_the_running_game(game):
+    assert Battle().game is game
@@ -14,15 +14,20 @@ def test_top_level_exports():
         "battle_engine",
         [
             "Armor",
+            "AssetLoader",
             "Battle",
             "BattleBox",
             "BattleObject",
             "BattleState",
+            "BulletPool",
             "Button",
             "CONFIRM_BUTTON",
             "DISMISS_BUTTON",
+            "Delay",
             "Enemy",
+            "EngineContext",
             "EnemyDeathState",
+            "FrameProfiler",
             "GameOverState",
             "GUIElement",
             "Game",
@@ -30,29 +35,38 @@ def test_top_level_exports():
             "HEIGHT",
             "HealingItem",
             "HitVisual",
+            "InputProvider",
             "Interpolation",
             "InterpolationManager",
             "Item",
+            "LoadingMode",
             "MENU_BUTTON",
             "Menu",
             "MenuContainer",
             "MenuItem",
+            "Parallel",
             "Player",
             "PlayerObject",
             "PlayerStats",
+            "PressedKeys",
             "ProgressiveText",
             "Round",
+            "Sequence",
             "Singleton",
             "TargetUI",
+            "TweenGroup",
             "WIDTH",
             "VictoryState",
             "Weapon",
             "asset_font_path",
             "asset_frames",
             "asset_surface",
+            "current_context",
             "draw_gradient",
             "draw_text",
             "draw_text_size",
+            "preload_assets",
+            "register_atlas",
             "register_font",
         ],
     )
@@ -62,7 +76,14 @@ def test_submodule_exports():
     _check_attrs("battle_engine.singleton", ["Singleton"])
     _check_attrs(
         "battle_engine.interpolation",
-        ["Interpolation", "InterpolationManager"],
+        [
+            "Delay",
+            "Interpolation",
+            "InterpolationManager",
+            "Parallel",
+            "Sequence",
+            "TweenGroup",
+        ],
     )
     _check_attrs("battle_engine.text", ["ProgressiveText", "StyledText"])
     _check_attrs(
@@ -85,6 +106,7 @@ def test_submodule_exports():
         ],
     )
     _check_attrs("battle_engine.battle.enemy", ["Enemy"])
+    _check_attrs("battle_engine.battle.bullets", ["BulletPool"])
     _check_attrs(
         "battle_engine.battle.objects",
         ["PlayerObject", "BattleObject"],
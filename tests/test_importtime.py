@@ -0,0 +1,57 @@
+"""Import cost: the package must stay cheap to import for data-only users."""
+
+import os
+import subprocess
+import sys
+
+# Cold-start budget for ``import battle_engine``, in microseconds
+IMPORT_BUDGET_US = 100_000
+
+
+def _run(args):
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"},
+        check=True,
+    )
+
+
+def _modules_after(statement):
+    result = _run(["-c", f"{statement}; import sys; print(*sys.modules)"])
+    return set(result.stdout.split())
+
+
+def _import_times(statement):
+    """Run ``statement`` under -X importtime and return {module: cumulative us}."""
+    result = _run(["-X", "importtime", "-c", statement])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[12:].split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+def test_package_import_is_lazy():
+    modules = _modules_after("import battle_engine")
+    assert not any(name.startswith("pygame") for name in modules)
+    assert "battle_engine.battle" not in modules
+
+
+def test_data_classes_do_not_import_pygame():
+    modules = _modules_after("from battle_engine import Item, Player")
+    assert "battle_engine.player" in modules
+    assert not any(name.startswith("pygame") for name in modules)
+
+
+def test_lazy_attributes_resolve_on_access():
+    modules = _modules_after("import battle_engine; battle_engine.Battle")
+    assert "battle_engine.battle.core" in modules
+
+
+def test_package_import_time():
+    times = _import_times("import battle_engine")
+    assert times["battle_engine"] < IMPORT_BUDGET_US
@@ -1,6 +1,19 @@
-from battle_engine.interpolation import Interpolation, InterpolationManager
+import pytest
+
+from battle_engine.interpolation import (
+    Delay,
+    Interpolation,
+    InterpolationManager,
+    Parallel,
+    Sequence,
+)
 from battle_engine.singleton import Singleton
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def setup_function():
     Singleton._instances.pop(InterpolationManager, None)
@@ -9,6 +22,7 @@ def setup_function():
 class Target:
     def __init__(self):
         self.x = 0
+        self.y = 0
 
 
 def test_linear_interpolation_start():
@@ -72,3 +86,191 @@ def test_manager_updates_and_removes():
     assert target.x == 100
     # Completed interpolations are removed
     assert len(manager.interpolations) == 0
+
+
+class CountingTarget:
+    def __init__(self):
+        self.writes = 0
+        self._x = 0
+
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self.writes += 1
+        self._x = value
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def manager(request):
+    if request.param and np is None:
+        pytest.skip("numpy is not installed")
+    return InterpolationManager(capacity=2, use_numpy=request.param)
+
+
+def test_batched_update_matches_single_tweens(manager):
+    modes = [
+        Interpolation.LINEAR,
+        Interpolation.EASE_IN,
+        Interpolation.EASE_OUT,
+        Interpolation.EASE_IN_OUT,
+    ]
+    batched, single = [], []
+    for i in range(40):
+        for targets in (batched, single):
+            targets.append(Target())
+        args = (0, 37 * i - 200, 100 + 25 * i, modes[i % 4], i % 3 == 0)
+        manager.add_interpolation(Interpolation(batched[-1], "x", *args))
+        single.append(Interpolation(single.pop(), "x", *args))
+
+    for delta in (0, 16.5, 33, 100, 250, 1000, 2000):
+        manager.update(delta)
+        for tween in single:
+            tween.update(delta)
+        assert [t.x for t in batched] == [t.obj.x for t in single]
+        assert [type(t.x) for t in batched] == [type(t.obj.x) for t in single]
+    assert len(manager) == 0
+
+
+def test_only_changed_values_are_written(manager):
+    target = CountingTarget()
+    manager.add_interpolation(Interpolation(target, "x", 0, 2, 1000))
+    for _ in range(10):
+        manager.update(100)
+    # Truncated to ints the value only changes at 0, 500 and 1000 ms
+    assert target.x == 2
+    assert target.writes == 3
+
+
+def test_cancel_by_target(manager):
+    first, second = Target(), Target()
+    first.y = 0
+    manager.add_interpolation(Interpolation(first, "x", 0, 100, 1000))
+    manager.add_interpolation(Interpolation(first, "y", 0, 100, 1000))
+    kept = Interpolation(second, "x", 0, 100, 1000)
+    manager.add_interpolation(kept)
+    manager.update(500)
+
+    assert manager.cancel(first, "y") == 1
+    assert manager.cancel(first) == 1
+    assert manager.cancel(first) == 0
+    assert manager.interpolations == [kept]
+    assert kept.active
+
+    manager.update(250)
+    assert (first.x, first.y, second.x) == (50, 50, 75)
+
+
+def test_remove_keeps_other_rows_in_place(manager):
+    targets = [Target() for _ in range(5)]
+    tweens = [Interpolation(t, "x", 0, 100, 1000) for t in targets]
+    for tween in tweens:
+        manager.add_interpolation(tween)
+    manager.remove_interpolation(tweens[1])
+    assert not tweens[1].active
+    with pytest.raises(ValueError):
+        manager.remove_interpolation(tweens[1])
+
+    manager.update(1000)
+    assert [t.x for t in targets] == [100, 0, 100, 100, 100]
+    assert len(manager) == 0
+
+
+def test_adding_a_running_tween_restarts_it(manager):
+    target = Target()
+    tween = Interpolation(target, "x", 0, 100, 1000)
+    manager.add_interpolation(tween)
+    manager.update(800)
+    manager.add_interpolation(tween)
+    manager.update(100)
+    assert target.x == 10
+    assert len(manager) == 1
+
+
+def test_new_tween_replaces_the_one_on_the_same_attribute(manager):
+    target = Target()
+    first = manager.tween(target, "x", 100, 1000)
+    manager.update(500)
+    second = manager.tween(target, "x", 0, 1000)
+    assert not first.active
+    assert manager.interpolations == [second]
+
+    manager.update(500)
+    # The second tween started from where the first one left off
+    assert target.x == 25
+
+
+def test_on_complete_runs_only_for_finished_tweens(manager):
+    done = []
+    target = Target()
+    manager.tween(target, "x", 10, 100, on_complete=lambda: done.append("first"))
+    handle = manager.tween(Target(), "x", 10, 100, on_complete=lambda: done.append(2))
+    handle.cancel()
+    manager.update(100)
+    assert done == ["first"]
+    assert target.x == 10
+
+
+def test_sequence_runs_steps_in_order(manager):
+    events = []
+    target = Target()
+    Sequence(
+        Interpolation(target, "x", 0, 10, 100),
+        lambda: events.append(("moved", target.x)),
+        Delay(200),
+        Interpolation(target, "x", None, 20, 100),
+        on_complete=lambda: events.append(("done", target.x)),
+    ).start(manager)
+
+    manager.update(100)
+    assert events == [("moved", 10)]
+    manager.update(100)
+    manager.update(100)
+    assert target.x == 10
+    manager.update(100)
+    assert events == [("moved", 10), ("done", 20)]
+    assert len(manager) == 0
+
+
+def test_parallel_finishes_with_its_longest_step(manager):
+    done = []
+    first, second = Target(), Target()
+    Sequence(
+        Parallel(
+            Interpolation(first, "x", 0, 10, 100),
+            Interpolation(second, "x", 0, 10, 300),
+            on_complete=lambda: done.append("parallel"),
+        ),
+        lambda: done.append("after"),
+    ).start(manager)
+    manager.update(100)
+    assert done == []
+    manager.update(200)
+    assert done == ["parallel", "after"]
+
+
+def test_cancelling_a_group_stops_its_tweens(manager):
+    done = []
+    target = Target()
+    group = Sequence(
+        Parallel(Interpolation(target, "x", 0, 100, 1000), Delay(500)),
+        on_complete=lambda: done.append(True),
+    ).start(manager)
+    manager.update(100)
+    group.cancel()
+    assert not group.active
+    assert len(manager) == 0
+    manager.update(1000)
+    assert target.x == 10
+    assert done == []
+
+
+def test_replacing_a_groups_tween_cancels_the_group(manager):
+    target = Target()
+    group = Sequence(Interpolation(target, "x", 0, 100, 1000), Delay(100))
+    group.start(manager)
+    manager.tween(target, "x", 0, 10)
+    assert not group.active
+    assert len(manager) == 1
@@ -0,0 +1,98 @@
+import threading
+
+import pygame
+import pytest
+
+from battle_engine import AssetLoader, Battle, Game, GameMode, LoadingMode
+from battle_engine._assets import asset_cache
+from battle_engine.sound import _sound_cache
+
+
+@pytest.fixture
+def game():
+    game = Game()
+    asset_cache.clear()
+    return game
+
+
+@pytest.fixture
+def loader():
+    loader = AssetLoader(max_workers=2)
+    yield loader
+    loader.shutdown()
+
+
+def test_poll_finishes_jobs_on_the_main_thread(loader):
+    threads = []
+    loader.submit(threading.get_ident, lambda _: threads.append(threading.get_ident()))
+    loader.wait()
+    assert threads == [threading.get_ident()]
+    assert loader.done
+    assert loader.progress == 1.0
+
+
+def test_progress_counts_polled_jobs(loader):
+    release = threading.Event()
+    loader.submit(lambda: None)
+    loader.submit(release.wait)
+    loader._pending[0][0].result()
+    loader.poll()
+    assert loader.progress == 0.5
+    assert not loader.done
+    release.set()
+    loader.wait()
+    assert loader.done
+
+
+def test_loaded_surfaces_land_in_the_cache(game, loader, tmp_path):
+    path = tmp_path / "block.png"
+    pygame.image.save(pygame.Surface((4, 2)), str(path))
+    loader.load_surface(str(path))
+    loader.wait()
+    assert len(asset_cache) == 1
+    assert asset_cache.surface(str(path)).get_size() == (4, 2)
+
+
+def test_failed_loads_are_raised_from_poll(game, loader, tmp_path):
+    loader.load_surface(str(tmp_path / "missing.png"))
+    with pytest.raises(FileNotFoundError):
+        loader.wait()
+
+
+def test_engine_sounds_are_decoded_ahead(game, loader):
+    pygame.mixer.init()
+    _sound_cache.clear()
+    loader.load_engine_assets()
+    loader.wait()
+    assert len(_sound_cache) > 0
+
+
+def test_loading_mode_switches_when_done(game, loader):
+    created = []
+
+    class Target(GameMode):
+        def __init__(self):
+            super().__init__(game)
+            created.append(self)
+
+    release = threading.Event()
+    loader.submit(release.wait)
+    mode = LoadingMode(game, loader, Target)
+    game.set_mode(mode)
+    game.update()
+    game.render()
+    assert game.game_mode is mode
+    assert not created
+
+    release.set()
+    loader._pending[0][0].result()
+    game.update()
+    assert created and game.game_mode is created[0]
+
+
+def test_loading_mode_into_battle(game, loader):
+    loader.load_engine_assets()
+    loader.wait()
+    game.set_mode(LoadingMode(game, loader, lambda: Battle(game)))
+    game.update()
+    assert isinstance(game.game_mode, Battle)
@@ -0,0 +1,57 @@
+import pygame
+
+from battle_engine import BattleObject
+
+
+def _sprite():
+    sprite = pygame.Surface((10, 60), pygame.SRCALPHA)
+    sprite.fill((255, 255, 255, 255))
+    return sprite
+
+
+def test_mask_is_reused_until_rotation_changes(battle):
+    obj = BattleObject(_sprite())
+    mask = obj.mask
+    obj.update()
+    assert obj.mask is mask
+
+    obj.rotation = 90
+    assert obj.mask is not mask
+    assert obj.mask.get_size() == (60, 10)
+
+
+def test_mask_follows_sprite_changes(battle):
+    obj = BattleObject(_sprite())
+    mask = obj.mask
+    obj.sprite = pygame.Surface((4, 4))
+    assert obj.mask is not mask
+    assert obj.mask.get_size() == (4, 4)
+
+
+def test_objects_with_same_sprite_share_mask(battle):
+    sprite = _sprite()
+    first = BattleObject(sprite, rotation=45)
+    second = BattleObject(sprite, position=(100, 100), rotation=45)
+    assert first.mask is second.mask
+
+
+def test_assigned_mask_is_kept(battle):
+    obj = BattleObject(_sprite())
+    custom = pygame.mask.Mask((1, 1), fill=True)
+    obj.mask = custom
+    assert obj.mask is custom
+
+
+def test_player_render_interpolates_between_updates(battle):
+    game = battle.game
+    soul = battle.player_object
+    soul.set_position(100, 100)
+    game.set_fixed_timestep(True)
+    try:
+        soul.rect.x = 110
+        game.render_alpha = 0.5
+        assert soul.get_render_position() == (105, 100)
+        assert soul.get_drawn_rect().width >= soul.sprite.get_width() + 10
+    finally:
+        game.set_fixed_timestep(False)
+    assert soul.get_render_position() == (110, 100)
@@ -0,0 +1,76 @@
+import pygame
+
+from battle_engine import BattleObject, Round
+from battle_engine.battle.pool import ObjectPool
+
+SPRITE = pygame.Surface((4, 4))
+
+
+class Bullet(BattleObject):
+    def __init__(self, position=(0, 0)):
+        super().__init__(SPRITE, position)
+
+
+def test_acquire_recycles_released_objects(battle):
+    pool = ObjectPool()
+    bullet = pool.acquire(Bullet, (1, 2))
+    bullet.destroy()
+    pool.release(bullet)
+    assert pool.free_count(Bullet) == 1
+
+    recycled = pool.acquire(Bullet, (5, 6))
+    assert recycled is bullet
+    assert recycled.position == (5, 6)
+    assert not recycled.destroyed
+    assert pool.free_count(Bullet) == 0
+
+
+def test_free_list_is_bounded(battle):
+    pool = ObjectPool(max_free=1)
+    pool.release(pool.acquire(Bullet))
+    pool.release(pool.acquire(Bullet))
+    assert pool.free_count(Bullet) == 1
+
+
+def test_only_acquired_objects_are_recycled(battle):
+    pool = ObjectPool()
+    pool.release(Bullet())
+    pool.release(ObjectPool().acquire(Bullet))
+    assert pool.free_count(Bullet) == 0
+
+
+def test_round_compacts_and_recycles(battle):
+    game_round = Round(battle)
+    first = game_round.spawn(Bullet, (0, 0))
+    second = game_round.spawn(Bullet, (10, 0))
+    third = game_round.spawn(Bullet, (20, 0))
+    objects = game_round.objects
+
+    first.destroy()
+    game_round.compact_objects()
+    assert game_round.objects is objects
+    assert sorted(map(id, objects)) == sorted([id(second), id(third)])
+    assert game_round.spawn(Bullet, (30, 0)) is first
+
+
+def test_release_objects_empties_round(battle):
+    game_round = Round(battle)
+    game_round.spawn(Bullet)
+    game_round.release_objects()
+    assert game_round.objects == []
+    assert battle.object_pool.free_count(Bullet) == 1
+
+
+def test_added_objects_are_not_reused_by_spawn(battle):
+    game_round = Round(battle)
+    added = Bullet((5, 5))
+    game_round.add_object(added)
+    added.destroy()
+    game_round.compact_objects()
+    kept = Bullet()
+    game_round.add_object(kept)
+    game_round.release_objects()
+
+    spawned = [game_round.spawn(Bullet) for _ in range(2)]
+    assert all(obj is not added and obj is not kept for obj in spawned)
+    assert added.position == (5, 5)
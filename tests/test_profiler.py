@@ -0,0 +1,121 @@
+import csv
+import json
+
+import pygame
+import pytest
+
+from battle_engine import Game
+from battle_engine.game import InputProvider, PressedKeys
+from battle_engine.profiler import FrameProfiler
+
+
+@pytest.fixture(autouse=True)
+def _profiling_off():
+    yield
+    Game().set_profiling(False)
+
+
+def _frames(game, count):
+    for _ in range(count):
+        game.process_events()
+        game.update()
+        game.render()
+
+
+def test_laps_accumulate_per_frame():
+    profiler = FrameProfiler(capacity=3)
+    for frame in range(5):
+        profiler.begin_frame()
+        profiler.lap("update", 0)
+        start = profiler.lap("update.text", 0)
+        profiler.lap("update.text", start)
+    profiler.end_frame()
+
+    assert len(profiler) == 3
+    assert profiler.sections == ["update", "update.text"]
+    frame = profiler.frames[-1]
+    # Only top-level sections add up to the frame
+    assert frame["frame"] == frame["update"]
+    assert frame["update.text"] > frame["update"]
+
+
+def test_percentiles_and_summary():
+    profiler = FrameProfiler()
+    for ms in range(1, 101):
+        profiler.frames.append({"frame": ms * 1_000_000, "update": ms * 1_000_000})
+    profiler.sections.append("update")
+    assert profiler.percentile("update", 50) == 50
+    assert profiler.percentile("update", 95) == 95
+    summary = profiler.summary()
+    assert summary["frame"]["max"] == 100
+    assert summary["update"]["mean"] == 50.5
+
+
+def test_disabled_by_default(battle):
+    _frames(battle.game, 2)
+    assert battle.game.profiler is None
+
+
+def test_game_and_battle_sections_are_recorded(battle, tmp_path):
+    game = battle.game
+    game.set_profiling(True, capacity=10)
+    _frames(game, 12)
+    game.profiler.end_frame()
+
+    assert len(game.profiler) == 10
+    for section in (
+        "events",
+        "update",
+        "update.interpolations",
+        "update.state",
+        "update.enemies",
+        "update.objects",
+        "render",
+        "render.background",
+        "render.ui",
+        "render.present",
+    ):
+        assert section in game.profiler.sections
+
+    game.profiler.dump_json(tmp_path / "frames.json")
+    data = json.loads((tmp_path / "frames.json").read_text())
+    assert len(data["frames"]) == 10
+    assert data["summary"]["frame"]["p95"] > 0
+
+    game.profiler.dump_csv(tmp_path / "frames.csv")
+    with (tmp_path / "frames.csv").open() as file:
+        rows = list(csv.reader(file))
+    assert rows[0][:2] == ["index", "frame"]
+    assert len(rows) == 11
+
+
+class DebugKey(InputProvider):
+    def __init__(self):
+        self.pressed = False
+
+    def get_pressed(self, game):
+        return PressedKeys()
+
+    def get_events(self, game):
+        if not self.pressed:
+            return []
+        self.pressed = False
+        return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3, mod=0)]
+
+
+def test_debug_key_toggles_the_overlay(battle):
+    game = battle.game
+    default = game.input_provider
+    game.input_provider = key = DebugKey()
+    try:
+        key.pressed = True
+        _frames(game, 3)
+        assert game.profiler_overlay is not None
+        assert "render.overlay" in game.profiler.sections
+
+        key.pressed = True
+        _frames(game, 1)
+        assert game.profiler is None
+        assert game.profiler_overlay is None
+    finally:
+        game.input_provider = default
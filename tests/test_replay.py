@@ -0,0 +1,186 @@
+import random
+
+import pygame
+import pytest
+
+from battle_engine import Battle, BattleObject, Enemy, EngineContext, Game, Round
+from battle_engine.battle.states import DefendingState
+from battle_engine.battle.ui import TargetUI
+from battle_engine.game import InputProvider, PressedKeys
+from battle_engine.replay import (
+    InputRecorder,
+    ReplayLog,
+    ReplayTick,
+    battle_digest,
+    replay,
+)
+
+BLOCK = pygame.Surface((20, 20))
+
+
+class Block(BattleObject):
+    def __init__(self, position=(0, 0)):
+        super().__init__(BLOCK, position, damage=3)
+
+
+class ScatterRound(Round):
+    """Spawns a block at a seeded random spot in the box every 300 ms."""
+
+    def __init__(self, battle):
+        super().__init__(battle)
+        self.next_spawn = 0
+
+    def round_update(self):
+        if self.time >= self.next_spawn:
+            box = self.battle.battle_box.get_internal_rect()
+            x = self.battle.rng.randint(box.left, box.right - 20)
+            y = self.battle.rng.randint(box.top, box.bottom - 20)
+            self.spawn(Block, (x, y))
+            self.next_spawn += 300
+        for obj in self.objects[:-3]:
+            obj.destroy()
+
+
+class DefendingBattle(Battle):
+    def post_init(self):
+        self.current_round = ScatterRound(self)
+        self.gameStateStack = [DefendingState()]
+
+
+class AttackBattle(Battle):
+    """Starts in the button menu, facing one enemy the player can attack."""
+
+    def post_init(self):
+        self.enemies = [Enemy(pygame.Surface((60, 60)), position=(290, 40), health=50)]
+
+    def select_next_round(self):
+        return ScatterRound(self)
+
+
+class MashingInput(InputProvider):
+    """Holds and taps random keys, driven by its own seeded RNG."""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.keys = set()
+
+    def get_pressed(self, game):
+        if self.rng.random() < 0.2:
+            directions = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+            self.keys = set(self.rng.sample(directions, self.rng.choice((0, 1, 2))))
+        return PressedKeys(self.keys | {pygame.K_F1})
+
+    def get_events(self, game):
+        pygame.event.pump()
+        if self.rng.random() < 0.1:
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_z, mod=0)]
+        return []
+
+
+class ScriptedInput(InputProvider):
+    """Taps the confirm key on the given frames."""
+
+    def __init__(self, frames):
+        self.frames = set(frames)
+        self.frame = 0
+
+    def get_pressed(self, game):
+        self.frame += 1
+        return PressedKeys()
+
+    def get_events(self, game):
+        pygame.event.pump()
+        if self.frame in self.frames:
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_z, mod=0)]
+        return []
+
+
+def _record(battle_class, frames, seed, source=None):
+    """Play a battle with varying frame times; return its log and digest."""
+    with EngineContext():
+        game = Game(headless=True, render=True)
+        battle = battle_class(game, seed=seed)
+        game.set_mode(battle)
+        recorder = InputRecorder(
+            battle, source if source is not None else MashingInput(seed)
+        )
+        game.input_provider = recorder
+        frame_rng = random.Random(seed)
+        for _ in range(frames):
+            game.process_events()
+            game.update()
+            game.render()
+            game.delta_time = frame_rng.choice((33.0, 33.0, 34.0, 50.5))
+        return recorder.log, battle_digest(battle)
+
+
+def test_replay_reproduces_the_recorded_battle():
+    log, digest = _record(DefendingBattle, 300, seed=7)
+    loaded = ReplayLog.from_bytes(log.to_bytes())
+    assert battle_digest(replay(loaded, DefendingBattle)) == digest
+
+
+def test_replay_reproduces_an_attack():
+    # FIGHT, pick the enemy, strike, then defend the round that follows
+    log, digest = _record(AttackBattle, 260, seed=5, source=ScriptedInput([5, 10, 20]))
+    battle = replay(log, AttackBattle)
+    assert battle.enemies[0].health < 50
+    assert isinstance(battle.gameStateStack[-1], DefendingState)
+    assert not any(isinstance(obj, TargetUI) for obj in battle.objects)
+    assert battle_digest(battle) == digest
+
+
+def test_different_seeds_diverge():
+    log, digest = _record(DefendingBattle, 200, seed=1)
+    log.seed = 2
+    assert battle_digest(replay(log, DefendingBattle)) != digest
+
+
+def test_log_round_trips_through_a_file(tmp_path):
+    log = ReplayLog(
+        42,
+        ticks=[
+            ReplayTick(33.0, 0b101, [(0, 4)]),
+            ReplayTick(33.0, 0b101),
+            ReplayTick(16.5, 0, [(1, 4), (0, 0)]),
+        ],
+    )
+    path = tmp_path / "battle.replay"
+    log.save(path)
+    loaded = ReplayLog.load(path)
+    assert loaded.seed == 42
+    assert loaded.keys == log.keys
+    assert [(t.delta, t.held, t.events) for t in loaded.ticks] == [
+        (33.0, 0b101, [(0, 4)]),
+        (33.0, 0b101, []),
+        (16.5, 0, [(1, 4), (0, 0)]),
+    ]
+
+
+def test_unchanged_ticks_cost_one_byte():
+    log = ReplayLog(0, ticks=[ReplayTick(33.0)])
+    one = len(log.to_bytes())
+    log.ticks.extend(ReplayTick(33.0) for _ in range(99))
+    assert len(log.to_bytes()) == one + 99
+
+
+def test_ticks_hold_hundreds_of_events():
+    events = [(i % 2, i % 4) for i in range(300)]
+    log = ReplayLog(0, ticks=[ReplayTick(33.0, events=events)])
+    assert ReplayLog.from_bytes(log.to_bytes()).ticks[0].events == events
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        ReplayLog.from_bytes(b"RIFF" + bytes(20))
+
+
+def test_fixed_timestep_games_cannot_be_recorded():
+    with EngineContext():
+        game = Game(headless=True, render=False)
+        battle = DefendingBattle(game)
+        game.set_mode(battle)
+        game.input_provider = InputRecorder(battle)
+        game.set_fixed_timestep(True)
+        with pytest.raises(ValueError):
+            game.process_events()
@@ -0,0 +1,102 @@
+import random
+
+import pygame
+import pytest
+
+from battle_engine import BattleObject, Game, Round
+from battle_engine.sim import (
+    SimJob,
+    SimStats,
+    idle_policy,
+    random_walk_policy,
+    run_once,
+    simulate,
+)
+
+BLOCK = pygame.Surface((20, 20))
+
+
+class Block(BattleObject):
+    spawned_at: float = 0
+
+    def __init__(self, position=(0, 0)):
+        super().__init__(BLOCK, position, damage=10)
+
+
+class CenterRound(Round):
+    """Drops a block on the box center every second for five seconds."""
+
+    def __init__(self, battle):
+        super().__init__(battle)
+        self.next_spawn = 0
+
+    def round_update(self):
+        if self.time >= self.next_spawn and self.next_spawn < 5000:
+            center = self.battle.battle_box.get_internal_rect().center
+            self.spawn(Block, (center[0] - 10, center[1] - 10))
+            self.next_spawn += 1000
+        for obj in self.objects:
+            if isinstance(obj, Block) and self.time - obj.spawned_at > 500:
+                obj.destroy()
+        if self.time >= 5000:
+            self.end_turn()
+
+    def spawn(self, cls, *args, **kwargs):
+        obj = super().spawn(cls, *args, **kwargs)
+        obj.spawned_at = self.time
+        return obj
+
+
+@pytest.fixture(autouse=True)
+def game():
+    return Game()
+
+
+def test_idle_soul_takes_every_hit():
+    result = run_once(SimJob(0, CenterRound, idle_policy))
+    assert result.hits == 5
+    assert result.damage_taken == 50
+    assert result.time_to_death is None
+    assert result.duration >= 5000
+    assert result.frame_cost_ns > 0
+
+
+def test_runs_are_reproducible_per_seed():
+    first = run_once(SimJob(3, CenterRound, random_walk_policy))
+    run_once(SimJob(4, CenterRound, random_walk_policy))
+    again = run_once(SimJob(3, CenterRound, random_walk_policy))
+    assert first.to_dict() | {"frame_cost_ns": 0} == again.to_dict() | {
+        "frame_cost_ns": 0
+    }
+
+
+def test_runs_leave_the_global_rng_alone():
+    random.seed(99)
+    expected = random.random()
+    random.seed(99)
+    run_once(SimJob(3, CenterRound, random_walk_policy))
+    assert random.random() == expected
+
+
+def test_max_time_stops_a_round():
+    result = run_once(SimJob(0, CenterRound, idle_policy, max_time=1500))
+    assert result.duration < 1600
+    assert result.hits == 2
+
+
+def test_stats_aggregate_results():
+    stats = simulate(CenterRound, runs=3, policy=idle_policy, workers=1)
+    assert isinstance(stats, SimStats)
+    assert stats.runs == 3
+    assert stats.mean_damage == 50
+    assert stats.mean_hits == 5
+    assert stats.death_rate == 0
+    assert stats.to_dict()["frames"] == stats.frames
+
+
+def test_process_pool_matches_inline_runs():
+    inline = simulate(CenterRound, runs=4, policy=random_walk_policy, workers=1)
+    pooled = simulate(CenterRound, runs=4, policy=random_walk_policy, workers=2)
+    assert [r.damage_taken for r in pooled.results] == [
+        r.damage_taken for r in inline.results
+    ]
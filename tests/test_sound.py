@@ -2,6 +2,7 @@ import pygame
 import pytest
 
 # Reset singleton between tests
+from battle_engine import EngineContext
 from battle_engine.singleton import Singleton
 from battle_engine.sound import _DEFAULT_SOUNDS, SoundCategory, SoundManager
 
@@ -105,3 +106,24 @@ class TestVolume:
         assert sm.get_volume(SoundCategory.SFX) == pytest.approx(0.3)
         assert sm.get_volume(SoundCategory.TEXT) == pytest.approx(0.7)
         assert sm.get_volume(SoundCategory.MUSIC) == 1.0
+
+    def test_volume_does_not_leak_between_contexts(self):
+        quiet = SoundManager()
+        quiet.set_volume(SoundCategory.SFX, 0.2)
+        with EngineContext():
+            loud = SoundManager()
+            assert loud._sounds["select"] is quiet._sounds["select"]
+            channel = loud.play("select")
+        if channel is not None:
+            assert channel.get_volume() == pytest.approx(1.0)
+        assert quiet._sounds["select"].get_volume() == pytest.approx(1.0)
+        channel = quiet.play("select")
+        if channel is not None:
+            assert channel.get_volume() == pytest.approx(0.2, abs=0.01)
+
+
+class TestLoading:
+    def test_register_from_missing_file_raises(self, tmp_path):
+        sm = SoundManager()
+        with pytest.raises(FileNotFoundError):
+            sm.register_from_file("typo", str(tmp_path / "missing.wav"))
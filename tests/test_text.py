@@ -63,3 +63,58 @@ def test_progressive_text_asterisk():
     pt = ProgressiveText(target_text="[asterisk]Hello")
     assert pt.asterisk is True
     assert pt.target_text_clean == "Hello"
+
+
+def test_progressive_text_skip_strips_commands():
+    pt = ProgressiveText(target_text="[color:FF0000]Red")
+    pt.skip()
+    assert pt.current_text == "Red"
+
+
+def test_layout_wraps_before_unrevealed_word():
+    pt = ProgressiveText(target_text="Hi everybody", max_width=40, tick_length=1)
+    surface = pygame.Surface((200, 200))
+    pt.update()
+    pt.update()
+    pt.update()  # "Hi " revealed, the long word is not
+    pt.draw(surface)
+    wrapped_y = pt.layout[3].y
+    assert wrapped_y > pt.layout[0].y
+
+    pt.skip()
+    pt.draw(surface)
+    assert pt.layout[3].y == wrapped_y
+
+
+def test_layout_is_reused_between_draws():
+    pt = ProgressiveText(target_text="Hello", tick_length=1)
+    surface = pygame.Surface((200, 200))
+    pt.draw(surface)
+    layout = pt.layout
+    pt.update()
+    pt.draw(surface)
+    assert pt.layout is layout
+    assert pt._canvas_chars == 1
+
+
+def test_layout_follows_newlines():
+    pt = ProgressiveText(target_text="A\nB", max_width=500)
+    pt.skip()
+    pt.draw(pygame.Surface((200, 200)))
+    assert pt.layout[2].x == 0
+    assert pt.layout[2].y > pt.layout[0].y
+
+
+def test_set_text_with_new_commands_lays_out_again():
+    pt = ProgressiveText(target_text="[color:FF0000]Hi", tick_length=1)
+    surface = pygame.Surface((200, 200))
+    pt.skip()
+    pt.draw(surface)
+
+    pt.set_text("[color:0000FF]Hi")
+    pt.skip()
+    surface.fill((0, 0, 0))
+    pt.draw(surface)
+    assert [glyph.color for glyph in pt.layout] == [(0, 0, 255), (0, 0, 255)]
+    colors = {surface.get_at((x, y))[:3] for x in range(40) for y in range(40)}
+    assert (255, 0, 0) not in colors